@@ -39,6 +39,7 @@ from pathlib import Path
 from os.path import isfile
 from multiprocessing.managers import ListProxy, DictProxy
 import logging
+import threading
 
 # Third Party Imports
 import yaml
@@ -266,6 +267,10 @@ def verify_experiment_config(manager, configuration):
         "fine_step_size": 5,
         "fine_selected": True,
         "robust_fit": False,
+        "adaptive_search": False,
+        "metric": "DCT Shannon Entropy",
+        "metric_roi": 1.0,
+        "metric_binning": 1,
     }
     if (
         "AutoFocusParameters" not in configuration["experiment"]
@@ -298,6 +303,13 @@ def verify_experiment_config(manager, configuration):
                         device_ref,
                         autofocus_sample_setting,
                     )
+                # settings saved by older versions miss the newer parameters
+                device_ref_setting = autofocus_setting_dict[microscope_name][device][
+                    device_ref
+                ]
+                for k, v in autofocus_sample_setting.items():
+                    if k not in device_ref_setting.keys():
+                        device_ref_setting[k] = v
 
     # remove non-consistent autofocus parameter
     for microscope_name in autofocus_setting_dict.keys():
@@ -521,6 +533,7 @@ def verify_experiment_config(manager, configuration):
         "experiment_duration": 1.03,
         "is_multiposition": False,
         "multiposition_count": 1,
+        "multiposition_route": "Table Order",
         "selected_channels": 0,
         "stack_z_origin": 0,
         "stack_focus_origin": 0,
@@ -677,6 +690,12 @@ def verify_experiment_config(manager, configuration):
         multipositions.append([10.0, 10.0, 10.0, 10.0, 10.0])
 
     microscope_setting_dict["multiposition_count"] = len(multipositions)
+    if microscope_setting_dict["multiposition_route"] not in [
+        "Table Order",
+        "Serpentine",
+        "Shortest Path",
+    ]:
+        microscope_setting_dict["multiposition_route"] = "Table Order"
 
 
 def verify_waveform_constants(manager, configuration):
@@ -1119,3 +1138,132 @@ def verify_configuration(manager, configuration):
         "gui",
         {"channels": {"count": channel_count}},
     )
+
+
+class ConfigurationSnapshot:
+    """Read-through cache of the shared configuration.
+
+    Every lookup in a nested DictProxy is a round trip to the manager process.
+    The snapshot copies the requested subtree to plain dicts and lists once, and
+    serves later lookups of that subtree, or anything below it, from the copy.
+
+    Writes made directly to the configuration are not seen by the snapshot. Code in
+    the model process should write through set(), which invalidates the affected
+    subtree. Writes made by the controller process cannot be intercepted, so the
+    model drops the whole snapshot before the commands that follow them. Values
+    returned by get() are shared and must not be modified.
+    """
+
+    def __init__(self, configuration):
+        """Initialize the snapshot.
+
+        Parameters
+        ----------
+        configuration : dict or DictProxy
+            Shared configuration.
+        """
+        #: dict or DictProxy: Shared configuration.
+        self.configuration = configuration
+
+        #: int: Number of proxy round trips made to fill the snapshot.
+        self.proxy_calls = 0
+
+        #: int: Number of proxy round trips avoided by reading the snapshot.
+        self.saved_calls = 0
+
+        # dict: Copied subtrees, keyed by their path in the configuration.
+        self._subtrees = {}
+
+        # threading.Lock: Protects the subtrees and the counters.
+        self._lock = threading.Lock()
+
+    def get(self, *keys):
+        """Get a value of the configuration.
+
+        Parameters
+        ----------
+        *keys : str or int
+            Path to the value, e.g. "experiment", "CameraParameters", "Mesoscale".
+
+        Returns
+        -------
+        value : Any
+            The value, with nested proxies copied to plain dicts and lists.
+        """
+        with self._lock:
+            for depth in range(len(keys), 0, -1):
+                if keys[:depth] in self._subtrees:
+                    value = self._subtrees[keys[:depth]]
+                    for key in keys[depth:]:
+                        value = value[key]
+                    self.saved_calls += len(keys)
+                    return value
+
+            value = self.configuration
+            for key in keys:
+                value = value[key]
+                self.proxy_calls += 1
+            value = self._copy(value)
+            self._subtrees[keys] = value
+            return value
+
+    def set(self, keys, value):
+        """Write a value to the configuration and invalidate its subtree.
+
+        Parameters
+        ----------
+        keys : tuple
+            Path to the value.
+        value : Any
+            New value.
+        """
+        target = self.configuration
+        for key in keys[:-1]:
+            target = target[key]
+        target[keys[-1]] = value
+        self.invalidate(*keys)
+
+    def invalidate(self, *keys):
+        """Drop the copies of a subtree.
+
+        Parameters
+        ----------
+        *keys : str or int
+            Path to the subtree. Without keys, the whole snapshot is dropped.
+        """
+        with self._lock:
+            for path in list(self._subtrees):
+                if path[: len(keys)] == keys or keys[: len(path)] == path:
+                    del self._subtrees[path]
+
+    def reset_statistics(self):
+        """Reset the proxy call counters."""
+        with self._lock:
+            self.proxy_calls = 0
+            self.saved_calls = 0
+
+    def _copy(self, value):
+        """Copy nested proxies to plain dicts and lists.
+
+        Parameters
+        ----------
+        value : Any
+            Value to copy.
+
+        Returns
+        -------
+        value : Any
+            Plain copy of the value.
+        """
+        if isinstance(value, DictProxy):
+            value = value.copy()
+            self.proxy_calls += 1
+        elif isinstance(value, ListProxy):
+            value = value[:]
+            self.proxy_calls += 1
+
+        if isinstance(value, dict):
+            return {k: self._copy(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._copy(v) for v in value]
+        return value
@@ -69,6 +69,7 @@ from navigate.controller.sub_controllers import (
 )
 
 from navigate.controller.thread_pool import SynchronizedThreadPool
+from navigate.controller.display_scheduler import DisplayScheduler
 
 # Local Model Imports
 from navigate.model.model import Model
@@ -85,7 +86,11 @@ from navigate.config.config import (
 )
 from navigate.tools.file_functions import create_save_path, save_yaml_file, get_ram_info
 from navigate.tools.common_dict_tools import update_stage_dict
-from navigate.tools.multipos_table_tools import update_table
+from navigate.tools.multipos_table_tools import (
+    get_stage_velocities,
+    plan_route,
+    update_table,
+)
 from navigate.tools.common_functions import combine_funcs
 
 # Logger Setup
@@ -227,6 +232,9 @@ class Controller:
         #: dict: Event listeners for the controller.
         self.event_listeners = {}
 
+        #: dict: Frame accounting reported by the model after each acquisition.
+        self.frame_report = {}
+
         #: AcquireBarController: Acquire Bar Sub-Controller.
         self.acquire_bar_controller = AcquireBarController(self.view.acquire_bar, self)
 
@@ -254,6 +262,27 @@ class Controller:
             self.view.camera_waveform.mip_tab, self
         )
 
+        #: DisplayScheduler: Passes acquired frames to the display sub-controllers.
+        self.display_scheduler = DisplayScheduler()
+        self.display_scheduler.register(
+            "camera_view",
+            self.camera_view_controller.try_to_display_image,
+            rate=30,
+            skip=self.camera_view_controller.skip_images,
+        )
+        self.display_scheduler.register(
+            "mip",
+            self.mip_setting_controller.try_to_display_image,
+            rate=5,
+            update=lambda image: self.mip_setting_controller.try_to_display_image(
+                image, display=False
+            ),
+            skip=self.mip_setting_controller.skip_images,
+        )
+        self.display_scheduler.register(
+            "histogram", self.histogram_controller.populate_histogram, rate=5
+        )
+
         #: CameraSettingController: Camera Settings Tab Sub-Controller.
         self.camera_setting_controller = CameraSettingController(
             self.view.settings.camera_settings_tab, self
@@ -653,7 +682,10 @@ class Controller:
                 dict = {'x': value, 'y': value, 'z': value, 'theta': value, 'f': value}
             """
             self.threads_pool.createThread(
-                "model", self.move_stage, args=({args[1] + "_abs": args[0]},)
+                "model",
+                self.move_stage,
+                args=({args[1] + "_abs": args[0]},),
+                coalesce=("stage", args[1]),
             )
 
         elif command == "stop_stage":
@@ -765,8 +797,12 @@ class Controller:
                 'remote_focus_constants'][self.resolution][self.mag]
                 }
             """
+            # the model reads the new settings from the configuration, so only
+            # the latest pending update of each kind needs to run.
             self.threads_pool.createThread(
-                "model", lambda: self.model.run_command("update_setting", *args)
+                "model",
+                lambda: self.model.run_command("update_setting", *args),
+                coalesce=("update_setting", args[0]),
             )
 
         elif command == "stage_limits":
@@ -834,6 +870,17 @@ class Controller:
             saving_settings = self.configuration["experiment"]["Saving"]
             file_directory = create_save_path(saving_settings)
 
+            # Record the order the positions are visited (and saved) in.
+            microscope_state = self.configuration["experiment"]["MicroscopeState"]
+            if microscope_state["is_multiposition"]:
+                microscope_state["multiposition_order"] = plan_route(
+                    self.configuration["experiment"]["MultiPositions"],
+                    microscope_state["multiposition_route"],
+                    get_stage_velocities(
+                        self.configuration, microscope_state["microscope_name"]
+                    ),
+                )
+
             # Save the experiment.yaml file.
             save_yaml_file(
                 file_directory=file_directory,
@@ -1071,6 +1118,9 @@ class Controller:
         start_time = time.time()
         self.camera_setting_controller.update_readout_time()
 
+        # In live mode, only the most recent frame is worth displaying.
+        self.display_scheduler.start(self.data_buffer, coalesce=(mode == "live"))
+
         while True:
             if self.stop_acquisition_flag:
                 break
@@ -1090,17 +1140,9 @@ class Controller:
                     f"{image_id}"
                 )
                 self.execute("stop_acquire")
-
-            # Display the image and update the histogram
-            self.camera_view_controller.try_to_display_image(
-                image=self.data_buffer[image_id]
-            )
-            self.mip_setting_controller.try_to_display_image(
-                image=self.data_buffer[image_id]
-            )
-            self.histogram_controller.populate_histogram(
-                image=self.data_buffer[image_id]
-            )
+            else:
+                # Display the image and update the histogram
+                self.display_scheduler.submit(image_id)
             images_received += 1
 
             # Update progress bar.
@@ -1131,6 +1173,7 @@ class Controller:
             # the duration of time remaining.
             self.acquire_bar_controller.framerate = frames_per_second
 
+        self.display_scheduler.stop()
         logger.info(
             f"Navigate Controller - Captured {images_received}, " f"{mode} Images"
         )
@@ -1339,6 +1382,20 @@ class Controller:
                 )
                 self.channels_tab_controller.is_multiposition_val.set(True)
 
+            elif event == "frame_report":
+                # Frame accounting of the acquisition that just finished
+                self.frame_report = value
+                logger.info(f"Frame report: {value}")
+                if value.get("dropped_frames", 0) > 0:
+                    messagebox.showwarning(
+                        title="Navigate",
+                        message=f"{value['dropped_frames']} frame(s) were "
+                        f"overwritten in the data buffer before they could be "
+                        f"processed. Consider increasing the data buffer size "
+                        f"(currently {value['buffer_size']} frames, maximum "
+                        f"backlog {value['max_backlog']}).",
+                    )
+
             elif event == "stop":
                 # Stop the software
                 break
@@ -0,0 +1,237 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+# Standard Library Imports
+import threading
+import time
+from collections import deque
+import logging
+import traceback
+
+# Third Party Imports
+
+# Local Imports
+
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
+#: int: Maximum number of frames waiting to be dispatched.
+MAX_PENDING_FRAMES = 16
+
+
+class DisplayScheduler:
+    """Forward frames from the model to the display sub-controllers.
+
+    The controller's receive loop only hands frame ids to the scheduler, which
+    calls the registered consumers from its own thread. Each consumer has its own
+    refresh rate. When frames arrive faster than they can be shown, the scheduler
+    coalesces to the newest frame and drops the stale ones, so the receive loop
+    never falls behind the model. At most ``MAX_PENDING_FRAMES`` frames (one
+    while coalescing) wait to be dispatched, older frames are dropped.
+
+    Consumers that need to see every frame (e.g. to keep track of the channel and
+    slice of each image, or to accumulate a projection) can pass an update
+    function, which receives the frames that arrive between two refreshes. While
+    coalescing, stale frames are dropped for every consumer and the skip function
+    is told how many frames were missed instead.
+    """
+
+    def __init__(self):
+        """Initialize the DisplayScheduler."""
+        #: list: Registered consumers.
+        self.consumers = []
+
+        #: list or SharedNDArray: Data buffer holding the frames.
+        self.data_buffer = None
+
+        #: bool: Coalesce to the newest frame for every consumer.
+        self.coalesce = False
+
+        #: collections.deque: Frame ids waiting to be dispatched.
+        self.pending = deque(maxlen=MAX_PENDING_FRAMES)
+
+        #: int: Number of frames that were never dispatched.
+        self.dropped_frames = 0
+
+        #: threading.Condition: Signals new frames or a stop request.
+        self.condition = threading.Condition()
+
+        #: threading.Thread: Thread dispatching frames to the consumers.
+        self.dispatch_thread = None
+
+        #: bool: Has the scheduler been asked to stop?
+        self.stopping = False
+
+    def register(self, name, callback, rate=None, update=None, skip=None):
+        """Register a display consumer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the consumer.
+        callback : callable
+            Function called with the image to display.
+        rate : float
+            Maximum number of calls per second. None means unlimited.
+        update : callable
+            Function called with the frames that arrive between two refreshes,
+            unless the scheduler is coalescing.
+        skip : callable
+            Function called with the number of frames the consumer missed, before
+            it receives the next image.
+        """
+        self.consumers.append(
+            {
+                "name": name,
+                "callback": callback,
+                "interval": 1.0 / rate if rate else 0,
+                "update": update,
+                "skip": skip,
+                "last_time": 0,
+                "skipped": 0,
+            }
+        )
+
+    def set_rate(self, name, rate):
+        """Change the refresh rate of a consumer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the consumer.
+        rate : float
+            Maximum number of calls per second. None means unlimited.
+        """
+        for consumer in self.consumers:
+            if consumer["name"] == name:
+                consumer["interval"] = 1.0 / rate if rate else 0
+
+    def start(self, data_buffer, coalesce=False):
+        """Start dispatching frames for a new acquisition.
+
+        Parameters
+        ----------
+        data_buffer : list or SharedNDArray
+            Data buffer holding the frames.
+        coalesce : bool
+            Only dispatch the newest frame, e.g. in live mode.
+        """
+        self.stop()
+        self.data_buffer = data_buffer
+        self.coalesce = coalesce
+        self.pending = deque(maxlen=1 if coalesce else MAX_PENDING_FRAMES)
+        self.dropped_frames = 0
+        self.stopping = False
+        for consumer in self.consumers:
+            consumer["last_time"] = 0
+            consumer["skipped"] = 0
+        self.dispatch_thread = threading.Thread(
+            target=self.run, name="Display Scheduler", daemon=True
+        )
+        self.dispatch_thread.start()
+
+    def submit(self, image_id):
+        """Hand a new frame over to the scheduler without blocking.
+
+        Parameters
+        ----------
+        image_id : int
+            Index into the data buffer.
+        """
+        with self.condition:
+            if len(self.pending) == self.pending.maxlen:
+                # the oldest frame is dropped by the append below
+                self.dropped_frames += 1
+                for consumer in self.consumers:
+                    consumer["skipped"] += 1
+            self.pending.append(image_id)
+            self.condition.notify()
+
+    def stop(self):
+        """Dispatch the remaining frames and stop the scheduler thread."""
+        if self.dispatch_thread is None:
+            return
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        if threading.current_thread() is not self.dispatch_thread:
+            self.dispatch_thread.join()
+        self.dispatch_thread = None
+        if self.dropped_frames:
+            logger.info(f"Display skipped {self.dropped_frames} frames.")
+
+    def run(self):
+        """Dispatch frames until the scheduler is stopped."""
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    break
+                image_id = self.pending.popleft()
+                last_frame = self.stopping and not self.pending
+            self.dispatch(image_id, force=last_frame)
+
+    def dispatch(self, image_id, force=False):
+        """Call each consumer whose refresh interval has elapsed.
+
+        Parameters
+        ----------
+        image_id : int
+            Index into the data buffer.
+        force : bool
+            Ignore the refresh interval, e.g. for the last frame of an acquisition.
+        """
+        image = self.data_buffer[image_id]
+        now = time.perf_counter()
+        for consumer in self.consumers:
+            due = force or now - consumer["last_time"] >= consumer["interval"]
+            update = consumer["update"] if not self.coalesce else None
+            if not due and update is None:
+                consumer["skipped"] += 1
+                continue
+            try:
+                if consumer["skipped"] and consumer["skip"] is not None:
+                    consumer["skip"](consumer["skipped"])
+                consumer["skipped"] = 0
+                if due:
+                    consumer["last_time"] = now
+                    consumer["callback"](image)
+                else:
+                    update(image)
+            except Exception as e:
+                logger.debug(
+                    f"Display Scheduler - {consumer['name']} failed: {e}, "
+                    f"{traceback.format_exc()}"
+                )
@@ -154,6 +154,12 @@ class BaseViewController(GUIController, ABaseViewController):
         #: str: The colormap for the image.
         self.colormap = plt.get_cmap("gist_gray")
 
+        #: numpy.ndarray: RGB lookup table for integer images.
+        self.lut = None
+
+        #: tuple: Colormap, min and max counts the lookup table was built for.
+        self.lut_key = None
+
         #: str: The mode of the camera view controller.
         self.mode = "stop"
 
@@ -444,17 +450,66 @@ class BaseViewController(GUIController, ABaseViewController):
         """
         pass
 
+    def get_lut(self):
+        """Get the RGB lookup table for the current colormap and min/max counts.
+
+        The table maps every 16-bit intensity to an 8-bit RGB value, including the
+        intensity scaling. Saturated pixels are mapped to red. The table is only
+        rebuilt when the colormap or the min/max counts change.
+
+        Returns
+        -------
+        lut : numpy.ndarray
+            Lookup table of shape (2**16, 3) and type uint8.
+        """
+        min_counts, max_counts = int(self.min_counts), int(self.max_counts)
+        key = (self.colormap.name, min_counts, max_counts)
+        if key != self.lut_key:
+            number_of_colors = self.colormap.N
+            colors = self.colormap(np.arange(number_of_colors))[:, :3]
+            colors = (colors * (2**self.bit_depth - 1)).astype(np.uint8)
+            span = max(max_counts - min_counts, 1)
+            index = (np.arange(2**16, dtype=np.int64) - min_counts) * number_of_colors
+            index = np.clip(index // span, 0, number_of_colors - 1)
+            lut = colors[index]
+            lut[-1] = [2**self.bit_depth - 1, 0, 0]
+            self.lut, self.lut_key = lut, key
+        return self.lut
+
+    @staticmethod
+    def use_lut(image):
+        """Can the image be rendered with the integer lookup table?
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            Image data.
+
+        Returns
+        -------
+        bool
+            True for 8- and 16-bit unsigned integer images.
+        """
+        return image.dtype in (np.uint8, np.uint16)
+
     def apply_lut(self, image):
         """Applies a LUT to an image.
 
         Red is reserved for saturated pixels.
         self.color_values = ['gray', 'gradient', 'rainbow']
 
+        Integer images are mapped through a precomputed lookup table that already
+        accounts for the min/max counts. Other images are expected to be scaled
+        to [0, 1].
+
         Parameters
         ----------
         image : numpy.ndarray
             Image data.
         """
+        if self.use_lut(image):
+            return self.get_lut()[image]
+
         image = self.colormap(image)
 
         # Convert RGBA to RGB Image.
@@ -511,6 +566,18 @@ class BaseViewController(GUIController, ABaseViewController):
         self.image_count += 1
         return channel_idx, slice_idx
 
+    def skip_images(self, number_of_images):
+        """Account for images that were acquired but never passed to the display.
+
+        Parameters
+        ----------
+        number_of_images : int
+            Number of skipped images.
+        """
+        self.image_count += number_of_images
+        if self.total_images_per_volume > 0:
+            self.image_count %= self.total_images_per_volume
+
     def initialize_non_live_display(self, microscope_state, camera_parameters):
         """Initialize the non-live display.
 
@@ -779,6 +846,10 @@ class BaseViewController(GUIController, ABaseViewController):
         saturated_pixels : numpy.ndarray
             Saturated pixels in the image.
         """
+        if self.use_lut(image):
+            # Saturated pixels are highlighted by the lookup table.
+            self.saturated_pixels = None
+            return
         saturation_value = 2**16 - 1
         self.saturated_pixels = image[image > saturation_value]
 
@@ -804,6 +875,9 @@ class BaseViewController(GUIController, ABaseViewController):
     def scale_image_intensity(self, image):
         """Scale the data to the min/max counts, and adjust bit-depth.
 
+        Integer images are returned unchanged, as the scaling is part of the lookup
+        table used in apply_lut.
+
         Parameters
         ----------
         image : numpy.ndarray
@@ -820,6 +894,9 @@ class BaseViewController(GUIController, ABaseViewController):
         else:
             self.update_min_max_counts()
 
+        if self.use_lut(image):
+            return image
+
         if self.max_counts != self.min_counts:
             image = (image - self.min_counts) / (self.max_counts - self.min_counts)
             image[image < 0] = 0
@@ -857,8 +934,13 @@ class BaseViewController(GUIController, ABaseViewController):
                 crosshair_x = -1
             if crosshair_y < 0 or crosshair_y >= self.canvas_height:
                 crosshair_y = -1
-            image[:, int(crosshair_x)] = 1
-            image[int(crosshair_y), :] = 1
+            if self.use_lut(image):
+                # Brightest value of the lookup table that is not saturated.
+                value = min(max(int(self.max_counts), 0), 2**16 - 2)
+            else:
+                value = 1
+            image[:, int(crosshair_x)] = value
+            image[int(crosshair_y), :] = value
 
         return image
 
@@ -889,7 +971,7 @@ class BaseViewController(GUIController, ABaseViewController):
         image : Image
             A PIL Image
         """
-        return Image.fromarray(image.astype(np.uint8))
+        return Image.fromarray(image.astype(np.uint8, copy=False))
 
     def populate_image(self, image):
         """Converts image to an ImageTk.PhotoImage and populates the Tk Canvas
@@ -920,15 +1002,15 @@ class BaseViewController(GUIController, ABaseViewController):
     def process_image(self):
         """Process the image to be displayed.
 
-        Applies digital zoom, detects saturation, down-samples the image, scales the
+        Applies digital zoom, down-samples the image, detects saturation, scales the
         image intensity, adds a crosshair, applies the lookup table, and populates the
-        image.
+        image. All steps after the digital zoom work on the down-sampled image.
         """
         if self.image is None:
             return
         image = self.digital_zoom()
-        self.detect_saturation(image)
         image = self.down_sample_image(image)
+        self.detect_saturation(image)
         image = self.transpose_image(image)
         image = self.scale_image_intensity(image)
         image = self.add_crosshair(image)
@@ -1312,14 +1394,14 @@ class CameraViewController(BaseViewController):
         """
         if self.display_mask_flag and self.display_state == "Live":
             self.ilastik_mask_ready_lock.acquire()
-            temp_img1 = image.astype(np.uint8)
+            temp_img1 = image.astype(np.uint8, copy=False)
             img1 = Image.fromarray(temp_img1)
 
             temp_img2 = cv2.resize(self.ilastik_seg_mask, temp_img1.shape[:2])
             img2 = Image.fromarray(temp_img2)
             temp_img = Image.blend(img1, img2, 0.2)
         else:
-            temp_img = Image.fromarray(image.astype(np.uint8))
+            temp_img = Image.fromarray(image.astype(np.uint8, copy=False))
         return temp_img
 
     def display_image(self, image):
@@ -1580,13 +1662,15 @@ class MIPViewController(BaseViewController):
         self.prepare_mip_view()
         self.update_perspective()
 
-    def try_to_display_image(self, image):
+    def try_to_display_image(self, image, display=True):
         """Display the image.
 
         Parameters
         ----------
         image : numpy.ndarray
             Image data.
+        display : bool
+            Render the projections. Otherwise, only accumulate them.
         """
         channel_idx, slice_idx = self.identify_channel_index_and_slice()
 
@@ -1602,7 +1686,8 @@ class MIPViewController(BaseViewController):
             self.zx_mip[channel_idx, slice_idx], np.max(image, axis=1)
         )
 
-        super().try_to_display_image(image)
+        if display:
+            super().try_to_display_image(image)
 
     def display_image(self, image):
         """Display an image using the LUT specified in the View.
@@ -47,6 +47,7 @@ from navigate.controller.sub_controllers.channels_settings import (
 from navigate.controller.sub_controllers.tiling import (
     TilingWizardController,
 )
+from navigate.tools.multipos_table_tools import ROUTES
 
 # View Imports that are not called on startup
 from navigate.view.popups.tiling_wizard_popup2 import TilingWizardPopup
@@ -159,6 +160,12 @@ class ChannelsTabController(GUIController):
         self.is_multiposition_val = self.view.multipoint_frame.on_off
         self.is_multiposition_val.trace_add("write", self.toggle_multiposition)
 
+        #: tk.StringVar: The order the multi-position table is visited in.
+        self.multiposition_route_val = self.view.multipoint_frame.inputs[
+            "route"
+        ].get_variable()
+        self.multiposition_route_val.trace_add("write", self.update_route_setting)
+
         self.view.multipoint_frame.buttons["tiling"].configure(
             command=self.launch_tiling_wizard
         )
@@ -180,6 +187,7 @@ class ChannelsTabController(GUIController):
         config = self.parent_controller.configuration_controller
 
         self.stack_acq_widgets["cycling"].widget["values"] = ["Per Z", "Per Stack"]
+        self.view.multipoint_frame.inputs["route"].widget["values"] = ROUTES
         self.filter_wheel_delay = [
             config.filter_wheel_setting_dict[i]["filter_wheel_delay"]
             for i in range(config.number_of_filter_wheels)
@@ -208,6 +216,9 @@ class ChannelsTabController(GUIController):
         self.is_multiposition_val.set(self.microscope_state_dict["is_multiposition"])
         self.is_multiposition_cache = self.is_multiposition
         self.toggle_multiposition()
+        self.multiposition_route_val.set(
+            self.microscope_state_dict["multiposition_route"]
+        )
 
         # validate
         self.view.stack_timepoint_frame.stack_pause_spinbox.trigger_focusout_validation()
@@ -713,13 +724,30 @@ class ChannelsTabController(GUIController):
         self.update_timepoint_setting()
         self.show_verbose_info("Multi-position:", self.is_multiposition)
 
+    def update_route_setting(self, *args):
+        """Update the order the multi-position table is visited in.
+
+        Parameters
+        ----------
+        args : tuple
+            Arguments of the variable trace, unused.
+        """
+        self.microscope_state_dict[
+            "multiposition_route"
+        ] = self.multiposition_route_val.get()
+        self.show_verbose_info(
+            "Multi-position visiting order:", self.multiposition_route_val.get()
+        )
+
     def disable_multiposition_btn(self):
         """Disable multiposition button"""
         self.view.multipoint_frame.save_check.config(state="disabled")
+        self.view.multipoint_frame.inputs["route"].widget["state"] = "disabled"
 
     def enable_multiposition_btn(self):
         """Enable multiposition button"""
         self.view.multipoint_frame.save_check.config(state="normal")
+        self.view.multipoint_frame.inputs["route"].widget["state"] = "readonly"
 
     def launch_waveform_parameters(self):
         """Launches waveform parameters popup."""
@@ -41,6 +41,7 @@ from matplotlib.ticker import FuncFormatter
 # Local Imports
 from navigate.model.concurrency.concurrency_tools import SharedNDArray
 from navigate.view.main_window_content.display_notebook import HistogramFrame
+from navigate.tools.image import binned_histogram
 
 
 # Logger Setup
@@ -76,6 +77,7 @@ class HistogramController:
 
         # Event Bindings
         widget = self.histogram.figure_canvas.get_tk_widget()
+        self.histogram.figure_canvas.mpl_connect("draw_event", self.on_draw)
 
         if platform.system() == "Darwin":
             widget.bind("<Button-2>", self.histogram_popup)
@@ -120,10 +122,23 @@ class HistogramController:
         #: bool: Logarithmic Y-axis
         self.log_y = True
 
+        #: int: Number of histogram bins
+        self.bins = 20
+
+        #: StepPatch: The histogram artist, updated in place for each image.
+        self.stairs = None
+
+        #: Any: Figure background without the histogram, used for blitting.
+        self.background = None
+
+        #: tuple: Current x-axis limits.
+        self.x_limits = None
+
     def update_scale(self) -> None:
         """Update the scale of the histogram"""
         self.log_x = self.x_axis_var.get() == "log"
         self.log_y = self.y_axis_var.get() == "log"
+        self.background = None
 
     def histogram_popup(self, event: tk.Event) -> None:
         """Histogram popup menu
@@ -141,28 +156,74 @@ class HistogramController:
     def populate_histogram(self, image: SharedNDArray) -> None:
         """Populate the histogram.
 
+        The counts are computed with a binned reduction of the image. The axes
+        are only redrawn when the x-axis limits or the scales change. Otherwise,
+        the histogram artist is updated in place and blitted onto the cached
+        background.
+
         Parameters
         ----------
         image : SharedNDArray
             Image data
         """
-        data = image.flatten()
-        self.ax.cla()
-        counts, _, _ = self.ax.hist(data, bins=20, color="black", rwidth=1)
+        counts, edges = binned_histogram(image, bins=self.bins)
+        centers = (edges[:-1] + edges[1:]) / 2
+        mean = np.average(centers, weights=counts)
+        std = np.sqrt(np.average((centers - mean) ** 2, weights=counts))
 
-        x_maximum = np.max(data) + np.std(data)
-        x_minimum = np.min(data) - np.std(data)
+        x_maximum = edges[-1] + std
+        x_minimum = edges[0] - std
         x_minimum = 1 if x_minimum < 1 else x_minimum
-        y_maximum = 10**6
 
-        self.ax.set_xlim(x_minimum, x_maximum)
-        self.ax.set_ylim(1, y_maximum)
+        if self.stairs is None:
+            self.stairs = self.ax.stairs(
+                counts, edges, fill=True, color="black", baseline=1, animated=True
+            )
+        else:
+            self.stairs.set_data(counts, edges)
+
+        if self.background is None or self.limits_changed(x_minimum, x_maximum):
+            # Leave some room, so that small changes between images can be blitted.
+            margin = 0.1 * (x_maximum - x_minimum)
+            self.x_limits = (max(1, x_minimum - margin), x_maximum + margin)
+            self.draw_axes()
+        else:
+            canvas = self.histogram.figure_canvas
+            canvas.restore_region(self.background)
+            self.ax.draw_artist(self.stairs)
+            canvas.blit(self.ax.bbox)
+
+    def limits_changed(self, x_minimum: float, x_maximum: float) -> bool:
+        """Do the x-axis limits need to be updated?
 
-        if self.log_y:
-            self.ax.set_yscale("log")
+        The limits are kept as long as the histogram fits and covers at least
+        half of the axis, so that the axes are not redrawn for every image.
 
-        if self.log_x:
-            self.ax.set_xscale("log")
+        Parameters
+        ----------
+        x_minimum : float
+            Lower limit for the current image
+        x_maximum : float
+            Upper limit for the current image
+
+        Returns
+        -------
+        bool
+            True if the axes need to be redrawn.
+        """
+        if self.x_limits is None:
+            return True
+        current_minimum, current_maximum = self.x_limits
+        if x_minimum < current_minimum or x_maximum > current_maximum:
+            return True
+        return (x_maximum - x_minimum) < 0.5 * (current_maximum - current_minimum)
+
+    def draw_axes(self) -> None:
+        """Redraw the axes and cache the background for blitting."""
+        self.ax.set_xscale("log" if self.log_x else "linear")
+        self.ax.set_yscale("log" if self.log_y else "linear")
+        self.ax.set_xlim(*self.x_limits)
+        self.ax.set_ylim(1, 10**6)
 
         self.ax.yaxis.set_major_formatter(
             FuncFormatter(
@@ -171,3 +232,16 @@ class HistogramController:
         )
 
         self.histogram.figure_canvas.draw()
+
+    def on_draw(self, event: Any) -> None:
+        """Cache the background and draw the histogram after a full redraw.
+
+        Parameters
+        ----------
+        event : matplotlib.backend_bases.DrawEvent
+            Draw event
+        """
+        canvas = self.histogram.figure_canvas
+        self.background = canvas.copy_from_bbox(self.histogram.figure.bbox)
+        if self.stairs is not None:
+            self.ax.draw_artist(self.stairs)
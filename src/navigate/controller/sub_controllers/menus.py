@@ -787,7 +787,8 @@ class MenuController(GUIController):
     def load_images(self):
         """Load images from a file."""
         filenames = filedialog.askopenfilenames(
-            defaultextension=".tif", filetypes=[("tiff files", "*.tif *.tiff")]
+            defaultextension=".tif",
+            filetypes=[("image files", "*.tif *.tiff *.h5"), ("all files", "*.*")],
         )
         if not filenames:
             return
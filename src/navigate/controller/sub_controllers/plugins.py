@@ -46,7 +46,11 @@ from navigate.tools.common_functions import combine_funcs
 from navigate.tools.decorators import AcquisitionMode
 from navigate.controller.sub_controllers.gui import GUIController
 from navigate.view.popups.plugins_popup import PluginsPopup
-from navigate.plugins.plugin_manager import PluginFileManager, PluginPackageManager
+from navigate.plugins.plugin_manager import (
+    PluginFileManager,
+    PluginPackageManager,
+    PluginManifest,
+)
 
 
 class PluginsController:
@@ -88,17 +92,24 @@ class PluginsController:
         plugins_config_path = os.path.join(
             get_navigate_path(), "config", "plugins_config.yml"
         )
+        plugin_manifest = PluginManifest(
+            os.path.join(get_navigate_path(), "config", "plugins_manifest.yml")
+        )
         plugin_file_manager = PluginFileManager(plugins_path, plugins_config_path)
-        self.load_plugins_through_manager(plugin_file_manager)
-        self.load_plugins_through_manager(PluginPackageManager)
+        self.load_plugins_through_manager(plugin_file_manager, plugin_manifest)
+        self.load_plugins_through_manager(PluginPackageManager, plugin_manifest)
+        plugin_manifest.save()
 
-    def load_plugins_through_manager(self, plugin_manager):
+    def load_plugins_through_manager(self, plugin_manager, plugin_manifest=None):
         """Load plugins through plugin manager
 
         Parameters
         ----------
         plugin_manager : object
             PluginManager object
+        plugin_manifest : PluginManifest
+            Cache of the plugins. Plugin modules listed in it are imported on
+            first use.
         """
         plugins = plugin_manager.get_plugins()
 
@@ -110,6 +121,10 @@ class PluginsController:
                 continue
             plugin_display_name = plugin_config.get("name", plugin_name)
 
+            manifest = None
+            if plugin_manifest is not None:
+                manifest = plugin_manifest.get_plugin(plugin_manager, plugin_ref)
+
             plugin_frame = plugin_manager.load_view(plugin_ref, plugin_display_name)
             plugin_controller = plugin_manager.load_controller(
                 plugin_ref, plugin_display_name
@@ -127,7 +142,7 @@ class PluginsController:
                 else:
                     self.build_tab_window(plugin_name, plugin_frame, plugin_controller)
             # feature
-            plugin_manager.load_features(plugin_ref)
+            plugin_manager.load_features(plugin_ref, manifest=manifest)
 
             # acquisition mode
             acquisition_modes = plugin_config.get("acquisition_modes", [])
@@ -135,6 +150,7 @@ class PluginsController:
                 plugin_ref,
                 acquisition_modes,
                 self.register_acquisition_mode,
+                manifest=manifest,
             )
 
     def build_tab_window(self, plugin_name, frame, controller):
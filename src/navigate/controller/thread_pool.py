@@ -49,100 +49,177 @@ p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
 
-class SelfLockThread(threading.Thread):
-    """A custom thread class with self-locking capabilities.
+class ThreadTask:
+    """A call waiting for, or running on, the worker of a resource.
 
-    This class extends the functionality of the Python threading.Thread class by
-    providing the ability to lock and unlock the thread explicitly. It is useful
-    in scenarios where thread synchronization and control are required.
-
-    Note
-    ----
-    - This class provides additional control over thread execution using the
-      `wait()` and `unlock()` methods.
-    - It allows checking whether the thread is currently locked using the `isLocked()`
-      method.
+    The task takes the place of the thread that used to be created for every
+    command, and keeps its `join()` and `is_alive()` methods, so callers can wait
+    for the command to finish.
     """
 
     def __init__(
-        self, group=None, target=None, name=None, args=(), kwargs={}, *, daemon=None
+        self,
+        name,
+        target,
+        args=(),
+        kwargs={},
+        *,
+        callback=None,
+        cbArgs=(),
+        cbKargs={},
+        coalesce=None,
     ):
-        """Initialize the SelfLockThread.
+        """Initialize the ThreadTask.
 
         Parameters
         ----------
-        group : ThreadGroup, optional
-            The thread group, by default None
-        target : callable, optional
-            The target function of the thread, by default None
-        name : str, optional
-            The name of the thread, by default None
+        name : str
+            The name of the resource.
+        target : callable
+            The target function of the task.
         args : tuple, optional
             The arguments of the target function, by default ()
         kwargs : dict, optional
             The keyword arguments of the target function, by default {}
-        daemon : bool, optional
-            Whether the thread is daemon, by default None
+        callback : callable, optional
+            The callback function of the task, by default None
+        cbArgs : tuple, optional
+            The arguments of the callback function, by default ()
+        cbKargs : dict, optional
+            The keyword arguments of the callback function, by default {}
+        coalesce : hashable, optional
+            The coalescing key of the task, by default None
         """
-        super().__init__(group, target, name, args, kwargs, daemon=daemon)
-        #: threading.Lock: The lock of the thread.
-        self.selfLock = threading.Lock()
-        # lock itself
-        self.selfLock.acquire()
+        #: str: The name of the resource.
+        self.name = name
+        #: callable: The target function of the task.
+        self.target = target
+        #: tuple: The arguments of the target function.
+        self.args = args
+        #: dict: The keyword arguments of the target function.
+        self.kwargs = kwargs
+        #: callable: The callback function of the task.
+        self.callback = callback
+        #: tuple: The arguments of the callback function.
+        self.cbArgs = cbArgs
+        #: dict: The keyword arguments of the callback function.
+        self.cbKargs = cbKargs
+        #: hashable: A pending task with the same key is replaced by this one.
+        self.coalesce = coalesce
+        #: bool: Whether the task was dropped before it ran.
+        self.cancelled = False
+        #: threading.Event: Set when the task has finished or was dropped.
+        self.finished = threading.Event()
 
     def run(self):
-        """Run the thread."""
-        self._kwargs["thread"] = self
-        if self._target:
+        """Run the target function, then the callback."""
+        if callable(self.target):
             try:
-                self._target(*self._args, **self._kwargs)
+                self.target(*self.args, **self.kwargs)
             except Exception as e:
                 print(
-                    f"{self.name} thread ended because of exception!: {e}",
+                    threading.current_thread().name,
+                    "thread exception happened!",
+                    e,
                     traceback.format_exc(),
                 )
                 logger.debug(
-                    f"{self.name} thread ended because of exception!: {e}",
-                    traceback.format_exc(),
+                    f"{threading.current_thread().name} thread exception happened! "
+                    f"{e} {traceback.format_exc()}"
                 )
-            finally:
-                pass
+        if self.callback:
+            self.callback(*self.cbArgs, **self.cbKargs)
 
-    def wait(self):
-        """Wait for the thread to finish."""
-        self.selfLock.acquire()
+    def cancel(self):
+        """Drop the task without running it."""
+        self.cancelled = True
+        self.finished.set()
 
-    def unlock(self):
-        """Unlock the thread."""
-        if self.selfLock.locked():
-            self.selfLock.release()
+    def join(self, timeout=None):
+        """Wait for the task to finish.
 
-    def isLocked(self):
-        """Check if the thread is locked.
+        Parameters
+        ----------
+        timeout : float, optional
+            The timeout in seconds, by default None
+        """
+        self.finished.wait(timeout)
+
+    def is_alive(self):
+        """Check if the task is still waiting or running.
 
         Returns
         -------
         bool
-            Whether the thread is locked.
+            Whether the task is still waiting or running.
         """
-        return self.selfLock.locked()
+        return not self.finished.is_set()
+
+
+class ResourceWorker(threading.Thread):
+    """A persistent thread that runs the tasks of one resource in order.
+
+    Note
+    ----
+    - The tasks are kept in the waitlist of the resource. The first task in the
+      waitlist is the one running.
+    - The worker sleeps while the waitlist is empty.
+    """
+
+    def __init__(self, resourceName, resource):
+        """Initialize the ResourceWorker.
+
+        Parameters
+        ----------
+        resourceName : str
+            The name of the resource.
+        resource : ThreadWaitlist
+            The waitlist of the resource.
+        """
+        super().__init__(name=resourceName, daemon=True)
+        #: ThreadWaitlist: The waitlist of the resource.
+        self.resource = resource
+
+    def run(self):
+        """Run the tasks of the resource."""
+        while True:
+            with self.resource as resource:
+                while not resource.waitlist:
+                    resource.condition.wait()
+                task = resource.waitlist[0]
+            try:
+                task.run()
+            except Exception as e:
+                print(
+                    f"{self.name} callback ended because of exception!: {e}",
+                    traceback.format_exc(),
+                )
+                logger.debug(
+                    f"{self.name} callback ended because of exception!: {e} "
+                    f"{traceback.format_exc()}"
+                )
+            finally:
+                with self.resource as resource:
+                    if resource.waitlist and resource.waitlist[0] is task:
+                        resource.waitlist.popleft()
+                task.finished.set()
 
 
 class SynchronizedThreadPool:
     """
     A custom thread pool with synchronization and control features.
 
-    This class provides a thread pool for managing threads associated with different
-    resources. It allows registering resources, creating threads, wrapping thread tasks,
-    removing threads, and other thread-related operations with explicit control and
-    synchronization.
+    This class provides a thread pool for managing tasks associated with different
+    resources. Each resource has one persistent worker thread, which runs the tasks
+    of the resource one at a time, in the order they were created.
 
     Note
     ----
-    - This class provides explicit control over thread creation, removal,
+    - This class provides explicit control over task creation, removal,
     and synchronization.
-    - It allows managing threads associated with different resources efficiently.
-    - The `clear` method moves threads to the `toDeleteList` for later deletion.
+    - Tasks created with a coalescing key replace the pending task of the same
+    resource with the same key, e.g. when a stage is jogged faster than it moves.
+    - The `clear` method drops the pending tasks and stops the running ones.
 
     """
 
@@ -151,8 +228,8 @@ class SynchronizedThreadPool:
 
         #: dict: The resources of the thread pool.
         self.resources = {}
-        #: dict: The toDeleteList of the thread pool.
-        self.toDeleteList = {}
+        #: dict: The workers of the resources.
+        self.workers = {}
 
     def registerResource(self, resourceName):
         """Register a resource to the pool.
@@ -175,151 +252,112 @@ class SynchronizedThreadPool:
         callback=None,
         cbArgs=(),
         cbKargs={},
+        coalesce=None,
     ):
-        """Create a thread and add it to the waitlist of the resource.
+        """Create a task and add it to the waitlist of the resource.
 
         Parameters
         ----------
         resourceName : str
             The name of the resource.
         target : callable
-            The target function of the thread.
+            The target function of the task.
         args : tuple, optional
             The arguments of the target function, by default ()
         kwargs : dict, optional
             The keyword arguments of the target function, by default {}
         callback : callable, optional
-            The callback function of the thread, by default None
+            The callback function of the task, by default None
         cbArgs : tuple, optional
             The arguments of the callback function, by default ()
         cbKargs : dict, optional
             The keyword arguments of the callback function, by default {}
+        coalesce : hashable, optional
+            If given, a task of the resource with the same key that has not
+            started yet is dropped, and this task takes its place in the
+            waitlist, by default None
 
         Returns
         -------
-        SelfLockThread
-            The created thread.
+        ThreadTask
+            The created task.
         """
 
         if resourceName not in self.resources:
             self.registerResource(resourceName)
-        task = self.threadTaskWrapping(
-            resourceName, target, callback=callback, cbArgs=cbArgs, cbKargs=cbKargs
+        task = ThreadTask(
+            resourceName,
+            target,
+            args,
+            kwargs,
+            callback=callback,
+            cbArgs=cbArgs,
+            cbKargs=cbKargs,
+            coalesce=coalesce,
         )
-        taskThread = SelfLockThread(None, task, resourceName, args, kwargs, daemon=True)
-        taskThread.start()
-        return taskThread
-
-    def threadTaskWrapping(
-        self, resourceName, target, *, callback=None, cbArgs=(), cbKargs={}
-    ):
-        """Wrap the target function of the thread.
+        with self.resources[resourceName] as resource:
+            replaced = None
+            if coalesce is not None:
+                # the first task is running and can't be replaced
+                for i in range(1, len(resource.waitlist)):
+                    if resource.waitlist[i].coalesce == coalesce:
+                        replaced = resource.waitlist[i]
+                        resource.waitlist[i] = task
+                        break
+            if replaced is None:
+                resource.waitlist.append(task)
+            resource.condition.notify()
+            self.startWorker(resourceName)
+        if replaced is not None:
+            replaced.cancel()
+        return task
+
+    def startWorker(self, resourceName):
+        """Start the worker of the resource if it is not running.
 
         Parameters
         ----------
         resourceName : str
             The name of the resource.
-        target : callable
-            The target function of the thread.
-        callback : callable, optional
-            The callback function of the thread, by default None
-        cbArgs : tuple, optional
-            The arguments of the callback function, by default ()
-        cbKargs : dict, optional
-            The keyword arguments of the callback function, by default {}
-
-        Returns
-        -------
-        callable
-            The wrapped target function.
         """
-
-        def func(*args, **kwargs):
-            thread = kwargs.get("thread", None)
-            if not thread:
-                return
-            del kwargs["thread"]
-            # add thread to the waitlist of the resource
-            with self.resources[resourceName] as resource:
-                resource.waitlist.append(thread)
-                if len(resource.waitlist) == 1:
-                    thread.unlock()
-            # wait for it's turn
-            thread.wait()
-            # run itself
-            if callable(target):
-                try:
-                    target(*args, **kwargs)
-                except Exception as e:
-                    print(
-                        threading.current_thread().name,
-                        "thread exception happened!",
-                        e,
-                        traceback.format_exc(),
-                    )
-                    logger.debug(
-                        threading.current_thread().name,
-                        "thread exception happened!",
-                        e,
-                        traceback.format_exc(),
-                    )
-
-            # wake up next thread if any
-            with self.resources[resourceName] as resource:
-                resource.waitlist.popleft()
-                if len(resource.waitlist) > 0:
-                    resource.waitlist[0].unlock()
-            # run callback
-            if callback:
-                callback(*cbArgs, **cbKargs)
-
-        return func
+        worker = self.workers.get(resourceName, None)
+        if worker is None or not worker.is_alive():
+            worker = ResourceWorker(resourceName, self.resources[resourceName])
+            self.workers[resourceName] = worker
+            worker.start()
 
     def removeThread(self, resourceName, taskThread):
-        """Remove a thread from the waitlist of the resource.
+        """Remove a task from the waitlist of the resource.
 
         Parameters
         ----------
         resourceName : str
             The name of the resource.
-        taskThread : SelfLockThread
-            The thread to remove.
+        taskThread : ThreadTask
+            The task to remove.
 
         Returns
         -------
         bool
-            Whether the thread is removed.
+            Whether the task is removed.
         """
-        # can only remove waiting threads
-        # do not remove running threading
+        # can only remove waiting tasks
+        # do not remove the running task
         # if no such resource
         if resourceName not in self.resources:
             return False
         with self.resources[resourceName] as resource:
-            # if it is the current running one, kill it and wake up next thread if any
-            if resource.waitlist[0] != taskThread:
-                # add the thread to toDeleteList
-                self.moveToDelete(resourceName, taskThread)
-                resource.waitlist.remove(taskThread)
-                return
-
-    def moveToDelete(self, resourceName, taskThread):
-        """Move a thread to the toDeleteList.
-
-        Parameters
-        ----------
-        resourceName : str
-            The name of the resource.
-        taskThread : SelfLockThread
-            The thread to move.
-        """
-        if resourceName not in self.toDeleteList:
-            self.toDeleteList[resourceName] = ThreadWaitlist()
-        with self.toDeleteList[resourceName] as temp:
-            temp.waitlist.append(taskThread)
+            if (
+                taskThread not in resource.waitlist
+                or resource.waitlist[0] is taskThread
+            ):
+                return False
+            resource.waitlist.remove(taskThread)
+        taskThread.cancel()
+        return True
 
     def getRunningThread(self, resourceName):
-        """Get the running thread of the resource.
+        """Get the running task of the resource.
 
         Parameters
         ----------
@@ -328,8 +366,8 @@ class SynchronizedThreadPool:
 
         Returns
         -------
-        SelfLockThread
-            The running thread.
+        ThreadTask
+            The running task.
         """
         if (
             resourceName not in self.resources
@@ -339,46 +377,19 @@ class SynchronizedThreadPool:
         return self.resources[resourceName].waitlist[0]
 
     def clear(self):
-        """Clear all the threads in the pool."""
+        """Clear all the tasks in the pool."""
 
-        # move all the threads except first one to toDeleteList
         sys.settrace(self.globaltrace)
         for resourceName in self.resources:
+            # drop the waiting tasks, and stop the worker if it is running one
             with self.resources[resourceName] as temp:
-                headThread = temp.waitlist[0] if len(temp.waitlist) > 0 else None
-                for i in range(1, len(temp.waitlist)):
-                    self.moveToDelete(resourceName, temp.waitlist[i])
-            if headThread:
-                self._raiseError(headThread.native_id)
-            self.killThreadInList(resourceName, self.toDeleteList)
-
-    def killThreadInList(self, resourceName, threadList):
-        """Kill all the threads in the threadList.
-
-        Parameters
-        ----------
-        resourceName : str
-            The name of the resource.
-        threadList : dict
-            The threadList to kill.
-        """
-        sys.settrace(self.globaltrace)
-        # remove all the threads in threadList
-        if resourceName in threadList:
-            with threadList[resourceName] as temp:
-                while temp.waitlist:
-                    thread = temp.waitlist[0]
-                    thread.unlock()
-                    self._raiseError(thread.native_id)
-                    thread.join(1)
-                    if not thread.is_alive():
-                        # move it from the list
-                        temp.waitlist.popleft()
-                    else:
-                        thread.wait()
-                        # move the thread to the end of the list
-                        temp.waitlist.popleft()
-                        temp.waitlist.append(thread)
+                tasks = list(temp.waitlist)
+                temp.waitlist.clear()
+            worker = self.workers.get(resourceName, None)
+            if tasks and worker is not None and worker.is_alive():
+                self._raiseError(worker.native_id)
+            for task in tasks[1:]:
+                task.cancel()
 
     def globaltrace(self, frame, event, arg):
         """Global trace function.
@@ -452,6 +463,8 @@ class ThreadWaitlist:
         self.waitlistLock = threading.Lock()
         #: deque: The waitlist.
         self.waitlist = deque()
+        #: threading.Condition: Notified when a task is added to the waitlist.
+        self.condition = threading.Condition(self.waitlistLock)
 
     def __enter__(self):
         """Enter the context.
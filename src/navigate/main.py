@@ -38,19 +38,46 @@ import os
 # Third Party Imports
 
 # Local Imports
-from navigate.controller.controller import Controller
-from navigate.controller.configurator import Configurator
 from navigate.log_files.log_functions import log_setup
 from navigate.view.splash_screen import SplashScreen
 from navigate.tools.main_functions import (
     evaluate_parser_input_arguments,
     create_parser,
 )
+from navigate.tools.startup_profiler import StartupProfiler
 
 # Proxy Configuration
 os.environ["http_proxy"] = ""
 os.environ["https_proxy"] = ""
 
+#: class: The Controller and Configurator import most of navigate and its third
+#: party dependencies, so they are only imported once the splash screen is shown.
+Controller = None
+Configurator = None
+
+
+def import_application(configurator=False):
+    """Import the class that runs the application.
+
+    Parameters
+    ----------
+    configurator : bool
+        Import the Configurator instead of the Controller.
+
+    Returns
+    -------
+    application : class
+        The Controller or Configurator class.
+    """
+    global Controller, Configurator
+    if configurator:
+        if Configurator is None:
+            from navigate.controller.configurator import Configurator
+        return Configurator
+    if Controller is None:
+        from navigate.controller.controller import Controller
+    return Controller
+
 
 def main():
     """Light-sheet Microscopy (Navigate).
@@ -70,6 +97,7 @@ def main():
         --waveform-templates-file
         --logging-confi
         --configurator
+        --profile-startup
     """
     if platform.system() != "Windows":
         print(
@@ -80,20 +108,26 @@ def main():
             "on MacOS. Testing on Linux operating systems has not been performed."
         )
 
-    # Start the GUI, withdraw main screen, and show splash screen.
-    root = tk.Tk()
-    root.withdraw()
-
-    # Splash Screen
-    current_directory = os.path.dirname(os.path.realpath(__file__))
-    splash_screen = SplashScreen(
-        root, os.path.join(current_directory, "view", "icon", "splash_screen_image.png")
-    )
-
     # Parse command line arguments
     parser = create_parser()
     args = parser.parse_args()
 
+    profiler = StartupProfiler()
+    if args.profile_startup:
+        profiler.install()
+
+    # Start the GUI, withdraw main screen, and show splash screen.
+    with profiler.stage("splash screen"):
+        root = tk.Tk()
+        root.withdraw()
+
+        # Splash Screen
+        current_directory = os.path.dirname(os.path.realpath(__file__))
+        splash_screen = SplashScreen(
+            root,
+            os.path.join(current_directory, "view", "icon", "splash_screen_image.png"),
+        )
+
     (
         configuration_path,
         experiment_path,
@@ -107,20 +141,32 @@ def main():
 
     log_setup("logging.yml", logging_path)
 
+    with profiler.stage("import application"):
+        application = import_application(args.configurator)
+
     if args.configurator:
-        Configurator(root, splash_screen)
+        with profiler.stage("configurator"):
+            application(root, splash_screen)
     else:
-        Controller(
-            root,
-            splash_screen,
-            configuration_path,
-            experiment_path,
-            waveform_constants_path,
-            rest_api_path,
-            waveform_templates_path,
-            gui_configuration_path,
-            args,
-        )
+        with profiler.stage("controller"):
+            controller = application(
+                root,
+                splash_screen,
+                configuration_path,
+                experiment_path,
+                waveform_constants_path,
+                rest_api_path,
+                waveform_templates_path,
+                gui_configuration_path,
+                args,
+            )
+        if args.profile_startup:
+            for name, duration in controller.model.startup_timings.items():
+                profiler.record(f"model {name}", duration)
+
+    if args.profile_startup:
+        profiler.uninstall()
+        print(profiler.report())
 
     root.mainloop()
 
@@ -34,8 +34,6 @@ import math
 from typing import Optional
 
 # Third party imports
-from skimage import filters
-from skimage.transform import downscale_local_mean
 import numpy as np
 import numpy.typing as npt
 
@@ -93,6 +91,99 @@ def has_tissue(
     return np.any(image_data[xsl, ysl] > np.mean(image_data))
 
 
+def block_any(mask: npt.ArrayLike, width: int) -> np.ndarray:
+    """
+    Determine which width x width blocks of a mask contain a nonzero element.
+
+    Partial blocks along the bottom and right edges of the mask are included.
+
+    Parameters
+    ----------
+    mask : npt.ArrayLike
+        2D array.
+    width : int
+        Width of a block.
+
+    Returns
+    -------
+    blocks : np.ndarray
+        Boolean array with one element per block.
+    """
+    mask = np.asarray(mask) != 0
+    m = math.ceil(mask.shape[0] / width)
+    n = math.ceil(mask.shape[1] / width)
+    if mask.shape != (m * width, n * width):
+        padded = np.zeros((m * width, n * width), dtype=bool)
+        padded[: mask.shape[0], : mask.shape[1]] = mask
+        mask = padded
+    # OR strided views together; this is much faster than reducing the small
+    # block axes of a reshaped array.
+    rows = mask[0::width].copy()
+    for i in range(1, width):
+        rows |= mask[i::width]
+    blocks = rows[:, 0::width].copy()
+    for i in range(1, width):
+        blocks |= rows[:, i::width]
+    return blocks
+
+
+def tissue_tile_mask(
+    image_data: npt.ArrayLike,
+    width: int,
+    offset: Optional[npt.ArrayLike] = None,
+    variance: Optional[npt.ArrayLike] = None,
+) -> np.ndarray:
+    """
+    Determine which subimages of an image contain tissue.
+
+    Evaluates has_tissue for every width x width subimage at once. Partial
+    subimages along the bottom and right edges of the image are included.
+
+    Parameters
+    ----------
+    image_data : npt.ArrayLike
+        Image
+    width : int
+        Width of subimage. Must be smaller than min(image_data.shape[:1])
+    offset : npt.ArrayLike
+        Camera pixel offset map. Same size as image_data.
+    variance : npt.ArrayLike
+        Camera pixel variance map. Same size as image_data.
+
+    Returns
+    -------
+    tiles : np.ndarray
+        Boolean array with one element per subimage, True if it contains tissue.
+    """
+    image_data = np.asarray(image_data)
+    return block_any(image_data > np.mean(image_data), width)
+
+
+def row_extents(mask: npt.ArrayLike) -> tuple:
+    """
+    Find the first and last nonzero column of every row.
+
+    Parameters
+    ----------
+    mask : npt.ArrayLike
+        2D array. Nonzero elements are treated as tissue.
+
+    Returns
+    -------
+    occupied : np.ndarray
+        True for the rows that contain a nonzero element.
+    first : np.ndarray
+        First nonzero column of each row. Only meaningful where occupied.
+    last : np.ndarray
+        Last nonzero column of each row. Only meaningful where occupied.
+    """
+    mask = np.asarray(mask) != 0
+    occupied = mask.any(axis=1)
+    first = np.argmax(mask, axis=1)
+    last = mask.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+    return occupied, first, last
+
+
 def find_tissue_boundary_2d(
     image_data: npt.ArrayLike, mag_ratio: Optional[float] = 1.0
 ) -> list:
@@ -112,27 +203,29 @@ def find_tissue_boundary_2d(
     boundary : list
         List of boundaries of tissue by row of downsampled image.
     """
+    # skimage is only needed by the tiling features that detect tissue.
+    from skimage import filters
 
     # Threshold
     thresh_img = image_data > filters.threshold_otsu(image_data)
 
     if mag_ratio > 1:
-        ds_img = downscale_local_mean(thresh_img, (mag_ratio, mag_ratio))
+        # A downsampled pixel has tissue if any of the pixels it covers do.
+        ds_img = block_any(thresh_img, mag_ratio)
     else:
         ds_img = image_data
         mag_ratio = 1
 
-    idx_x, idx_y = np.where(ds_img)
+    occupied, first, last = row_extents(ds_img)
 
     # Assume square image
     m = math.ceil(image_data.shape[0] / mag_ratio)
     # n = math.ceil(image_data.shape[1] / mag_ratio)
     boundary = [None] * m
-    for x, y in zip(idx_x, idx_y):
-        if boundary[x] is None:
-            boundary[x] = [y, y]
-        else:
-            boundary[x][1] = y
+    rows = np.flatnonzero(occupied[:m])
+    spans = np.stack((first[rows], last[rows]), axis=1).tolist()
+    for x, span in zip(rows.tolist(), spans):
+        boundary[x] = span
     return boundary
 
 
@@ -144,8 +237,12 @@ def binary_detect(
     variance: Optional[npt.ArrayLike] = None,
 ):
     """
-    Perform a binary search for tissue on an image. Return locations of pixels
-    containing tissue.
+    Detect tissue on an image, starting from the boundary of a neighboring image.
+    Return locations of pixels containing tissue.
+
+    A row keeps tissue if it has tissue between the columns of its previous
+    boundary, and rows above and below the previous boundary are added while
+    their tissue touches the row next to them.
 
     Parameters
     ----------
@@ -165,96 +262,13 @@ def binary_detect(
     boundary : list
         List of boundaries of tissue by row of downsampled image.
     """
-    m, n = img_data.shape
-    m = int(m / width)
-    n = int(n / width)
-
-    def binary_search_func_left(row, left, right):
-        """Binary search function.
-
-        Parameters
-        ----------
-        row : int
-            Row index of image.
-        left : int
-            Leftmost column index of subimage.
-        right : int
-            Rightmost column index of subimage.
-
-        Returns
-        -------
-        int
-            Leftmost column index of subimage.
-        """
-        while left < right:
-            mid = (left + right) // 2
-            if has_tissue(img_data, row, mid, width, offset, variance):
-                right = mid
-            else:
-                left = mid + 1
-        return right
-
-    def binary_search_func_right(row, left, right):
-        """Binary search function.
-
-        Parameters
-        ----------
-        row : int
-            Row index of image.
-        left : int
-            Leftmost column index of subimage.
-        right : int
-            Rightmost column index of subimage.
-
-        Returns
-        -------
-        int
-            Rightmost column index of subimage.
-        """
-
-        while left < right:
-            mid = (left + right) // 2
-            if has_tissue(img_data, row, mid, width, offset, variance):
-                left = mid + 1
-            else:
-                right = mid
-        return right - 1
-
-    def find_tissue_range(row, left, right):
-        """Find range of tissue in image.
-
-        Parameters
-        ----------
-        row : int
-            Row index of image.
-        left : int
-            Leftmost column index of subimage.
-        right : int
-            Rightmost column index of subimage.
-
-        Returns
-        -------
-        int
-            Leftmost column index of subimage.
-        int
-            Middle column index of subimage.
-        int
-            Rightmost column index of subimage.
-        """
-
-        temp = [(left, right)]
-        while temp:
-            temp2 = []
-            for ll, r in temp:
-                mid = (ll + r) // 2
-                if has_tissue(img_data, row, mid, width, offset, variance):
-                    return ll, mid, r
-                if mid > ll + 1:
-                    temp2.append((ll, mid))
-                if r > mid + 1:
-                    temp2.append((mid, r))
-            temp = temp2
-        return -1, -1, -1
+    tiles = tissue_tile_mask(img_data, width, offset, variance)
+    occupied, first, last = row_extents(tiles)
+    # Number of tissue subimages left of each column, to test a range of a row.
+    counts = np.zeros((tiles.shape[0], tiles.shape[1] + 1), dtype=np.int64)
+    np.cumsum(tiles, axis=1, out=counts[:, 1:])
+    m = min(len(boundary), tiles.shape[0])
+    n = tiles.shape[1]
 
     def detect_row_boundary(row_id, left, right):
         """Detect row boundary.
@@ -270,63 +284,35 @@ def binary_detect(
 
         Returns
         -------
-        int
-            Leftmost column index of subimage.
-        int
-            Rightmost column index of subimage.
+        list or None
+            Leftmost and rightmost column index of tissue in the row, or None if
+            there is no tissue between left and right.
         """
-        is_tissue_left = has_tissue(img_data, row_id, left, width, offset, variance)
-        is_tissue_right = has_tissue(img_data, row_id, right, width, offset, variance)
-
-        if is_tissue_left and is_tissue_right:
-            left_l, left_r = 0, left
-            right_l, right_r = right, n
-        elif is_tissue_left:
-            left_l, left_r = 0, left
-            right_l, right_r = left, right
-        elif is_tissue_right:
-            left_l, left_r = left, right
-            right_l, right_r = right, n
-        else:
-            ll, mid, r = find_tissue_range(row_id, left, right)
-            left_l, left_r = ll, mid
-            right_l, right_r = mid, r
-
-        if left_l == -1:
-            return None, None
-        return binary_search_func_left(
-            row_id, left_l, left_r
-        ), binary_search_func_right(row_id, right_l, right_r)
-
-    def expand_row(row_id, limits, direction, boundary):
+        left, right = max(left, 0), min(right, n - 1)
+        if row_id >= m or left > right:
+            return None
+        if counts[row_id, right + 1] == counts[row_id, left]:
+            return None
+        return [int(first[row_id]), int(last[row_id])]
+
+    def expand_row(row_id, direction, boundary):
         """Expand row.
 
         Parameters
         ----------
         row_id : int
             Row index of image.
-        limits : int
-            Limits of row.
         direction : int
             Direction of row.
         boundary : list
             List of boundaries of tissue by row of downsampled image.
-
-        Returns
-        -------
-        new_boundary : list
-            List of boundaries of tissue by row of downsampled image.
         """
-
-        for i in range(row_id, limits, direction):
-            left, right = boundary[i][0], boundary[i][1]
-            left = left - 1 if left > 0 else 0
-            right = right + 1 if (right + 1) < (n - 1) else (n - 1)
-            ll, r = detect_row_boundary(i + direction, left, right)
-            if ll is None:
-                boundary[i + direction] = None
-                break
-            boundary[i + direction] = [ll, r]
+        while boundary[row_id] is not None and 0 <= row_id + direction < m:
+            left, right = boundary[row_id]
+            boundary[row_id + direction] = detect_row_boundary(
+                row_id + direction, left - 1, right + 1
+            )
+            row_id += direction
 
     new_boundary = boundary[:]
     top, bottom = None, None
@@ -338,28 +324,23 @@ def binary_detect(
         if expand_bottom is False:
             new_boundary[i] = None
             continue
-        if len(row) < 2:
-            row.append(row[0])
-        left, right = detect_row_boundary(i, row[0], row[1])
-        if left is None:
-            new_boundary[i] = None
+        new_boundary[i] = detect_row_boundary(i, row[0], row[-1])
+        if new_boundary[i] is None:
             if top is None:
                 expand_top = False
             if bottom is not None:
                 expand_bottom = False
-        else:
-            new_boundary[i] = [left, right]
 
         if top is None:
             top = i
         bottom = i
 
     # detect top/bottom if necessary
-    if expand_top:
-        expand_row(top, 0, -1, new_boundary)
+    if expand_top and top is not None:
+        expand_row(top, -1, new_boundary)
 
-    if expand_bottom:
-        expand_row(bottom, n - 1, 1, new_boundary)
+    if expand_bottom and bottom is not None:
+        expand_row(bottom, 1, new_boundary)
 
     return new_boundary
 
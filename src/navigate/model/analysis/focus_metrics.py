@@ -0,0 +1,262 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+#  Standard Imports
+import logging
+import threading
+from queue import Queue
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from navigate.model.analysis.image_contrast import (
+    fast_normalized_dct_shannon_entropy,
+    fourier_annulus,
+    normalized_variance,
+    tenengrad,
+)
+
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
+#: dict: Focus metrics by name. Each one maps a 2D image to a float.
+FOCUS_METRICS = {}
+
+
+def register_focus_metric(name):
+    """Register a focus metric under a name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the metric, as shown in the GUI.
+
+    Returns
+    -------
+    decorator : callable
+        Decorator that registers a function of a 2D image that returns a float.
+    """
+
+    def decorator(func):
+        FOCUS_METRICS[name] = func
+        return func
+
+    return decorator
+
+
+register_focus_metric("DCT Shannon Entropy")(
+    lambda image: float(fast_normalized_dct_shannon_entropy(image, 3)[0])
+)
+register_focus_metric("Tenengrad")(tenengrad)
+register_focus_metric("Normalized Variance")(normalized_variance)
+register_focus_metric("Fourier Annulus")(lambda image: fourier_annulus(image)[0])
+register_focus_metric("Pixel Max")(lambda image: float(image.max()))
+register_focus_metric("Pixel Average")(lambda image: float(image.mean()))
+
+
+class FocusMetric:
+    """A focus metric scored on a centered region of interest of a binned image.
+
+    Scoring a binned region of interest instead of the full frame makes the
+    transform based metrics many times cheaper. Scores are only comparable
+    between images prepared with the same settings.
+    """
+
+    def __init__(self, name="DCT Shannon Entropy", roi=1.0, binning=1):
+        """Initialize the FocusMetric.
+
+        Parameters
+        ----------
+        name : str
+            Name of a registered metric.
+        roi : float
+            Fraction of the image height and width, centered, that is scored.
+        binning : int
+            Number of pixels along each axis that are averaged into one.
+
+        Raises
+        ------
+        ValueError
+            If the metric is not registered, or the settings are out of range.
+        """
+        if name not in FOCUS_METRICS:
+            logger.error(f"Unknown focus metric: {name}")
+            raise ValueError(f"Unknown focus metric: {name}")
+        if not 0 < roi <= 1 or binning < 1:
+            logger.error(f"Invalid focus metric settings: roi {roi}, binning {binning}")
+            raise ValueError(
+                f"Invalid focus metric settings: roi {roi}, binning {binning}"
+            )
+        #: str: Name of the metric.
+        self.name = name
+        #: callable: Metric function.
+        self.func = FOCUS_METRICS[name]
+        #: float: Fraction of the image that is scored.
+        self.roi = float(roi)
+        #: int: Binning of the image.
+        self.binning = int(binning)
+
+    def prepare(self, image, copy=True):
+        """Crop and bin an image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            2D image.
+        copy : bool
+            Whether an unbinned image is copied, so it stays valid after the
+            source buffer is overwritten. Binned images are always new arrays.
+
+        Returns
+        -------
+        image : np.ndarray
+            The cropped and binned image.
+        """
+        height, width = image.shape
+        roi_height = max(self.binning, int(height * self.roi))
+        roi_width = max(self.binning, int(width * self.roi))
+        # whole bins only
+        roi_height -= roi_height % self.binning
+        roi_width -= roi_width % self.binning
+        top = (height - roi_height) // 2
+        left = (width - roi_width) // 2
+        image = image[top : top + roi_height, left : left + roi_width]
+        if self.binning == 1:
+            return np.array(image, dtype=np.float32) if copy else image
+        return (
+            image.reshape(
+                roi_height // self.binning,
+                self.binning,
+                roi_width // self.binning,
+                self.binning,
+            )
+            .mean(axis=(1, 3), dtype=np.float32)
+            .astype(np.float32, copy=False)
+        )
+
+    def score(self, image):
+        """Score a prepared image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            Image returned by prepare().
+
+        Returns
+        -------
+        score : float
+            Focus score.
+        """
+        return float(self.func(image))
+
+    def __call__(self, image):
+        """Crop, bin and score an image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            2D image.
+
+        Returns
+        -------
+        score : float
+            Focus score.
+        """
+        return self.score(self.prepare(image, copy=False))
+
+
+class FocusMetricScorer:
+    """Scores images with a focus metric on a worker thread.
+
+    Images are cropped and binned when they are submitted, which copies them out
+    of the data buffer. Scores are handed to the callbacks in the order the
+    images were submitted.
+    """
+
+    def __init__(self, metric):
+        """Initialize the FocusMetricScorer.
+
+        Parameters
+        ----------
+        metric : FocusMetric
+            The focus metric.
+        """
+        #: FocusMetric: The focus metric.
+        self.metric = metric
+        #: Queue: Prepared images waiting to be scored.
+        self.queue = Queue()
+        #: threading.Thread: The worker thread.
+        self.thread = threading.Thread(
+            target=self.run, name="Focus Metric Scorer", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, image, callback, *args):
+        """Score an image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            2D image.
+        callback : callable
+            Called on the worker thread as callback(score, *args).
+        *args : tuple
+            Extra arguments of the callback.
+        """
+        self.queue.put((self.metric.prepare(image), callback, args))
+
+    def run(self):
+        """Score the submitted images until stopped."""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                image, callback, args = item
+                callback(self.metric.score(image), *args)
+            except Exception as e:
+                logger.exception(f"Focus metric {self.metric.name} failed: {e}")
+            finally:
+                self.queue.task_done()
+
+    def wait(self):
+        """Wait until all the submitted images are scored."""
+        self.queue.join()
+
+    def stop(self):
+        """Score the submitted images, then stop the worker thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
@@ -33,10 +33,10 @@
 
 #  Standard Imports
 import logging
+from functools import lru_cache
 
 # Third Party Imports
 import numpy as np
-from scipy.fftpack import dctn
 
 # Local Imports
 
@@ -60,6 +60,7 @@ def fast_normalized_dct_shannon_entropy(input_array, psf_support_diameter_xy):
     entropy : np.ndarray
         Entropy value.
     """
+    from scipy.fftpack import dctn
 
     dct_array = dctn(input_array, type=2)
     abs_array = np.abs(dct_array / np.linalg.norm(dct_array))
@@ -70,3 +71,101 @@ def fast_normalized_dct_shannon_entropy(input_array, psf_support_diameter_xy):
     )
 
     return np.atleast_1d(entropy)
+
+
+def tenengrad(input_array):
+    """Calculates the Tenengrad focus measure of an image.
+
+    Parameters
+    ----------
+    input_array : np.ndarray
+        2D image.
+
+    Returns
+    -------
+    tenengrad : float
+        Mean squared magnitude of the Sobel gradient.
+    """
+    image = np.asarray(input_array, dtype=np.float32)
+    # separable Sobel filters, without the border
+    smooth_y = image[:-2, :] + 2 * image[1:-1, :] + image[2:, :]
+    smooth_x = image[:, :-2] + 2 * image[:, 1:-1] + image[:, 2:]
+    gradient_x = smooth_y[:, 2:] - smooth_y[:, :-2]
+    gradient_y = smooth_x[2:, :] - smooth_x[:-2, :]
+    return float(np.mean(gradient_x**2 + gradient_y**2))
+
+
+def normalized_variance(input_array):
+    """Calculates the variance of an image normalized by its mean.
+
+    Parameters
+    ----------
+    input_array : np.ndarray
+        2D image.
+
+    Returns
+    -------
+    normalized_variance : float
+        Variance divided by the mean, or 0 for an image with a mean of 0.
+    """
+    image = np.asarray(input_array, dtype=np.float32)
+    mean = float(image.mean())
+    if mean == 0:
+        return 0.0
+    return float(image.var()) / mean
+
+
+@lru_cache(maxsize=8)
+def annulus_mask(shape, radius_1, radius_2):
+    """Calculates a centered annulus mask.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the image.
+    radius_1 : int
+        Inner radius of the annulus.
+    radius_2 : int
+        Outer radius of the annulus.
+
+    Returns
+    -------
+    mask : np.ndarray
+        True inside the annulus. The cached array must not be modified.
+    """
+    y_, x_ = np.ogrid[: shape[0], : shape[1]]
+    x_ = x_ - (shape[1] - 1) / 2
+    y_ = y_ - (shape[0] - 1) / 2
+    radius = x_**2 + y_**2
+    mask = (radius > radius_1**2) & (radius <= radius_2**2)
+    mask.flags.writeable = False
+    return mask
+
+
+def fourier_annulus(im, radius_1=0, radius_2=64):
+    """Calculate the mean of the fourier transform of an annulus
+
+    Parameters
+    ----------
+    im : array
+        Image array
+    radius_1 : int, optional
+        Inner radius of the annulus, by default 0
+    radius_2 : int, optional
+        Outer radius of the annulus, by default 64
+
+    Returns
+    -------
+    float
+        Mean of the fourier transform of the annulus
+    array
+        Fourier transform of the annulus
+    """
+    mask = annulus_mask(im.shape, radius_1, radius_2)
+
+    IM = np.fft.fftshift(np.fft.fft2(im))
+    IM_abs = np.abs(IM)
+
+    IM_mask = IM_abs * mask
+
+    return np.mean(IM_mask), IM_mask
@@ -18,6 +18,10 @@ import weakref
 import atexit
 import signal
 
+# Answering calls out of order is tricky:
+from collections import deque
+from concurrent.futures import Future
+
 import logging
 import numpy as np
 
@@ -373,6 +377,9 @@ class ObjectInSubprocess:
         self._.child_pipe = child_pipe
         self._.child_process = child_process
         self._.waiting_list = _WaitingList()
+        self._.pending = deque()
+        self._.methods = frozenset()
+        self._.method_callers = {}
         if with_lock:
             self._.resource_lock = threading.Lock()
         else:
@@ -380,7 +387,10 @@ class ObjectInSubprocess:
         # Make sure the child process initialized successfully:
         with self._.parent_pipe_lock:
             self._.child_process.start()
-            assert _get_response(self) == "Successfully initialized"
+            resp = _get_response(self)
+            if isinstance(resp, tuple):  # The child also sent its method table
+                resp, self._.methods = resp
+            assert resp == "Successfully initialized"
         # Try to ensure the child process closes when we exit:
         dummy_namespace = getattr(self, "_")
         weakref.finalize(self, _close, dummy_namespace)
@@ -401,31 +411,155 @@ class ObjectInSubprocess:
             self._.resource_lock.acquire()
         if name == "terminate":
             with self._.parent_pipe_lock:
+                while self._.pending:
+                    self._.pending.popleft().set_exception(
+                        RuntimeError("The child process was terminated.")
+                    )
                 self._.parent_pipe.send(None)
                 self._.child_process.terminate()
             if self._.resource_lock:
                 self._.resource_lock.release()
             return _dummy_function
+        # Methods of the object's class are known from the method table, so
+        # calling them costs a single round trip:
+        if name in self._.methods:
+            return _get_method_caller(self, name)
         with self._.parent_pipe_lock:
+            _resolve_pending(self)
             self._.parent_pipe.send(("__getattribute__", (name,), {}))
             attr = _get_response(self)
         if callable(attr):
-
-            def attr(*args, **kwargs):
-                with self._.parent_pipe_lock:
-                    self._.parent_pipe.send((name, args, kwargs))
-                    return _get_response(self, True)
-
+            return _get_method_caller(self, name)
         elif self._.resource_lock:
             self._.resource_lock.release()
         return attr
 
     def __setattr__(self, name, value):
         with self._.parent_pipe_lock:
+            _resolve_pending(self)
             self._.parent_pipe.send(("__setattr__", (name, value), {}))
             return _get_response(self)
 
 
+def call_async(object_in_subprocess, name, *args, **kwargs):
+    """Call a method of an ObjectInSubprocess without waiting for the result.
+
+    The call is sent to the child process right away, and the child answers
+    calls in the order they were sent. The answer is read from the pipe the next
+    time the ObjectInSubprocess is used, or when the future's result is asked for.
+    This lets the caller queue several calls, e.g. move_stage followed by
+    get_stage_position, without waiting on each of them in turn.
+
+    Objects made with_lock=True are called synchronously, and the returned future
+    is already done.
+
+    Parameters
+    ----------
+    object_in_subprocess : ObjectInSubprocess
+        The object to call.
+    name : str
+        Name of the method.
+    *args : tuple
+        Positional arguments of the method.
+    **kwargs : dict
+        Keyword arguments of the method.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future holding the result, or the exception raised by the method.
+    """
+    if object_in_subprocess._.resource_lock:
+        future = Future()
+        try:
+            future.set_result(getattr(object_in_subprocess, name)(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    future = _PipeFuture(object_in_subprocess._)
+    with object_in_subprocess._.parent_pipe_lock:
+        object_in_subprocess._.parent_pipe.send((name, args, kwargs))
+        object_in_subprocess._.pending.append(future)
+    return future
+
+
+class _PipeFuture(Future):
+    """A Future whose result is read from the pipe of an ObjectInSubprocess."""
+
+    def __init__(self, dummy_namespace):
+        super().__init__()
+        self.dummy_namespace = dummy_namespace
+
+    def result(self, timeout=None):
+        return super().result(self._read_answer(timeout))
+
+    def exception(self, timeout=None):
+        return super().exception(self._read_answer(timeout))
+
+    def _read_answer(self, timeout):
+        """Read answers from the pipe until this future is done.
+
+        Whoever holds the pipe reads the pending answers, so we either wait for
+        them to finish, or read the answers ourselves. Returns the timeout left
+        for the base class to wait on.
+        """
+        if not self.done():
+            lock = self.dummy_namespace.parent_pipe_lock.lock
+            if lock.acquire(timeout=-1 if timeout is None else timeout):
+                try:
+                    while not self.done() and self.dummy_namespace.pending:
+                        _resolve_next_pending(self.dummy_namespace)
+                finally:
+                    lock.release()
+        return None if timeout is None else 0
+
+
+def _get_method_caller(object_in_subprocess, name):
+    """Get a function that calls a method of the child-process object.
+
+    Effectively a method of ObjectInSubprocess, but defined externally to
+    minimize shadowing of the object's namespace
+    """
+    caller = object_in_subprocess._.method_callers.get(name)
+    if caller is None:
+
+        def caller(*args, **kwargs):
+            with object_in_subprocess._.parent_pipe_lock:
+                _resolve_pending(object_in_subprocess)
+                object_in_subprocess._.parent_pipe.send((name, args, kwargs))
+                return _get_response(object_in_subprocess, True)
+
+        object_in_subprocess._.method_callers[name] = caller
+    return caller
+
+
+def _resolve_pending(object_in_subprocess):
+    """Read the answers to all calls made with call_async.
+
+    Effectively a method of ObjectInSubprocess, but defined externally to
+    minimize shadowing of the object's namespace. The parent pipe lock must be
+    held.
+    """
+    while object_in_subprocess._.pending:
+        _resolve_next_pending(object_in_subprocess._)
+
+
+def _resolve_next_pending(dummy_namespace):
+    """Read the answer to the oldest call made with call_async.
+
+    The parent pipe lock must be held.
+    """
+    future = dummy_namespace.pending.popleft()
+    resp, printed_output = dummy_namespace.parent_pipe.recv()
+    if len(printed_output) > 0:
+        print(printed_output, end="")
+    if isinstance(resp, Exception):
+        future.set_exception(resp)
+    else:
+        future.set_result(resp)
+
+
 def _get_response(object_in_subprocess, release=False):
     """
     Effectively a method of ObjectInSubprocess, but defined externally to
@@ -454,6 +588,8 @@ def _close(dummy_namespace):
     if not dummy_namespace.child_process.is_alive():
         return
     with dummy_namespace.parent_pipe_lock:
+        while dummy_namespace.pending:
+            _resolve_next_pending(dummy_namespace)
         dummy_namespace.parent_pipe.send(None)
         dummy_namespace.child_process.join()
         dummy_namespace.parent_pipe.close()
@@ -506,7 +642,14 @@ def _child_loop(
                 atexit.register(lambda: close_method(*closeargs, **closekwargs))
                 # Note: We don't know if print statements in the close method
                 # will print in the main process.
-        child_pipe.send(("Successfully initialized", printed_output.getvalue()))
+        methods = frozenset(
+            name
+            for name in dir(type(obj))
+            if not name.startswith("__") and callable(getattr(type(obj), name, None))
+        )
+        child_pipe.send(
+            (("Successfully initialized", methods), printed_output.getvalue())
+        )
     except Exception as e:  # If we fail to initialize, just give up.
         e.child_traceback_string = traceback.format_exc()
         child_pipe.send((e, printed_output.getvalue()))
@@ -45,6 +45,43 @@ logger = logging.getLogger(p)
 
 FILE_TYPES = ["TIFF", "OME-TIFF", "H5", "N5", "OME-Zarr"]
 
+#: dict: File types by file extension.
+FILE_EXTENSIONS = {
+    ".ome.tif": "OME-TIFF",
+    ".ome.tiff": "OME-TIFF",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+    ".h5": "H5",
+    ".n5": "N5",
+    ".zarr": "OME-Zarr",
+}
+
+
+def get_file_type(file_name: str) -> str:
+    """Get the file type of an image file from its extension.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the image file.
+
+    Returns
+    -------
+    str
+        One of FILE_TYPES.
+
+    Raises
+    ------
+    NotImplementedError
+        If the extension does not belong to a known file type.
+    """
+    name = str(file_name).rstrip("/\\").lower()
+    for extension, file_type in FILE_EXTENSIONS.items():
+        if name.endswith(extension):
+            return file_type
+    logger.error(f"Unknown file type for {file_name}. Cannot open.")
+    raise NotImplementedError(f"Unknown file type for {file_name}. Cannot open.")
+
 
 def get_data_source(file_type: str):
     """Get the data source class for the given file type.
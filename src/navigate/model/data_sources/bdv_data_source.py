@@ -118,6 +118,30 @@ class BigDataViewerDataSource(PyramidalDataSource):
         setup = self.ds_name(t, c, p).replace("???", str(subdiv))
         return self.image[setup][z, y, x]
 
+    def get_dataset(self, c, t, p, subdiv=0) -> tuple:
+        """Get the dataset holding a single c, t, p, subdiv.
+
+        Parameters
+        ----------
+        c : int
+            Single channel
+        t : int
+            Single timepoint
+        p : int
+            Single position
+        subdiv : int
+            Subdivision of the dataset to index along
+
+        Returns
+        -------
+        tuple
+            The (z, y, x) dataset and an empty index prefix.
+        """
+        image = self.image
+        if isinstance(image, zarr.N5Store):
+            image = zarr.open(image, mode="r")
+        return image[self.ds_name(t, c, p).replace("???", str(subdiv))], ()
+
     def set_metadata_from_configuration_experiment(
         self, configuration: Dict[str, Any], microscope_name: str = None
     ) -> None:
@@ -157,16 +181,16 @@ class BigDataViewerDataSource(PyramidalDataSource):
 
         ds_name = self.ds_name(t, c, p)
         is_kw = len(kw) > 0
+        if is_kw:
+            self._views.append(kw)
+        planes = self.downsample(data, z, (t, c, p))
         for i in range(self.subdivisions.shape[0]):
-            dx, dy, dz = self.resolutions[i, ...]
-            if z % dz == 0:
-                dataset_name = ds_name.replace("???", str(i))
-                # print(z, dz, dataset_name, self.image[dataset_name].shape,
-                #       data[::dx, ::dy].shape)
-                zs = min(z // dz, self.shapes[i, 0] - 1)  # TODO: Is this necessary?
-                self.image[dataset_name][zs, ...] = data[::dy, ::dx].astype(self.dtype)
-                if is_kw and (i == 0):
-                    self._views.append(kw)
+            if planes[i] is None:
+                continue
+            dz = self.resolutions[i, 2]
+            dataset_name = ds_name.replace("???", str(i))
+            zs = min(z // dz, self.shapes[i, 0] - 1)  # TODO: Is this necessary?
+            self.image[dataset_name][zs, ...] = planes[i]
         self._current_frame += 1
 
         # Check if this was the last frame to write
@@ -341,6 +365,7 @@ class BigDataViewerDataSource(PyramidalDataSource):
         """Close the image file."""
         if self._closed:
             return
+        self._shutdown_reads()
         self._check_shape(self._current_frame - 1, self.metadata.per_stack)
         if self.__file_type == "n5":
             self.__store.close()
@@ -32,6 +32,10 @@
 
 # Standard library imports
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 # Third-party imports
@@ -46,12 +50,130 @@ from ...tools.slicing import ensure_slice, ensure_iter, slice_len
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: int: Default size in bytes of the chunk cache of a data source read from disk.
+CHUNK_CACHE_SIZE = 256 * 2**20
+
+#: int: Chunks smaller than this are read together in blocks of about this size.
+READ_BLOCK_SIZE = 4 * 2**20
+
+
+class ChunkCache:
+    """Least recently used cache of chunks read from a data source."""
+
+    def __init__(self, max_bytes: int = CHUNK_CACHE_SIZE) -> None:
+        """Initialize the chunk cache.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Size of the cache in bytes. 0 disables caching.
+        """
+        #: int: Size of the cache in bytes.
+        self.max_bytes = max_bytes
+        #: int: Size of the cached chunks in bytes.
+        self.nbytes = 0
+        #: OrderedDict: Cached chunks, least recently used first.
+        self.chunks = OrderedDict()
+        #: threading.Lock: Lock guarding the cache.
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Get a chunk from the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the chunk.
+
+        Returns
+        -------
+        npt.ArrayLike or None
+            The chunk, or None if it is not cached.
+        """
+        with self.lock:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                self.chunks.move_to_end(key)
+            return chunk
+
+    def put(self, key, chunk: npt.ArrayLike) -> None:
+        """Add a chunk to the cache, evicting the least recently used chunks.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the chunk.
+        chunk : npt.ArrayLike
+            The chunk. It is made read-only.
+        """
+        if chunk.nbytes > self.max_bytes:
+            return
+        chunk.flags.writeable = False
+        with self.lock:
+            previous = self.chunks.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self.chunks[key] = chunk
+            self.nbytes += chunk.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self.chunks.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        with self.lock:
+            self.chunks.clear()
+            self.nbytes = 0
+
+
+def split_by_chunk(sl: slice, size: int, chunk: int) -> list:
+    """Split the indices of a slice along one axis by the chunk they fall in.
+
+    Parameters
+    ----------
+    sl : slice
+        Indices requested along the axis.
+    size : int
+        Size of the axis.
+    chunk : int
+        Chunk size along the axis.
+
+    Returns
+    -------
+    list
+        One (chunk index, slice within the chunk, slice of the result) tuple per
+        chunk touched, in the order of the requested indices.
+    """
+    indices = range(size)[sl]
+    step = indices.step
+    pieces = []
+    done = 0
+    while done < len(indices):
+        index = indices[done]
+        k = index // chunk
+        if step > 0:
+            count = ((k + 1) * chunk - 1 - index) // step + 1
+        else:
+            count = (index - k * chunk) // -step + 1
+        count = min(count, len(indices) - done)
+        start = index - k * chunk
+        stop = start + count * step
+        pieces.append(
+            (
+                k,
+                slice(start, stop if stop >= 0 else None, step),
+                slice(done, done + count),
+            )
+        )
+        done += count
+    return pieces
+
 
 class PyramidalDataSource(DataSource):
     """General class for data sources that store data in a pyramidal structure.
 
-    Implements resolution/subdivision calculations and __getitem__ with
-    indexing by subdivision.
+    Implements resolution/subdivision calculations, the streaming construction
+    of down-sampled pyramid levels, and __getitem__ with indexing by subdivision.
     """
 
     def __init__(self, file_name: str = None, mode: str = "w") -> None:
@@ -64,7 +186,9 @@ class PyramidalDataSource(DataSource):
         mode : str
             The mode to open the file in. Must be "w" for write or "r" for read.
         """
-        #: np.array: The resolution of each down-sampled pyramid level.
+        #: np.array: The resolution of each down-sampled pyramid level. The default
+        #: levels do not reduce z, so planes are only accumulated along z for
+        #: levels set with set_resolutions().
         self._resolutions = np.array(
             [[1, 1, 1], [2, 2, 1], [4, 4, 1], [8, 8, 1]], dtype=int
         )
@@ -72,6 +196,16 @@ class PyramidalDataSource(DataSource):
         self._subdivisions = None
         #: np.array: The shape of the image.
         self._shapes = None
+        #: str: Reduction used for down-sampled levels, "mean" or "max".
+        self.downsample_method = "mean"
+        #: dict: Partially reduced z-blocks, by (t, c, p, pyramid level).
+        self._z_accumulators = {}
+        #: ChunkCache: Chunks read from disk, used when the data source is read.
+        self.chunk_cache = ChunkCache()
+        #: int: Number of threads reading chunks.
+        self.read_threads = min(8, os.cpu_count() or 1)
+        #: ThreadPoolExecutor: Thread pool for reading chunks.
+        self._read_executor = None
 
         super().__init__(file_name, mode)
 
@@ -172,15 +306,178 @@ class PyramidalDataSource(DataSource):
             configuration, microscope_name
         )
 
+    def set_resolutions(self, resolutions: npt.ArrayLike) -> None:
+        """Set the down-sampling factors of the pyramid levels.
+
+        Must be called before the first image is written.
+
+        Parameters
+        ----------
+        resolutions : npt.ArrayLike
+            XYZ down-sampling factors, one row per level. The first level must be
+            [1, 1, 1].
+        """
+        resolutions = np.array(resolutions, dtype=int)
+        if (
+            resolutions.ndim != 2
+            or resolutions.shape[1] != 3
+            or np.any(resolutions[0] != 1)
+            or np.any(resolutions < 1)
+        ):
+            logger.error(f"Invalid pyramid resolutions {resolutions.tolist()}.")
+            raise ValueError(f"Invalid pyramid resolutions {resolutions.tolist()}.")
+        self._resolutions = resolutions
+        self._subdivisions = None
+        self._shapes = None
+        self._z_accumulators = {}
+
+    def set_downsample_method(self, method: str) -> None:
+        """Set the reduction used to build the down-sampled pyramid levels.
+
+        Parameters
+        ----------
+        method : str
+            "mean" for block averaging or "max" for block maximum.
+        """
+        if method not in ["mean", "max"]:
+            logger.warning(f"Unknown down-sampling method {method}. Using mean.")
+            method = "mean"
+        self.downsample_method = method
+
+    def _block_reduce(self, data: npt.ArrayLike, dy: int, dx: int) -> npt.ArrayLike:
+        """Reduce non-overlapping dy x dx blocks of a 2D image.
+
+        Edges that do not fill a whole block are padded by repeating the last
+        row/column.
+
+        Parameters
+        ----------
+        data : npt.ArrayLike
+            2D image.
+        dy : int
+            Block size in y.
+        dx : int
+            Block size in x.
+
+        Returns
+        -------
+        npt.ArrayLike
+            Reduced 2D image (float32 for "mean").
+        """
+        if dy == 1 and dx == 1:
+            return data
+        ny, nx = -(-data.shape[0] // dy), -(-data.shape[1] // dx)
+        pad_y, pad_x = ny * dy - data.shape[0], nx * dx - data.shape[1]
+        if pad_y or pad_x:
+            data = np.pad(data, ((0, pad_y), (0, pad_x)), mode="edge")
+        blocks = data.reshape(ny, dy, nx, dx)
+        if self.downsample_method == "max":
+            return blocks.max(axis=(1, 3))
+        return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+    def downsample_xy(self, data: npt.ArrayLike) -> list:
+        """Reduce a 2D image in x and y for every pyramid level.
+
+        Each level is computed from the closest previous level whose resolution
+        evenly divides its own, so the full resolution image is read only once.
+
+        Parameters
+        ----------
+        data : npt.ArrayLike
+            2D image at full resolution.
+
+        Returns
+        -------
+        list
+            One 2D image per pyramid level, in the order of self.resolutions.
+        """
+        planes = []
+        for ri, (dx, dy, _) in enumerate(self.resolutions):
+            source, sx, sy = data, 1, 1
+            for pi in range(ri - 1, -1, -1):
+                px, py, _ = self.resolutions[pi]
+                if dx % px == 0 and dy % py == 0:
+                    source, sx, sy = planes[pi], px, py
+                    break
+            planes.append(self._block_reduce(source, dy // sy, dx // sx))
+        return planes
+
+    def accumulate_z(self, key, z: int, plane: npt.ArrayLike, dz: int):
+        """Add a plane to the z-block of a pyramid level.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the pyramid level being built, e.g. (t, c, p, level).
+        z : int
+            Full resolution z index of the plane.
+        plane : npt.ArrayLike
+            Plane already reduced in x and y.
+        dz : int
+            Down-sampling factor in z of the pyramid level.
+
+        Returns
+        -------
+        npt.ArrayLike or None
+            The reduced plane, cast to self.dtype, once the last plane of the
+            z-block has arrived. None otherwise.
+        """
+        last = (z % dz == dz - 1) or (z >= self.shape_z - 1)
+        if dz == 1:
+            reduced, count = plane, 1
+        else:
+            acc = self._z_accumulators.get(key)
+            if acc is None or z % dz == 0:
+                acc = [plane.astype(np.float32), 1]
+            elif self.downsample_method == "max":
+                np.maximum(acc[0], plane, out=acc[0])
+                acc[1] += 1
+            else:
+                acc[0] += plane
+                acc[1] += 1
+            if not last:
+                self._z_accumulators[key] = acc
+                return None
+            self._z_accumulators.pop(key, None)
+            reduced, count = acc
+
+        if reduced.dtype == self.dtype:
+            return reduced
+        if self.downsample_method == "mean" and count > 1:
+            reduced = reduced / count
+        return np.rint(reduced).astype(self.dtype)
+
+    def downsample(self, data: npt.ArrayLike, z: int, key) -> list:
+        """Build the next plane of every pyramid level from a new image.
+
+        Parameters
+        ----------
+        data : npt.ArrayLike
+            2D image at full resolution.
+        z : int
+            Full resolution z index of the image.
+        key : tuple
+            Identifies the stack being written, e.g. (t, c, p).
+
+        Returns
+        -------
+        list
+            For each pyramid level, the completed plane or None if its z-block is
+            still being accumulated.
+        """
+        planes = self.downsample_xy(data)
+        return [
+            self.accumulate_z(key + (ri,), z, plane, self.resolutions[ri, 2])
+            for ri, plane in enumerate(planes)
+        ]
+
     def __getitem__(self, keys):
         """Magic method to get slice requests passed by, e.g., ds[:,2:3,...].
-        Allows arbitrary slicing of dataset via calls to get_slice().
+        Allows arbitrary slicing of dataset via read_region().
 
         Order is xycztps where x, y, z are array indices, c is channel,
         t is timepoints, p is positions and s is subdivisions to index along.
 
-        TODO: Add subdivisions.
-
         Parameters
         ----------
         keys : tuple
@@ -191,6 +488,35 @@ class PyramidalDataSource(DataSource):
         npt.ArrayLike
             Array of shape (p, t, z, c, y, x)
         """
+        return self.read_region(keys)
+
+    def read_region(self, keys, out: npt.ArrayLike = None) -> npt.ArrayLike:
+        """Read a region of the dataset, optionally into an existing array.
+
+        When the data source is opened for reading, the region is split by the
+        chunks of the datasets it touches. Chunks are read concurrently and kept
+        in self.chunk_cache, so overlapping requests do not read them again.
+
+        Parameters
+        ----------
+        keys : tuple
+            Tuple of indices, in the order of __getitem__.
+        out : npt.ArrayLike, optional
+            Array to write the region into. Must have the shape of the result.
+
+        Returns
+        -------
+        npt.ArrayLike
+            Array of shape (z, y, x) for a single c, t and p, otherwise of shape
+            (p, t, z, c, y, x).
+
+        Raises
+        ------
+        IndexError
+            If there are too few or too many indices.
+        ValueError
+            If out does not have the shape of the result.
+        """
 
         # Check lengths
         if isinstance(keys, slice) or isinstance(keys, int):
@@ -228,29 +554,166 @@ class PyramidalDataSource(DataSource):
         else:
             subdiv = 0
 
-        if len(cs) == 1 and len(ts) == 1 and len(ps) == 1:
-            return self.get_slice(xs, ys, cs[0], zs, ts[0], ps[0], subdiv)
-
-        sliced_ds = np.empty(
-            (
-                len(ps),
-                len(ts),
-                slice_len(zs, self.shape_z) // self.resolutions[subdiv][2],
-                len(cs),
-                slice_len(ys, self.shape_y) // self.resolutions[subdiv][1],
-                slice_len(xs, self.shape_x) // self.resolutions[subdiv][0],
-            ),
-            dtype=self.dtype,
+        squeeze = len(cs) == 1 and len(ts) == 1 and len(ps) == 1
+        shape_z, shape_y, shape_x = self.shapes[subdiv]
+        shape = (
+            len(ps),
+            len(ts),
+            slice_len(zs, shape_z),
+            len(cs),
+            slice_len(ys, shape_y),
+            slice_len(xs, shape_x),
         )
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+            result = out[0, 0, :, 0] if squeeze else out
+        else:
+            result = out
+            expected = shape[2:3] + shape[4:] if squeeze else shape
+            if out.shape != expected:
+                error_statement = f"Output shape {out.shape} should be {expected}."
+                logger.error(error_statement)
+                raise ValueError(error_statement)
+            if squeeze:
+                out = out[np.newaxis, np.newaxis, :, np.newaxis]
+
+        # Plan one task per chunk touched, each copying into its part of out.
+        tasks = {}
+        for ci, c in enumerate(cs):
+            for ti, t in enumerate(ts):
+                for pi, p in enumerate(ps):
+                    if self.mode != "r":
+                        # Data may still be written, so read it as it is now.
+                        out[pi, ti, :, ci] = self.get_slice(xs, ys, c, zs, t, p, subdiv)
+                        continue
+                    dataset, prefix = self.get_dataset(c, t, p, subdiv)
+                    chunks = self.get_block_shape(dataset)
+                    for kz, src_z, dst_z in split_by_chunk(zs, shape_z, chunks[0]):
+                        for ky, src_y, dst_y in split_by_chunk(ys, shape_y, chunks[1]):
+                            for kx, src_x, dst_x in split_by_chunk(
+                                xs, shape_x, chunks[2]
+                            ):
+                                key = (c, t, p, subdiv, kz, ky, kx)
+                                if key not in tasks:
+                                    tasks[key] = (dataset, prefix, chunks, [])
+                                tasks[key][3].append(
+                                    (
+                                        (src_z, src_y, src_x),
+                                        (pi, ti, dst_z, ci, dst_y, dst_x),
+                                    )
+                                )
+
+        if len(tasks) == 1:
+            self._read_chunk(out, *next(iter(tasks.items())))
+        elif tasks:
+            if self._read_executor is None:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=self.read_threads,
+                    thread_name_prefix="PyramidalReader",
+                )
+            futures = [
+                self._read_executor.submit(self._read_chunk, out, key, task)
+                for key, task in tasks.items()
+            ]
+            for future in futures:
+                future.result()
+
+        return result
+
+    def _read_chunk(self, out: npt.ArrayLike, key: tuple, task: tuple) -> None:
+        """Read a chunk, from the cache if possible, and copy it into out.
+
+        Parameters
+        ----------
+        out : npt.ArrayLike
+            Array of shape (p, t, z, c, y, x) to copy into.
+        key : tuple
+            (c, t, p, subdiv, kz, ky, kx) chunk identifier.
+        task : tuple
+            The dataset, the index prefix of the dataset, its chunk shape and the
+            (source, destination) selections to copy.
+        """
+        dataset, prefix, chunks, copies = task
+        chunk = self.chunk_cache.get(key)
+        if chunk is None:
+            region = tuple(
+                slice(k * size, (k + 1) * size) for k, size in zip(key[4:], chunks)
+            )
+            chunk = np.asarray(dataset[prefix + region])
+            self.chunk_cache.put(key, chunk)
+        for source, destination in copies:
+            out[destination] = chunk[source]
 
-        for c in cs:
-            for t in ts:
-                for p in ps:
-                    sliced_ds[p, t, :, c, :, :] = self.get_slice(
-                        xs, ys, c, zs, t, p, subdiv
-                    )
+    def get_block_shape(self, dataset) -> tuple:
+        """Get the (z, y, x) shape of the blocks a dataset is read in.
+
+        Blocks are aligned to the chunks of the dataset. Small chunks are grouped,
+        along x first, into blocks of about READ_BLOCK_SIZE bytes.
+
+        Parameters
+        ----------
+        dataset : h5py.Dataset or zarr.Array
+            The dataset.
+
+        Returns
+        -------
+        tuple
+            Block shape. Whole planes for datasets that are not chunked.
+        """
+        shape = tuple(dataset.shape[-3:])
+        chunks = getattr(dataset, "chunks", None)
+        if chunks is None:
+            return (1,) + shape[1:]
+        block = list(chunks[-3:])
+        itemsize = np.dtype(dataset.dtype).itemsize
+        for axis in (2, 1, 0):
+            while (
+                np.prod(block) * itemsize < READ_BLOCK_SIZE
+                and block[axis] < shape[axis]
+            ):
+                block[axis] = min(2 * block[axis], shape[axis])
+        return tuple(block)
+
+    def get_dataset(self, c, t, p, subdiv=0) -> tuple:
+        """Get the dataset holding a single c, t, p, subdiv.
+
+        Parameters
+        ----------
+        c : int
+            Single channel
+        t : int
+            Single timepoint
+        p : int
+            Single position
+        subdiv : int
+            Subdivision of the dataset to index along
+
+        Returns
+        -------
+        tuple
+            The dataset and the tuple of indices to prepend to a (z, y, x)
+            selection of it.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented in a derived class.
+        """
+        error_statement = "Implemented in a derived class."
+        logger.error(error_statement)
+        raise NotImplementedError(error_statement)
 
-        return sliced_ds
+    def _mode_checks(self) -> None:
+        """Checks that the mode is valid. Cached chunks are dropped."""
+        self.chunk_cache.clear()
+        super()._mode_checks()
+
+    def _shutdown_reads(self) -> None:
+        """Stop the chunk reading threads and drop the cached chunks."""
+        if self._read_executor is not None:
+            self._read_executor.shutdown(wait=True)
+            self._read_executor = None
+        self.chunk_cache.clear()
 
     def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0) -> npt.ArrayLike:
         """Get a 3D slice of the dataset for a single c, t, p, subdiv.
@@ -31,19 +31,26 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 #  Standard Imports
+import logging
 import os
 import uuid
 from pathlib import Path
 
 # Third Party Imports
 import tifffile
+import numpy as np
 import numpy.typing as npt
 
 # Local imports
 from .data_source import DataSource
+from ...tools.slicing import ensure_slice, ensure_iter, slice_len
 from ..metadata_sources.metadata import Metadata
 from ..metadata_sources.ome_tiff_metadata import OMETIFFMetadata
 
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
 
 class TiffDataSource(DataSource):
     """Data source for TIFF files."""
@@ -64,6 +71,9 @@ class TiffDataSource(DataSource):
         """
         #: np.ndarray: Image data
         self.image = None
+        #: str: Axes of the image series read, e.g. "ZYX".
+        self.axes = ""
+        self._pixels = None
         self._write_mode = None
         self._views = []
 
@@ -96,14 +106,41 @@ class TiffDataSource(DataSource):
     def data(self) -> npt.ArrayLike:
         """Return the image data as a numpy array.
 
+        Image data stored uncompressed and contiguously, as navigate writes it, is
+        returned as a read-only memory map. Other files are decoded into memory.
+
         Returns
         -------
         npt.ArrayLike
             Image data.
         """
         self.mode = "r"
+        if isinstance(self.pixels, np.ndarray):
+            return self.pixels
         return self.image.asarray()
 
+    @property
+    def pixels(self) -> npt.ArrayLike:
+        """Return a lazy array of the image data.
+
+        A read-only memory map if the image data can be memory mapped, otherwise a
+        zarr array that only decodes the pages it is sliced with.
+
+        Returns
+        -------
+        npt.ArrayLike
+            Image data, with the axes in self.axes.
+        """
+        self.mode = "r"
+        if self._pixels is None:
+            try:
+                self._pixels = tifffile.memmap(self.file_name, mode="r")
+            except ValueError:
+                import zarr
+
+                self._pixels = zarr.open(self.image.series[0].aszarr(), mode="r")
+        return self._pixels
+
     @property
     def is_bigtiff(self) -> bool:
         """Is this a bigtiff file?
@@ -143,15 +180,128 @@ class TiffDataSource(DataSource):
             return self.image.is_ome
 
     def read(self) -> None:
-        """Read a tiff file."""
+        """Read a tiff file.
+
+        Shapes are taken from the series metadata. No pixels are read until the
+        data are accessed.
+        """
         self.image = tifffile.TiffFile(self.file_name)
+        self._pixels = None
+        series = self.image.series[0]
+        self.dtype = series.dtype
 
         # TODO: Parse metadata
-        for i, ax in enumerate(list(self.image.series[0].axes)):
-            if ax == "Q":
-                # TODO: This is a hack for tifffile. Find a way to remove this.
-                ax = "Z"
-            setattr(self, f"shape_{ax.lower()}", self.data.shape[i])
+        # TODO: "Q" is a hack for tifffile. Find a way to remove this.
+        self.axes = series.axes.replace("Q", "Z")
+        for i, ax in enumerate(self.axes):
+            setattr(self, f"shape_{ax.lower()}", series.shape[i])
+
+    def __getitem__(self, keys):
+        """Magic method to get slice requests passed by, e.g., ds[:,2:3,...].
+
+        Order is xycztp, as in PyramidalDataSource. Only the pages that are
+        sliced are read.
+
+        Parameters
+        ----------
+        keys : tuple
+            Tuple of indices.
+
+        Returns
+        -------
+        npt.ArrayLike
+            Array of shape (z, y, x) for a single c, t and p, otherwise of shape
+            (p, t, z, c, y, x).
+        """
+        if isinstance(keys, slice) or isinstance(keys, int):
+            length = 1
+        else:
+            length = len(keys)
+
+        if length < 1 or length > 6:
+            error_statement = (
+                f"Too {'few' if length < 1 else 'many'} indices. "
+                "Indices may be (x, y, c, z, t, p)."
+            )
+            logger.error(error_statement)
+            raise IndexError(error_statement)
+
+        if length > 1 and keys[-1] == Ellipsis:
+            keys = keys[:-1]
+
+        xs = ensure_slice(keys, 0)
+        ys = ensure_slice(keys, 1)
+        cs = ensure_iter(keys, 2, self.shape_c)
+        zs = ensure_slice(keys, 3)
+        ts = ensure_iter(keys, 4, self.shape_t)
+        ps = ensure_iter(keys, 5, self.positions)
+
+        if len(cs) == 1 and len(ts) == 1 and len(ps) == 1:
+            return self.get_slice(xs, ys, cs[0], zs, ts[0], ps[0])
+
+        sliced_ds = np.empty(
+            (
+                len(ps),
+                len(ts),
+                slice_len(zs, self.shape_z),
+                len(cs),
+                slice_len(ys, self.shape_y),
+                slice_len(xs, self.shape_x),
+            ),
+            dtype=self.dtype,
+        )
+        for ci, c in enumerate(cs):
+            for ti, t in enumerate(ts):
+                for pi, p in enumerate(ps):
+                    sliced_ds[pi, ti, :, ci, :, :] = self.get_slice(xs, ys, c, zs, t, p)
+        return sliced_ds
+
+    def get_slice(self, x, y, c=0, z=0, t=0, p=0) -> npt.ArrayLike:
+        """Get a 3D slice of the dataset for a single c, t, p.
+
+        Parameters
+        ----------
+        x : int or slice
+            x indices to grab
+        y : int or slice
+            y indices to grab
+        c : int
+            Single channel
+        z : int or slice
+            z indices to grab
+        t : int
+            Single timepoint
+        p : int
+            Single position. A TIFF file holds a single position.
+
+        Returns
+        -------
+        npt.ArrayLike
+            3D (z, y, x) slice of data set
+
+        Raises
+        ------
+        IndexError
+            If c, t or p is out of range.
+        """
+        indices = {"X": x, "Y": y, "C": c, "Z": z, "T": t}
+        for ax, index in (("C", c), ("T", t), ("P", p)):
+            if index != 0 and ax not in self.axes:
+                error_statement = f"Index {index} is out of range for axis {ax}."
+                logger.error(error_statement)
+                raise IndexError(error_statement)
+
+        # Slice the lazy array in its own axes order, then reorder to ZYX.
+        key = tuple(indices.get(ax, 0) for ax in self.axes)
+        data = np.asarray(self.pixels[key])
+        axes = [
+            ax for ax in self.axes if ax in "ZYX" and isinstance(indices[ax], slice)
+        ]
+        for ax in "ZYX":
+            if ax not in axes:
+                data = data[np.newaxis]
+                axes.insert(0, ax)
+        return data.transpose([axes.index(ax) for ax in "ZYX"])
 
     def write(self, data: npt.ArrayLike, **kw) -> None:
         """Writes 2D image to the data source.
@@ -299,6 +449,7 @@ class TiffDataSource(DataSource):
                         ).encode(),
                     )
         else:
+            self._pixels = None
             self.image.close()
         if not internal:
             self._closed = True
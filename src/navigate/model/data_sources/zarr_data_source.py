@@ -31,11 +31,17 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 # Standard library imports
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
 
 # Third-party imports
 import zarr
+import numpy as np
 import numpy.typing as npt
 import zarr.storage
+from numcodecs import Blosc, blosc
 
 # Local application imports
 from .pyramidal_data_source import PyramidalDataSource
@@ -43,11 +49,26 @@ from ..metadata_sources.zarr_metadata import OMEZarrMetadata
 
 GROUP_PREFIX = "p"
 
+#: dict: Blosc shuffle modes by name.
+SHUFFLE_MODES = {
+    "none": Blosc.NOSHUFFLE,
+    "shuffle": Blosc.SHUFFLE,
+    "bitshuffle": Blosc.BITSHUFFLE,
+}
+
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
 
 class OMEZarrDataSource(PyramidalDataSource):
     """OME-Zarr data source.
 
     This class implements an OME-Zarr image data source using the Zarr v2 format.
+
+    Chunks are compressed with Blosc and span several z-planes. Planes are
+    collected in memory until a chunk is complete, and complete chunks are
+    encoded and written on a thread pool.
     """
 
     def __init__(self, file_name: str = None, mode: str = "w") -> None:
@@ -57,8 +78,145 @@ class OMEZarrDataSource(PyramidalDataSource):
         self.__store = None
         self._current_position = -1
 
+        #: str: Blosc compressor name (e.g. "lz4", "zstd"). None disables it.
+        self.compression = "lz4"
+
+        #: int: Blosc compression level, 0-9.
+        self.compression_level = 5
+
+        #: str: Blosc shuffle mode, "none", "shuffle" or "bitshuffle".
+        self.shuffle = "bitshuffle"
+
+        #: list: Number of z-planes per chunk for each pyramid level. None picks
+        # a depth that keeps the chunk size close to that of one full plane.
+        self.z_chunks = None
+
+        #: int: Number of threads used to encode and write chunks.
+        self.encoding_threads = min(4, os.cpu_count() or 1)
+
+        #: dict: Zarr arrays of the current position, by pyramid level.
+        self._arrays = {}
+
+        #: dict: Partially filled chunks, by (t, c, pyramid level).
+        self._chunk_buffers = {}
+
+        #: list: Chunk writes that have been submitted but not finished.
+        self._pending_writes = []
+
+        #: ThreadPoolExecutor: Thread pool for encoding and writing chunks.
+        self._executor = None
+
         super().__init__(file_name, mode)
 
+    @property
+    def compressor(self):
+        """Getter for the Blosc compressor used for new arrays.
+
+        Returns
+        -------
+        compressor : numcodecs.Blosc or None
+            The compressor, or None if compression is disabled.
+        """
+        if not self.compression or self.compression == "none":
+            return None
+        return Blosc(
+            cname=self.compression,
+            clevel=int(self.compression_level),
+            shuffle=SHUFFLE_MODES.get(self.shuffle, Blosc.BITSHUFFLE),
+        )
+
+    def set_compression(
+        self, compression: str = "lz4", level: int = 5, shuffle: str = "bitshuffle"
+    ) -> None:
+        """Set the compression of new arrays.
+
+        Parameters
+        ----------
+        compression : str
+            Blosc compressor name, e.g. "lz4" or "zstd". None or "none" disables
+            compression.
+        level : int
+            Compression level, 0-9.
+        shuffle : str
+            Shuffle mode, "none", "shuffle" or "bitshuffle".
+        """
+        if compression and compression != "none":
+            if compression not in blosc.list_compressors():
+                logger.warning(f"Unknown compressor {compression}. Using lz4 instead.")
+                compression = "lz4"
+        if shuffle not in SHUFFLE_MODES:
+            logger.warning(f"Unknown shuffle mode {shuffle}. Using bitshuffle.")
+            shuffle = "bitshuffle"
+        self.compression = compression
+        self.compression_level = min(max(int(level), 0), 9)
+        self.shuffle = shuffle
+
+    def set_z_chunks(self, z_chunks) -> None:
+        """Set the number of z-planes per chunk for each pyramid level.
+
+        Parameters
+        ----------
+        z_chunks : int or list
+            Chunk depth for all levels, or one depth per pyramid level. None
+            restores the default.
+        """
+        if z_chunks is None:
+            self.z_chunks = None
+            return
+        if isinstance(z_chunks, int):
+            z_chunks = [z_chunks] * self.resolutions.shape[0]
+        self.z_chunks = [max(int(zc), 1) for zc in z_chunks]
+
+    @property
+    def chunk_depths(self) -> npt.ArrayLike:
+        """Getter for the number of z-planes per chunk at each pyramid level.
+
+        By default, down-sampled levels use deeper chunks so that every chunk
+        holds about as many pixels as one full resolution plane.
+
+        Returns
+        -------
+        chunk_depths : npt.ArrayLike
+            Chunk depth for each pyramid level.
+        """
+        if self.z_chunks is None:
+            depths = np.minimum(self.resolutions[:, 0] * self.resolutions[:, 1], 32)
+        else:
+            depths = np.ones(self.resolutions.shape[0], dtype=int)
+            n = min(len(self.z_chunks), len(depths))
+            depths[:n] = self.z_chunks[:n]
+        return np.maximum(np.minimum(depths, self.shapes[:, 0]), 1).astype(int)
+
+    def set_metadata_from_configuration_experiment(
+        self, configuration: Dict[str, Any], microscope_name: str = None
+    ) -> None:
+        """Sets the metadata from according to the microscope configuration.
+
+        Reads optional compression settings from the experiment's Saving section.
+
+        Parameters
+        ----------
+        configuration : Dict[str, Any]
+            The configuration experiment.
+        microscope_name : str
+            The microscope name
+        """
+        saving_config = configuration["experiment"].get("Saving", {})
+        self.set_compression(
+            saving_config.get("compression", self.compression),
+            saving_config.get("compression_level", self.compression_level),
+            saving_config.get("shuffle", self.shuffle),
+        )
+        if "z_chunks" in saving_config:
+            z_chunks = saving_config["z_chunks"]
+            if not isinstance(z_chunks, int) and z_chunks is not None:
+                z_chunks = list(z_chunks)
+            self.set_z_chunks(z_chunks)
+
+        return super().set_metadata_from_configuration_experiment(
+            configuration, microscope_name
+        )
+
     def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0) -> npt.ArrayLike:
         """Get a 3D slice of the dataset for a single c, t, p, subdiv.
 
@@ -87,6 +245,28 @@ class OMEZarrDataSource(PyramidalDataSource):
         dataset_name = f"{GROUP_PREFIX}{p}_{subdiv}"
         return self.image[dataset_name][t, c, z, y, x]
 
+    def get_dataset(self, c, t, p, subdiv=0) -> tuple:
+        """Get the dataset holding a single c, t, p, subdiv.
+
+        Parameters
+        ----------
+        c : int
+            Single channel
+        t : int
+            Single timepoint
+        p : int
+            Single position
+        subdiv : int
+            Subdivision of the dataset to index along
+
+        Returns
+        -------
+        tuple
+            The (t, c, z, y, x) array of the position and subdivision, and the
+            (t, c) index prefix.
+        """
+        return self.image[f"{GROUP_PREFIX}{p}_{subdiv}"], (t, c)
+
     def setup(self):
         """Set up the Zarr writer."""
         # Use FSStore as a universal backend
@@ -95,6 +275,8 @@ class OMEZarrDataSource(PyramidalDataSource):
         #: zarr.group: Zarr group object for the image data source.
         self.image = zarr.group(store=self.__store, overwrite=True)
         self._current_position = -1
+        self._arrays = {}
+        self._chunk_buffers = {}
 
     def new_position(self, pos, view):
         """Create new arrays on the fly for each position in self.positions.
@@ -108,6 +290,8 @@ class OMEZarrDataSource(PyramidalDataSource):
         """
         name = f"{GROUP_PREFIX}{pos}"
         paths = []
+        self._arrays = {}
+        chunk_depths = self.chunk_depths
         # Create the subdivisions...
         for si, zyx_shape in enumerate(self.shapes):
             shape = tuple([self.shape_t, self.shape_c] + list(zyx_shape))
@@ -115,12 +299,14 @@ class OMEZarrDataSource(PyramidalDataSource):
             arr = self.image.create(
                 name=setup,
                 shape=shape,
-                chunks=(1,) * len(shape[:-2]) + shape[-2:],
+                chunks=(1, 1, int(chunk_depths[si])) + shape[-2:],
                 dtype=self.dtype,
+                compressor=self.compressor,
             )
             # xarray multidim
             paths.append(arr.path)
             arr.attrs["_ARRAY_DIMENSIONS"] = shape
+            self._arrays[si] = arr
 
         # Append setup to multiscales
         scales = self.image.attrs.get("multiscales", [])
@@ -150,36 +336,138 @@ class OMEZarrDataSource(PyramidalDataSource):
         )  # find current channel
 
         if self._current_position != p:
+            # Chunks of the previous position go to the previous arrays
+            for key in list(self._chunk_buffers.keys()):
+                self._flush_chunk(key)
             self._current_position = p
             if len(kw) > 0:
                 self.new_position(p, kw)
             else:
                 self.new_position(p)
 
+        chunk_depths = self.chunk_depths
+        planes = self.downsample(data, z, (t, c, p))
         for ri, res in enumerate(self.resolutions):
-            dx, dy, dz = res
-            dataset_name = f"{GROUP_PREFIX}{p}_{ri}"
+            dz = res[2]
             zs = min(z // dz, self.shapes[ri, 0] - 1)
-            self.image[dataset_name][t, c, zs, ...] = data[::dy, ::dx].astype(
-                self.dtype
-            )
+            z_start = zs - zs % chunk_depths[ri]
+            z_end = min(z_start + chunk_depths[ri], self.shapes[ri, 0])
+
+            key = (t, c, ri)
+            if key not in self._chunk_buffers:
+                self._chunk_buffers[key] = (
+                    z_start,
+                    np.zeros(
+                        (z_end - z_start,) + tuple(self.shapes[ri, 1:]),
+                        dtype=self.dtype,
+                    ),
+                )
+            if planes[ri] is not None:
+                buffer = self._chunk_buffers[key][1]
+                buffer[zs - z_start, ...] = planes[ri]
+
+            # Flush once the last full resolution plane of this chunk arrived
+            if z == min(z_end * dz, self.shape_z) - 1:
+                self._flush_chunk(key)
 
         self._current_frame += 1
 
+    def _flush_chunk(self, key) -> None:
+        """Hand a buffered chunk over to the thread pool for writing.
+
+        Parameters
+        ----------
+        key : tuple
+            (t, c, pyramid level) of the buffered chunk.
+        """
+        t, c, ri = key
+        z_start, buffer = self._chunk_buffers.pop(key)
+        arr = self._arrays[ri]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.encoding_threads,
+                thread_name_prefix="OMEZarrWriter",
+            )
+
+        # Bound the number of chunks held in memory
+        while len(self._pending_writes) >= 2 * self.encoding_threads:
+            self._pending_writes.pop(0).result()
+
+        self._pending_writes.append(
+            self._executor.submit(self._write_chunk, arr, t, c, z_start, buffer)
+        )
+
+    @staticmethod
+    def _write_chunk(arr, t, c, z_start, buffer) -> None:
+        """Encode and store one chunk.
+
+        Parameters
+        ----------
+        arr : zarr.Array
+            Array to write to.
+        t : int
+            Timepoint
+        c : int
+            Channel
+        z_start : int
+            First z index of the chunk.
+        buffer : npt.ArrayLike
+            (z, y, x) data of the chunk.
+        """
+        arr[t, c, z_start : z_start + buffer.shape[0], ...] = buffer
+
+    def _finish_writes(self) -> None:
+        """Write all buffered chunks and wait until the thread pool is done."""
+        for key in list(self._chunk_buffers.keys()):
+            self._flush_chunk(key)
+        try:
+            while self._pending_writes:
+                self._pending_writes.pop(0).result()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
     def read(self) -> None:
         """Reads data from the image file."""
         self.mode = "r"
         self.__store = zarr.storage.FSStore(self.file_name, mode=self.mode)
         self.image = zarr.group(store=self.__store)
-        # TODO: parse the image metadata
-        self.get_shape_from_metadata()
+
+        # Arrays are named p{position}_{pyramid level} and shaped (t, c, z, y, x)
+        positions = 0
+        while f"{GROUP_PREFIX}{positions}_0" in self.image:
+            positions += 1
+        if positions == 0:
+            logger.warning(f"No image arrays found in {self.file_name}.")
+            self.get_shape_from_metadata()
+            return
+
+        levels = 0
+        while f"{GROUP_PREFIX}0_{levels}" in self.image:
+            levels += 1
+        arrays = [self.image[f"{GROUP_PREFIX}0_{i}"] for i in range(levels)]
+        (
+            self.shape_t,
+            self.shape_c,
+            self.shape_z,
+            self.shape_y,
+            self.shape_x,
+        ) = arrays[0].shape
+        self.positions = positions
+        self.dtype = arrays[0].dtype
+        self.bits = self.dtype.itemsize * 8
+        self._shapes = np.array([arr.shape[2:] for arr in arrays], dtype=int)
 
     def close(self) -> None:
         """Close the image file."""
+        self._shutdown_reads()
         if self._closed:
             if self.__store is not None:
                 self.__store = None
             return
+        self._finish_writes()
         self._check_shape(self._current_frame - 1, self.metadata.per_stack)
         self.__store.close()
         self._closed = True
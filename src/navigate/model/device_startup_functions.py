@@ -32,8 +32,11 @@
 # Standard Library Imports
 import platform
 import logging
+import threading
 import time
 import importlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from multiprocessing.managers import ListProxy
 from typing import Callable, Tuple, Any, Type, Dict, Optional
 
@@ -138,6 +141,12 @@ class SerialConnectionFactory:
 
     _connections = {}
 
+    #: threading.Lock: Lock of the port locks.
+    _lock = threading.Lock()
+
+    #: dict: Lock of each port, so a port is only connected once.
+    _port_locks = {}
+
     @classmethod
     def build_connection(
         cls,
@@ -173,14 +182,158 @@ class SerialConnectionFactory:
             raised.
         """
         port = args[0]
-        if str(port) not in cls._connections:
-            cls._connections[str(port)] = auto_redial(
-                build_connection_function, args, exception=exception
-            )
+        with cls._lock:
+            port_lock = cls._port_locks.setdefault(str(port), threading.Lock())
+        with port_lock:
+            if str(port) not in cls._connections:
+                cls._connections[str(port)] = auto_redial(
+                    build_connection_function, args, exception=exception
+                )
 
         return cls._connections[str(port)]
 
 
+def get_startup_dependencies(resources: Dict[Any, Any]) -> Dict[Any, list]:
+    """Build the dependency graph of the device startup tasks.
+
+    Tasks using the same resource, e.g. a serial port or the DAQ, run one after
+    the other in the order they are listed, so the first one opens the shared
+    connection. Tasks without a resource don't depend on anything.
+
+    Parameters
+    ----------
+    resources : Dict[Any, Any]
+        Resource of each task, or None, in startup order.
+
+    Returns
+    -------
+    dependencies : Dict[Any, list]
+        Names of the tasks each task waits for.
+    """
+    dependencies = {}
+    last_task = {}
+    for name, resource in resources.items():
+        dependencies[name] = []
+        if resource is None:
+            continue
+        if resource in last_task:
+            dependencies[name].append(last_task[resource])
+        last_task[resource] = name
+    return dependencies
+
+
+def start_devices_concurrently(
+    tasks: Dict[Any, Callable[[], Any]],
+    dependencies: Optional[Dict[Any, list]] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[Any, Any], Dict[Any, float]]:
+    """Run device startup tasks concurrently.
+
+    A task starts once all the tasks it depends on have finished. If a task
+    fails, no new tasks are started, and the error is raised once the running
+    tasks have finished.
+
+    Parameters
+    ----------
+    tasks : Dict[Any, Callable[[], Any]]
+        Startup function of each task.
+    dependencies : Optional[Dict[Any, list]]
+        Names of the tasks each task waits for. Default is None.
+    max_workers : Optional[int]
+        Maximum number of devices started at once. Default is one per task.
+
+    Returns
+    -------
+    results : Dict[Any, Any]
+        Result of each task.
+    timings : Dict[Any, float]
+        Time in seconds each task took.
+
+    Raises
+    ------
+    ValueError
+        If the dependencies can't be satisfied.
+    """
+    if dependencies is None:
+        dependencies = {}
+    for name, names in dependencies.items():
+        for dependency in names:
+            if dependency not in tasks:
+                raise ValueError(f"Startup task {name} depends on unknown {dependency}")
+
+    def run(name):
+        start_time = time.perf_counter()
+        try:
+            return tasks[name]()
+        finally:
+            timings[name] = time.perf_counter() - start_time
+            logger.info(f"Started {name} in {timings[name]:.3f} s")
+
+    results, timings = {}, {}
+    pending = list(tasks)
+    running = {}
+    error = None
+    with ThreadPoolExecutor(
+        max_workers=max_workers or max(1, len(tasks)),
+        thread_name_prefix="DeviceStartup",
+    ) as executor:
+        while pending or running:
+            if error is None:
+                for name in [
+                    name
+                    for name in pending
+                    if all(d in results for d in dependencies.get(name, []))
+                ]:
+                    pending.remove(name)
+                    running[executor.submit(run, name)] = name
+
+            if not running:
+                if error is None:
+                    raise ValueError(
+                        f"Startup tasks {pending} have circular dependencies"
+                    )
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to start {name}: {e}")
+                    if error is None:
+                        error = e
+
+    if error is not None:
+        raise error
+
+    return results, timings
+
+
+def format_startup_report(timings: Dict[Any, float], total_time: float) -> str:
+    """Format the device startup times, slowest first.
+
+    Parameters
+    ----------
+    timings : Dict[Any, float]
+        Time in seconds each device took to start.
+    total_time : float
+        Time in seconds all the devices took to start.
+
+    Returns
+    -------
+    report : str
+        The startup timing report.
+    """
+    lines = [
+        f"Device startup took {total_time:.3f} s "
+        f"({sum(timings.values()):.3f} s if started one after the other)"
+    ]
+    for name, duration in sorted(timings.items(), key=lambda v: v[1], reverse=True):
+        lines.append(f"    {name}: {duration:.3f} s")
+    return "\n".join(lines)
+
+
 def load_camera_connection(
     configuration: Dict[str, Any], camera_id: int = 0, is_synthetic: bool = False
 ) -> Any:
@@ -444,202 +597,202 @@ def load_stages(
     Stage : Any
         Stage class.
     """
-    if plugin_devices is None:
-        plugin_devices = {}
-
-    stage_devices = []
-
     stages = configuration["configuration"]["hardware"]["stage"]
 
     if type(stages) != ListProxy:
         stages = [stages]
 
-    for i in range(len(stages)):
-        stage_config = configuration["configuration"]["hardware"]["stage"][i]
-        if is_synthetic:
-            stage_type = "SyntheticStage"
+    return [
+        load_stage_connection(configuration, i, is_synthetic, plugin_devices)
+        for i in range(len(stages))
+    ]
 
-        else:
-            stage_type = stage_config["type"]
-
-        if stage_type == "PI" and platform.system() == "Windows":
-            from navigate.model.devices.stages.pi import build_PIStage_connection
-            from pipython.pidevice.gcserror import GCSError
-
-            stage_devices.append(
-                auto_redial(
-                    build_PIStage_connection,
-                    (
-                        stage_config["controllername"],
-                        stage_config["serial_number"],
-                        stage_config["stages"],
-                        stage_config["refmode"],
-                    ),
-                    exception=GCSError,
-                )
-            )
 
-        elif stage_type == "MP285" and platform.system() == "Windows":
-            from navigate.model.devices.stages.sutter import (
-                build_MP285_connection,
-            )
+def load_stage_connection(
+    configuration: Dict[str, Any],
+    stage_id: int = 0,
+    is_synthetic: bool = False,
+    plugin_devices: Optional[Dict] = None,
+) -> Any:
+    """Initialize the connection of a stage.
 
-            stage_devices.append(
-                SerialConnectionFactory.build_connection(
-                    build_MP285_connection,
-                    (
-                        stage_config["port"],
-                        stage_config["baudrate"],
-                        stage_config["timeout"],
-                    ),
-                    exception=UserWarning,
-                )
-            )
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Global configuration of the microscope
+    stage_id : int
+        Index of the stage in the hardware configuration. Default is 0.
+    is_synthetic : bool
+        Run synthetic version of hardware. Default is False.
+    plugin_devices : Optional[Dict]
+        Dictionary of plugin devices. Default is None.
 
-        elif stage_type == "Thorlabs" and platform.system() == "Windows":
-            from navigate.model.devices.stages.tl_kcube_inertial import (
-                build_TLKIMStage_connection,
-            )
-            from navigate.model.devices.APIs.thorlabs.kcube_inertial import (
-                TLFTDICommunicationError,
-            )
+    Returns
+    -------
+    Stage : Any
+        Stage connection.
+    """
+    if plugin_devices is None:
+        plugin_devices = {}
 
-            stage_devices.append(
-                auto_redial(
-                    build_TLKIMStage_connection,
-                    (stage_config["serial_number"],),
-                    exception=TLFTDICommunicationError,
-                )
-            )
+    stage_config = configuration["configuration"]["hardware"]["stage"][stage_id]
+    if is_synthetic:
+        stage_type = "SyntheticStage"
 
-        elif stage_type == "KST101":
-            from navigate.model.devices.stages.tl_kcube_steppermotor import (
-                build_TLKSTStage_connection,
-            )
+    else:
+        stage_type = stage_config["type"]
 
-            stage_devices.append(
-                auto_redial(
-                    build_TLKSTStage_connection,
-                    (stage_config["serial_number"],),
-                    exception=Exception,
-                )
-            )
+    if stage_type == "PI" and platform.system() == "Windows":
+        from navigate.model.devices.stages.pi import build_PIStage_connection
+        from pipython.pidevice.gcserror import GCSError
 
-        elif stage_type == "MCL" and platform.system() == "Windows":
-            from navigate.model.devices.stages.mcl import (
-                build_MCLStage_connection,
-            )
-            from navigate.model.devices.APIs.mcl.madlib import MadlibError
+        return auto_redial(
+            build_PIStage_connection,
+            (
+                stage_config["controllername"],
+                stage_config["serial_number"],
+                stage_config["stages"],
+                stage_config["refmode"],
+            ),
+            exception=GCSError,
+        )
 
-            stage_devices.append(
-                auto_redial(
-                    build_MCLStage_connection,
-                    (stage_config["serial_number"],),
-                    exception=MadlibError,
-                )
-            )
+    elif stage_type == "MP285" and platform.system() == "Windows":
+        from navigate.model.devices.stages.sutter import (
+            build_MP285_connection,
+        )
 
-        elif stage_type == "ASI" and platform.system() == "Windows":
-            """Filter wheel can be controlled from the same Tiger Controller. If
-            so, then we will load this as a shared device. If not, we will create the
-            connection to the Tiger Controller.
-            """
-            from navigate.model.devices.stages.asi import (
-                build_ASI_Stage_connection,
-            )
-            from navigate.model.devices.APIs.asi.asi_tiger_controller import (
-                TigerException,
-            )
+        return SerialConnectionFactory.build_connection(
+            build_MP285_connection,
+            (
+                stage_config["port"],
+                stage_config["baudrate"],
+                stage_config["timeout"],
+            ),
+            exception=UserWarning,
+        )
 
-            stage_devices.append(
-                SerialConnectionFactory.build_connection(
-                    build_ASI_Stage_connection,
-                    (
-                        stage_config["port"],
-                        stage_config["baudrate"],
-                    ),
-                    exception=TigerException,
-                )
-            )
+    elif stage_type == "Thorlabs" and platform.system() == "Windows":
+        from navigate.model.devices.stages.tl_kcube_inertial import (
+            build_TLKIMStage_connection,
+        )
+        from navigate.model.devices.APIs.thorlabs.kcube_inertial import (
+            TLFTDICommunicationError,
+        )
 
-        elif stage_type == "MS2000" and platform.system() == "Windows":
-            """Filter wheel can be controlled from the same Controller. If
-            so, then we will load this as a shared device. If not, we will create the
-            connection to the Controller.
+        return auto_redial(
+            build_TLKIMStage_connection,
+            (stage_config["serial_number"],),
+            exception=TLFTDICommunicationError,
+        )
 
-            TODO: Evaluate whether MS2000 should be able to operate as a shared device.
-            """
+    elif stage_type == "KST101":
+        from navigate.model.devices.stages.tl_kcube_steppermotor import (
+            build_TLKSTStage_connection,
+        )
 
-            from navigate.model.devices.stages.asi_MSTwoThousand import (
-                build_ASI_Stage_connection,
-            )
-            from navigate.model.devices.APIs.asi.asi_MS2000_controller import (
-                MS2000Exception,
-            )
+        return auto_redial(
+            build_TLKSTStage_connection,
+            (stage_config["serial_number"],),
+            exception=Exception,
+        )
 
-            stage_devices.append(
-                SerialConnectionFactory.build_connection(
-                    build_ASI_Stage_connection,
-                    (
-                        stage_config["port"],
-                        stage_config["baudrate"],
-                    ),
-                    exception=MS2000Exception,
-                )
-            )
+    elif stage_type == "MCL" and platform.system() == "Windows":
+        from navigate.model.devices.stages.mcl import (
+            build_MCLStage_connection,
+        )
+        from navigate.model.devices.APIs.mcl.madlib import MadlibError
 
-        elif stage_type == "MFC2000" and platform.system() == "Windows":
-            """Filter wheel can be controlled from the same Tiger Controller. If
-            so, then we will load this as a shared device. If not, we will create the
-            connection to the Tiger Controller.
+        return auto_redial(
+            build_MCLStage_connection,
+            (stage_config["serial_number"],),
+            exception=MadlibError,
+        )
 
-            TODO: Evaluate whether MFC2000 should be able to operate as a shared device.
-            """
-            from navigate.model.devices.stages.asi_MFCTwoThousand import (
-                build_ASI_Stage_connection,
-            )
-            from navigate.model.devices.APIs.asi.asi_tiger_controller import (
-                TigerException,
-            )
+    elif stage_type == "ASI" and platform.system() == "Windows":
+        """Filter wheel can be controlled from the same Tiger Controller. If
+        so, then we will load this as a shared device. If not, we will create the
+        connection to the Tiger Controller.
+        """
+        from navigate.model.devices.stages.asi import (
+            build_ASI_Stage_connection,
+        )
+        from navigate.model.devices.APIs.asi.asi_tiger_controller import (
+            TigerException,
+        )
 
-            stage_devices.append(
-                SerialConnectionFactory.build_connection(
-                    build_ASI_Stage_connection,
-                    (
-                        stage_config["port"],
-                        stage_config["baudrate"],
-                    ),
-                    exception=TigerException,
-                )
-            )
+        return SerialConnectionFactory.build_connection(
+            build_ASI_Stage_connection,
+            (
+                stage_config["port"],
+                stage_config["baudrate"],
+            ),
+            exception=TigerException,
+        )
 
-        elif stage_type == "GalvoNIStage" and platform.system() == "Windows":
-            stage_devices.append(DummyDeviceConnection())
+    elif stage_type == "MS2000" and platform.system() == "Windows":
+        """Filter wheel can be controlled from the same Controller. If
+        so, then we will load this as a shared device. If not, we will create the
+        connection to the Controller.
 
-        elif (
-            stage_type.lower() == "syntheticstage" or stage_type.lower() == "synthetic"
-        ):
-            stage_devices.append(DummyDeviceConnection())
+        TODO: Evaluate whether MS2000 should be able to operate as a shared device.
+        """
 
-        elif "stage" in plugin_devices:
-            is_found = False
-            for load_function in plugin_devices["stage"]["load_device"]:
-                try:
-                    device_connection = load_function(
-                        stage_config, is_synthetic, device_type="stage"
-                    )
-                    stage_devices.append(device_connection)
-                    is_found = True
-                    break
-                except RuntimeError:
-                    continue
-            if not is_found:
-                device_not_found(stage_type)
+        from navigate.model.devices.stages.asi_MSTwoThousand import (
+            build_ASI_Stage_connection,
+        )
+        from navigate.model.devices.APIs.asi.asi_MS2000_controller import (
+            MS2000Exception,
+        )
 
-        else:
-            device_not_found(stage_type)
+        return SerialConnectionFactory.build_connection(
+            build_ASI_Stage_connection,
+            (
+                stage_config["port"],
+                stage_config["baudrate"],
+            ),
+            exception=MS2000Exception,
+        )
 
-    return stage_devices
+    elif stage_type == "MFC2000" and platform.system() == "Windows":
+        """Filter wheel can be controlled from the same Tiger Controller. If
+        so, then we will load this as a shared device. If not, we will create the
+        connection to the Tiger Controller.
+
+        TODO: Evaluate whether MFC2000 should be able to operate as a shared device.
+        """
+        from navigate.model.devices.stages.asi_MFCTwoThousand import (
+            build_ASI_Stage_connection,
+        )
+        from navigate.model.devices.APIs.asi.asi_tiger_controller import (
+            TigerException,
+        )
+
+        return SerialConnectionFactory.build_connection(
+            build_ASI_Stage_connection,
+            (
+                stage_config["port"],
+                stage_config["baudrate"],
+            ),
+            exception=TigerException,
+        )
+
+    elif stage_type == "GalvoNIStage" and platform.system() == "Windows":
+        return DummyDeviceConnection()
+
+    elif stage_type.lower() == "syntheticstage" or stage_type.lower() == "synthetic":
+        return DummyDeviceConnection()
+
+    elif "stage" in plugin_devices:
+        for load_function in plugin_devices["stage"]["load_device"]:
+            try:
+                return load_function(stage_config, is_synthetic, device_type="stage")
+            except RuntimeError:
+                continue
+        device_not_found(stage_type)
+
+    else:
+        device_not_found(stage_type)
 
 
 def start_stage(
@@ -1509,82 +1662,152 @@ def load_devices(
     if plugin_devices is None:
         plugin_devices = {}
 
-    devices = {}
-    # load camera
-    if "camera" in configuration["configuration"]["hardware"].keys():
-        devices["camera"] = {}
-        for id, device in enumerate(
-            configuration["configuration"]["hardware"]["camera"]
-        ):
-            try:
-                camera = load_camera_connection(configuration, id, is_synthetic)
-            except RuntimeError as e:  # noqa
-                if "camera" in plugin_devices:
-                    camera = plugin_devices["camera"]["load_device"](
-                        configuration, id, is_synthetic
-                    )
-                else:
-                    error_statement = f"Error loading camera: {e}"
-                    logger.error(error_statement)
-                    raise Exception(error_statement)
-
-            if (not is_synthetic) and device["type"].startswith("Hamamatsu"):
-                camera_serial_number = str(camera._serial_number)
-                device_ref_name = camera_serial_number
-                # if the serial number has leading zeros,
-                # the yaml reader will convert it to an octal number
-                if camera_serial_number.startswith("0"):
-                    try:
-                        oct_num = int(camera_serial_number, 8)
-                        device_ref_name = str(oct_num)
-                    except ValueError:
-                        logger.debug("Error converting camera serial number to octal")
-                        pass
+    hardware = configuration["configuration"]["hardware"]
+    tasks, resources = {}, {}
+
+    def add_task(name, func, resource=None):
+        tasks[name] = func
+        # synthetic devices don't share any hardware
+        resources[name] = None if is_synthetic else resource
+
+    def load_camera(id, device):
+        try:
+            camera = load_camera_connection(configuration, id, is_synthetic)
+        except RuntimeError as e:  # noqa
+            if "camera" in plugin_devices:
+                camera = plugin_devices["camera"]["load_device"](
+                    configuration, id, is_synthetic
+                )
             else:
-                device_ref_name = str(device["serial_number"])
-            devices["camera"][device_ref_name] = camera
+                error_statement = f"Error loading camera: {e}"
+                logger.error(error_statement)
+                raise Exception(error_statement)
+
+        if (not is_synthetic) and device["type"].startswith("Hamamatsu"):
+            camera_serial_number = str(camera._serial_number)
+            device_ref_name = camera_serial_number
+            # if the serial number has leading zeros,
+            # the yaml reader will convert it to an octal number
+            if camera_serial_number.startswith("0"):
+                try:
+                    oct_num = int(camera_serial_number, 8)
+                    device_ref_name = str(oct_num)
+                except ValueError:
+                    logger.debug("Error converting camera serial number to octal")
+                    pass
+        else:
+            device_ref_name = str(device["serial_number"])
+        return device_ref_name, camera
+
+    # The DAQ is listed first, so the devices it is shared with start after it.
+    # Devices on the same serial port start one after the other, as do devices
+    # using the same vendor library.
+    if "daq" in hardware.keys():
+        add_task("daq", partial(start_daq, configuration, is_synthetic), "daq")
+
+    # load camera
+    camera_tasks = []
+    if "camera" in hardware.keys():
+        for id, device in enumerate(hardware["camera"]):
+            camera_tasks.append(f"camera {id}")
+            add_task(
+                camera_tasks[-1],
+                partial(load_camera, id, device),
+                device.get("type", None),
+            )
 
     # load mirror
-    if "mirror" in configuration["configuration"]["hardware"].keys():
-        devices["mirror"] = {}
-        device = configuration["configuration"]["hardware"]["mirror"]
-        device_ref_name = build_ref_name("_", device["type"])
-        devices["mirror"][device_ref_name] = load_mirror(configuration, is_synthetic)
+    if "mirror" in hardware.keys():
+        device = hardware["mirror"]
+        mirror_ref_name = build_ref_name("_", device["type"])
+        add_task(
+            f"mirror {mirror_ref_name}",
+            partial(load_mirror, configuration, is_synthetic),
+        )
 
     # load zoom
-    if "zoom" in configuration["configuration"]["hardware"].keys():
-        devices["zoom"] = {}
-        device = configuration["configuration"]["hardware"]["zoom"]
-        device_ref_name = build_ref_name("_", device["type"], device["servo_id"])
-        devices["zoom"][device_ref_name] = load_zoom_connection(
-            configuration, is_synthetic, plugin_devices
+    if "zoom" in hardware.keys():
+        device = hardware["zoom"]
+        zoom_ref_name = build_ref_name("_", device["type"], device["servo_id"])
+        add_task(
+            f"zoom {zoom_ref_name}",
+            partial(load_zoom_connection, configuration, is_synthetic, plugin_devices),
+            device.get("port", None),
         )
 
-    # load daq
-    if "daq" in configuration["configuration"]["hardware"].keys():
-        devices["daq"] = start_daq(configuration, is_synthetic)
-
     # load filter wheels
-    if "filter_wheel" in configuration["configuration"]["hardware"].keys():
-        devices["filter_wheel"] = {}
-        filter_wheels = configuration["configuration"]["hardware"]["filter_wheel"]
-        for i, filter_wheel_config in enumerate(filter_wheels):
+    filter_wheel_tasks = {}
+    if "filter_wheel" in hardware.keys():
+        for filter_wheel_config in hardware["filter_wheel"]:
             device_ref_name = build_ref_name(
                 "_", filter_wheel_config["type"], filter_wheel_config["wheel_number"]
             )
-            devices["filter_wheel"][device_ref_name] = load_filter_wheel_connection(
-                filter_wheel_config, is_synthetic, plugin_devices
+            filter_wheel_tasks[device_ref_name] = f"filter_wheel {device_ref_name}"
+            add_task(
+                filter_wheel_tasks[device_ref_name],
+                partial(
+                    load_filter_wheel_connection,
+                    filter_wheel_config,
+                    is_synthetic,
+                    plugin_devices,
+                ),
+                filter_wheel_config.get(
+                    "port", "daq" if filter_wheel_config["type"] == "NI" else None
+                ),
             )
 
     # load stage
-    if "stage" in configuration["configuration"]["hardware"].keys():
-        device_config = configuration["configuration"]["hardware"]["stage"]
-        devices["stages"] = {}
-        stages = load_stages(configuration, is_synthetic, plugin_devices)
-        for i, stage in enumerate(stages):
+    stage_tasks = {}
+    if "stage" in hardware.keys():
+        device_config = hardware["stage"]
+        if type(device_config) != ListProxy:
+            device_config = [device_config]
+        for i, stage_config in enumerate(device_config):
             device_ref_name = build_ref_name(
-                "_", device_config[i]["type"], device_config[i]["serial_number"]
+                "_", stage_config["type"], stage_config["serial_number"]
+            )
+            stage_tasks[device_ref_name] = f"stage {device_ref_name}"
+            if "port" in stage_config:
+                resource = stage_config["port"]
+            elif stage_config["type"] == "GalvoNIStage":
+                resource = "daq"
+            else:
+                resource = stage_config["type"]
+            add_task(
+                stage_tasks[device_ref_name],
+                partial(
+                    load_stage_connection,
+                    configuration,
+                    i,
+                    is_synthetic,
+                    plugin_devices,
+                ),
+                resource,
             )
-            devices["stages"][device_ref_name] = stage
+
+    start_time = time.perf_counter()
+    results, timings = start_devices_concurrently(
+        tasks, get_startup_dependencies(resources)
+    )
+    logger.info(format_startup_report(timings, time.perf_counter() - start_time))
+
+    devices = {}
+    if "camera" in hardware.keys():
+        devices["camera"] = dict(results[name] for name in camera_tasks)
+    if "mirror" in hardware.keys():
+        devices["mirror"] = {mirror_ref_name: results[f"mirror {mirror_ref_name}"]}
+    if "zoom" in hardware.keys():
+        devices["zoom"] = {zoom_ref_name: results[f"zoom {zoom_ref_name}"]}
+    if "daq" in hardware.keys():
+        devices["daq"] = results["daq"]
+    if "filter_wheel" in hardware.keys():
+        devices["filter_wheel"] = {
+            ref_name: results[name] for ref_name, name in filter_wheel_tasks.items()
+        }
+    if "stage" in hardware.keys():
+        devices["stages"] = {
+            ref_name: results[name] for ref_name, name in stage_tasks.items()
+        }
+    devices["__startup_timings__"] = timings
 
     return devices
@@ -32,15 +32,18 @@
 
 # Standard Library Imports
 import logging
+import os
+import queue
+import threading
 import time
 import ctypes
 
 # Third Party Imports
 import numpy as np
-from tifffile import TiffFile, TiffFileError
 
 # Local Imports
 from navigate.model.analysis import camera
+from navigate.model.data_sources import get_data_source, get_file_type
 from navigate.model.devices.camera.base import CameraBase
 from navigate.tools.decorators import log_initialization
 
@@ -48,6 +51,171 @@ from navigate.tools.decorators import log_initialization
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: int: Number of frames read ahead of the camera during replay.
+PREFETCH_FRAMES = 8
+
+#: int: Number of precomputed noise frames.
+NOISE_POOL_SIZE = 8
+
+
+def fit_frame(frame, shape):
+    """Crop or zero-pad a 2D frame to the camera frame shape.
+
+    Parameters
+    ----------
+    frame : npt.ArrayLike
+        2D image.
+    shape : tuple
+        (y, x) shape of the camera frame.
+
+    Returns
+    -------
+    npt.ArrayLike
+        C-contiguous uint16 image of the given shape.
+    """
+    frame = np.asarray(frame)
+    if frame.shape == tuple(shape) and frame.dtype == np.uint16:
+        return np.ascontiguousarray(frame)
+    fitted = np.zeros(shape, dtype=np.uint16)
+    height = min(shape[0], frame.shape[0])
+    width = min(shape[1], frame.shape[1])
+    fitted[:height, :width] = frame[:height, :width]
+    return fitted
+
+
+class FrameReplay:
+    """Stream frames from image files or arrays on a background thread.
+
+    Frames are read lazily, in acquisition order, and held in a bounded queue so
+    that only a few frames are in memory at a time. Files may be of any type in
+    navigate.model.data_sources.FILE_TYPES.
+    """
+
+    def __init__(self, sources, frame_shape, buffer_size=PREFETCH_FRAMES, loop=True):
+        """Initialize FrameReplay class.
+
+        Parameters
+        ----------
+        sources : list
+            File names, or arrays of shape (z, y, x) or (y, x).
+        frame_shape : tuple
+            (y, x) shape of the camera frame.
+        buffer_size : int
+            Maximum number of frames read ahead.
+        loop : bool
+            Start again from the first source once all frames are streamed.
+        """
+        #: list: File names or arrays to stream frames from.
+        self.sources = list(sources)
+
+        #: tuple: (y, x) shape of the streamed frames.
+        self.frame_shape = tuple(frame_shape)
+
+        #: bool: Start again from the first source at the end.
+        self.loop = loop
+
+        #: queue.Queue: Frames read ahead of the camera.
+        self.frames = queue.Queue(maxsize=max(int(buffer_size), 1))
+
+        #: bool: Whether all frames have been streamed.
+        self.finished = False
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start reading frames on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.finished = False
+        self._thread = threading.Thread(
+            target=self._prefetch, name="FrameReplay", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and drop the frames read ahead."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        while not self.frames.empty():
+            self.frames.get_nowait()
+
+    def next_frame(self, timeout=1.0):
+        """Get the next frame.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the frame to be read.
+
+        Returns
+        -------
+        frame : npt.ArrayLike or None
+            uint16 image of shape frame_shape, or None if no frame is available.
+        """
+        if self.finished and self.frames.empty():
+            return None
+        try:
+            frame = self.frames.get(timeout=timeout)
+        except queue.Empty:
+            logger.debug("Replay frame was not read in time.")
+            return None
+        return fit_frame(frame, self.frame_shape)
+
+    def iter_frames(self):
+        """Iterate over the frames of all sources once.
+
+        Yields
+        ------
+        frame : npt.ArrayLike
+            2D image.
+        """
+        for source in self.sources:
+            if not isinstance(source, (str, os.PathLike)):
+                source = np.asarray(source)
+                yield from source.reshape((-1,) + source.shape[-2:])
+                continue
+            try:
+                ds = get_data_source(get_file_type(source))(source, "r")
+            except Exception as e:
+                logger.warning(f"Could not open {source} for replay: {e}")
+                continue
+            try:
+                for p in range(ds.positions):
+                    for t in range(ds.shape_t):
+                        for c in range(ds.shape_c):
+                            for z in range(ds.shape_z):
+                                # Copy, so the plane is read on this thread
+                                yield np.array(ds[:, :, c, z, t, p][0])
+            finally:
+                ds.close()
+
+    def _prefetch(self):
+        """Read frames into the queue until stopped or out of frames."""
+        try:
+            while not self._stop_event.is_set():
+                count = 0
+                for frame in self.iter_frames():
+                    frame = fit_frame(frame, self.frame_shape)
+                    count += 1
+                    while not self._stop_event.is_set():
+                        try:
+                            self.frames.put(frame, timeout=0.1)
+                            break
+                        except queue.Full:
+                            pass
+                    if self._stop_event.is_set():
+                        return
+                if count == 0 or not self.loop:
+                    break
+        except Exception as e:
+            logger.exception(f"Frame replay stopped: {e}")
+        finally:
+            self.finished = True
+
 
 @log_initialization
 class SyntheticCameraController:
@@ -136,6 +304,19 @@ class SyntheticCamera(CameraBase):
         #: bool: whether to use random image
         self.random_image = True
 
+        #: FrameReplay: Frames streamed from image files, if any are loaded.
+        self.replay = None
+
+        #: float: Seconds between frames. None paces frames by the exposure time,
+        # 0 generates frames as fast as they are triggered.
+        self.frame_interval = None
+
+        #: npt.ArrayLike: Precomputed noise frames.
+        self.noise_pool = None
+
+        #: float: Time at which the next frame is due.
+        self._next_frame_time = None
+
         #: int: serial number
         self.serial_number = "synthetic"
 
@@ -168,7 +349,8 @@ class SyntheticCamera(CameraBase):
 
     def close_camera(self):
         """Close SyntheticCamera Camera"""
-        pass
+        if self.replay is not None:
+            self.replay.stop()
 
     def set_sensor_mode(self, mode):
         """Set SyntheticCamera sensor mode.
@@ -233,6 +415,9 @@ class SyntheticCamera(CameraBase):
         self.current_frame_idx = 0
         self.pre_frame_idx = 0
         self.is_acquiring = True
+        self._next_frame_time = None
+        if self.random_image:
+            self.update_noise_pool()
 
     def close_image_series(self):
         """Close image series.
@@ -244,58 +429,58 @@ class SyntheticCamera(CameraBase):
         self.is_acquiring = False
 
     def load_images(self, filenames=None, ds=None):
-        """Pre-populate the buffer with images. Can either come from TIFF files or
-        Numpy stacks."""
-        self.random_image = False
-        #: int: current image id
-        self.img_id = 0
-        #: int: current tif id
-        self.current_tif_id = 0
-        #: list: list of tif images
-        self.tif_images = []
-        idx = 0
-        if filenames is not None:
-            # Load TIFF file into buffer as slices
-            for image_file in filenames:
-                try:
-                    tif = TiffFile(image_file)
-                    if len(tif.pages) == 1:
-                        self.tif_images.append([tif.asarray()])
-                    else:
-                        self.tif_images.append(tif.asarray())
-                    idx += len(tif.pages)
-                    if idx >= self.num_of_frame:
-                        return
-                except TiffFileError:
-                    pass
-        elif ds is not None:
-            # Load a Numpy stack into buffer as slices
-            # Assume the stack is in the order ZYX
-            for idx, data in enumerate(ds):
-                self.tif_images.append(data)
-                idx += len(data)
-                if idx >= self.num_of_frame:
-                    return
-        else:
+        """Replay frames from image files or arrays instead of noise.
+
+        Frames are streamed lazily on a background thread, in acquisition order,
+        and replayed in a loop.
+
+        Parameters
+        ----------
+        filenames : list
+            Image files of any type in navigate.model.data_sources.FILE_TYPES.
+        ds : list
+            Arrays of shape (z, y, x) or (y, x). Used if filenames is None.
+            If both are None, the camera goes back to generating noise.
+        """
+        if self.replay is not None:
+            self.replay.stop()
+            self.replay = None
+
+        sources = filenames if filenames is not None else ds
+        if sources is None or len(sources) == 0:
             self.random_image = True
+            return
+
+        self.random_image = False
+        self.replay = FrameReplay(sources, (self.y_pixels, self.x_pixels))
+        self.replay.start()
+
+    def update_noise_pool(self):
+        """Precompute noise frames at the current frame size."""
+        shape = (self.y_pixels, self.x_pixels)
+        if self.noise_pool is not None and self.noise_pool.shape[1:] == shape:
+            return
+        rng = np.random.default_rng()
+        self.noise_pool = np.empty((NOISE_POOL_SIZE,) + shape, dtype=np.uint16)
+        for frame in self.noise_pool:
+            noise = rng.standard_normal(shape, dtype=np.float32)
+            # TODO: Don't hardcode 0.47 electrons per count
+            noise *= self._noise_sigma / 0.47
+            noise += self._mean_background_count
+            np.clip(noise, 0, np.iinfo(np.uint16).max, out=noise)
+            frame[:] = noise
 
     def generate_new_frame(self):
         """Generate a synthetic image."""
         if not self.is_acquiring:
             return
-        if self.random_image:
-            image = np.random.normal(
-                0,
-                self._noise_sigma
-                / 0.47,  # TODO: Don't hardcode 0.47 electrons per count
-                size=(self.x_pixels, self.y_pixels),
-            ).astype(np.uint16) + int(self._mean_background_count)
-        else:
-            image = self.tif_images[self.current_tif_id][self.img_id]
-            self.img_id += 1
-            if self.img_id >= len(self.tif_images[self.current_tif_id]):
-                self.img_id = 0
-                self.current_tif_id = (self.current_tif_id + 1) % len(self.tif_images)
+        image = None
+        if not self.random_image:
+            self.replay.frame_shape = (self.y_pixels, self.x_pixels)
+            image = self.replay.next_frame()
+        if image is None:
+            self.update_noise_pool()
+            image = self.noise_pool[np.random.randint(NOISE_POOL_SIZE)]
 
         ctypes.memmove(
             self.data_buffer[self.current_frame_idx].ctypes.data,
@@ -305,16 +490,51 @@ class SyntheticCamera(CameraBase):
 
         self.current_frame_idx = (self.current_frame_idx + 1) % self.num_of_frame
 
+        # The camera is busy until the next frame is due
+        self.wait_for_next_frame()
+
+    @property
+    def pacing_interval(self):
+        """Getter for the time between frames.
+
+        Returns
+        -------
+        float
+            frame_interval, or the exposure time if frame_interval is None.
+        """
+        if self.frame_interval is None:
+            return self.camera_exposure_time
+        return max(self.frame_interval, 0)
+
+    def wait_for_next_frame(self):
+        """Sleep until the next frame is due.
+
+        Frames are due every frame_interval seconds, or every exposure time if
+        frame_interval is None. Deadlines are kept on a fixed schedule, so time
+        spent reading frames does not slow the frame rate down.
+        """
+        interval = self.pacing_interval
+        if interval <= 0:
+            return
+        now = time.perf_counter()
+        if self._next_frame_time is None or self._next_frame_time < now - interval:
+            # First frame, or we fell behind by more than a frame.
+            self._next_frame_time = now
+        self._next_frame_time += interval
+        delay = self._next_frame_time - now
+        if delay > 0:
+            time.sleep(delay)
+
     def get_new_frame(self):
-        """Get frame from SyntheticCamera camera."""
+        """Get frame from SyntheticCamera camera.
 
-        time.sleep(self.camera_exposure_time)
-        timeout = 500
-        while self.pre_frame_idx == self.current_frame_idx and timeout:
+        Waits for up to one frame interval plus 500 ms for a frame to arrive.
+        """
+        deadline = time.perf_counter() + self.pacing_interval + 0.5
+        while self.pre_frame_idx == self.current_frame_idx:
+            if time.perf_counter() > deadline:
+                return []
             time.sleep(0.001)
-            timeout -= 1
-        if timeout <= 0:
-            return []
         if self.pre_frame_idx < self.current_frame_idx:
             frames = list(range(self.pre_frame_idx, self.current_frame_idx))
         else:
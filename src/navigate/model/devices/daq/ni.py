@@ -92,6 +92,13 @@ class NIDAQ(DAQBase):
         #: dict: NI DAQmx tasks for analog output.
         self.analog_output_tasks = {}
 
+        #: dict: Settings the camera and analog output tasks were created with.
+        #: A task is reused for the next channel if its settings don't change.
+        self.task_settings = {}
+
+        #: dict: Stacked waveforms of each board, by (board name, channel key).
+        self.board_waveforms = {}
+
         #: float: Number of samples.
         self.n_sample = None
 
@@ -128,7 +135,8 @@ class NIDAQ(DAQBase):
 
         # change trigger mode during acquisition in a feature
         if self.trigger_mode == "self-trigger":
-            self.create_master_trigger_task()
+            if self.master_trigger_task is None:
+                self.create_master_trigger_task()
             trigger_source = self.configuration["configuration"]["microscopes"][
                 self.microscope_name
             ]["daq"]["trigger_source"]
@@ -265,19 +273,34 @@ class NIDAQ(DAQBase):
 
         return callback_func
 
+    @staticmethod
+    def close_task(task: nidaqmx.Task) -> None:
+        """Stop and close a task.
+
+        Parameters
+        ----------
+        task : nidaqmx.Task
+            The task.
+        """
+        try:
+            task.stop()
+            task.close()
+        except nidaqmx.errors.DaqError:
+            logger.debug(f"Error closing task: {traceback.format_exc()}")
+
     def create_camera_task(self, channel_key: str) -> None:
         """Set up the camera trigger task.
 
         TTL for triggering the camera. TTL is 4 ms in duration.
         Channel that the TTL is delivered from, and its delay (typically ~10 ms), are
-        specified in the configuration.yaml file.
+        specified in the configuration.yaml file. The task of the previous channel
+        is reused if the pulse timing doesn't change.
 
         Parameters
         ----------
         channel_key : str
             Channel key for current channel.
         """
-        self.camera_trigger_task = nidaqmx.Task()
         camera_trigger_out_line = self.configuration["configuration"]["microscopes"][
             self.microscope_name
         ]["daq"]["camera_trigger_out_line"]
@@ -296,6 +319,21 @@ class NIDAQ(DAQBase):
             camera_high_time = self.sweep_times[channel_key] - 0.004
             camera_low_time = 0.004
 
+        settings = (
+            camera_trigger_out_line,
+            camera_high_time,
+            camera_low_time,
+            self.camera_delay,
+            camera_waveform_repeat_num,
+        )
+        if self.camera_trigger_task is not None:
+            if self.task_settings.get("camera") == settings:
+                self.camera_trigger_task.stop()
+                return
+            self.close_task(self.camera_trigger_task)
+
+        self.camera_trigger_task = nidaqmx.Task()
+        self.task_settings["camera"] = settings
         self.camera_trigger_task.co_channels.add_co_pulse_chan_time(
             camera_trigger_out_line,
             high_time=camera_high_time,
@@ -303,8 +341,6 @@ class NIDAQ(DAQBase):
             initial_delay=self.camera_delay,
         )
 
-        # apply waveform templates
-        camera_waveform_repeat_num = self.waveform_repeat_num * self.waveform_expand_num
         self.camera_trigger_task.timing.cfg_implicit_timing(
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
             samps_per_chan=camera_waveform_repeat_num,
@@ -326,7 +362,8 @@ class NIDAQ(DAQBase):
 
         Create a single analog output task for all channels per board. Most NI DAQ cards
         have only one clock for analog output sample timing, and as such all channels
-        must be grouped here.
+        must be grouped here. The task of the previous channel is reused if only its
+        waveforms change.
 
         Parameters
         ----------
@@ -346,15 +383,29 @@ class NIDAQ(DAQBase):
                     [x for x in self.analog_outputs.keys() if x.split("/")[0] == board]
                 )
             )
-            self.analog_output_tasks[board] = nidaqmx.Task()
-            self.analog_output_tasks[board].ao_channels.add_ao_voltage_chan(channel)
-
-            # apply templates to analog tasks
-            self.analog_output_tasks[board].timing.cfg_samp_clk_timing(
-                rate=self.sample_rate,
-                sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
-                samps_per_chan=max_sample * self.waveform_repeat_num,
+            settings = (
+                channel,
+                self.sample_rate,
+                max_sample * self.waveform_repeat_num,
             )
+            task = self.analog_output_tasks.get(board, None)
+            if task is not None and self.task_settings.get(board) == settings:
+                # only the buffer changes
+                task.stop()
+            else:
+                if task is not None:
+                    self.close_task(task)
+                task = nidaqmx.Task()
+                task.ao_channels.add_ao_voltage_chan(channel)
+
+                # apply templates to analog tasks
+                task.timing.cfg_samp_clk_timing(
+                    rate=self.sample_rate,
+                    sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
+                    samps_per_chan=max_sample * self.waveform_repeat_num,
+                )
+                self.analog_output_tasks[board] = task
+                self.task_settings[board] = settings
 
             # triggers = list(
             #     set([v["trigger_source"] for v in self.analog_outputs.values()])
@@ -378,19 +429,54 @@ class NIDAQ(DAQBase):
                         [v["waveform"][channel_key]] * self.waveform_expand_num
                     )
             # Write values to board
-            waveforms = np.vstack(
-                [
-                    v["waveform"][channel_key][:max_sample]
-                    for k, v in self.analog_outputs.items()
-                    if k.split("/")[0] == board
-                ]
-            ).squeeze()
-            self.analog_output_tasks[board].write(waveforms)
+            task.write(self.get_board_waveforms(board, channel_key, max_sample))
+
+    def get_board_waveforms(
+        self, board_name: str, channel_key: str, n_sample: int
+    ) -> np.ndarray:
+        """Get the waveforms of all the analog outputs of a board.
+
+        The stacked waveforms are kept until the waveforms of the channel are
+        recalculated, so switching back to a channel doesn't stack them again.
+
+        Parameters
+        ----------
+        board_name : str
+            Name of board.
+        channel_key : str
+            Channel key.
+        n_sample : int
+            Number of samples of each waveform.
+
+        Returns
+        -------
+        waveforms : np.ndarray
+            The waveforms, one row per analog output.
+        """
+        sources = [
+            v["waveform"][channel_key]
+            for k, v in self.analog_outputs.items()
+            if k.split("/")[0] == board_name
+        ]
+        cached = self.board_waveforms.get((board_name, channel_key), None)
+        if (
+            cached is not None
+            and cached[1] == n_sample
+            and len(cached[0]) == len(sources)
+            and all(a is b for a, b in zip(cached[0], sources))
+        ):
+            return cached[2]
+
+        waveforms = np.vstack([waveform[:n_sample] for waveform in sources]).squeeze()
+        # keep the sources, so they can't be replaced by new arrays with the same id
+        self.board_waveforms[(board_name, channel_key)] = (sources, n_sample, waveforms)
+        return waveforms
 
     def prepare_acquisition(self, channel_key: str) -> None:
         """Prepare the acquisition.
 
-        Creates and configures the DAQ tasks.
+        Creates and configures the DAQ tasks, or reuses the tasks of the previous
+        channel if their settings don't change.
         Writes the waveforms to each task.
 
         Parameters
@@ -487,7 +573,11 @@ class NIDAQ(DAQBase):
         if self.wait_to_run_lock.locked():
             self.wait_to_run_lock.release()
 
+        self.camera_trigger_task = None
+        if self.trigger_mode == "self-trigger":
+            self.master_trigger_task = None
         self.analog_output_tasks = {}
+        self.task_settings = {}
 
     def enable_microscope(self, microscope_name: str) -> None:
         """Enable microscope.
@@ -501,6 +591,9 @@ class NIDAQ(DAQBase):
             self.microscope_name = microscope_name
             self.analog_outputs = {}
             self.analog_output_tasks = {}
+            self.task_settings = {}
+        # the waveforms are recalculated
+        self.board_waveforms = {}
 
         self.camera_delay = (
             float(self.waveform_constants["other_constants"].get("camera_delay", 5))
@@ -563,14 +656,11 @@ class NIDAQ(DAQBase):
             self.analog_output_tasks[board_name].stop()
 
             # Write values to board
-            waveforms = np.vstack(
-                [
-                    v["waveform"][self.current_channel_key][: self.n_sample]
-                    for k, v in self.analog_outputs.items()
-                    if k.split("/")[0] == board_name
-                ]
-            ).squeeze()
-            self.analog_output_tasks[board_name].write(waveforms)
+            self.analog_output_tasks[board_name].write(
+                self.get_board_waveforms(
+                    board_name, self.current_channel_key, self.n_sample
+                )
+            )
         except Exception:
             logger.debug(f"Could not update analog task: {traceback.format_exc()}")
             for board in self.analog_output_tasks.keys():
@@ -581,6 +671,8 @@ class NIDAQ(DAQBase):
                     logger.debug(
                         f"Could not stop analog tasks: {traceback.format_exc()}"
                     )
+                self.task_settings.pop(board, None)
+            self.analog_output_tasks = {}
 
             self.create_analog_output_tasks(self.current_channel_key)
 
@@ -37,7 +37,7 @@ from typing import Any, Dict
 # Third Party Imports
 
 # Local Imports
-from navigate.model.waveforms import sawtooth, sine_wave
+from navigate.model.waveforms import sawtooth, sine_wave, clip_waveform
 from navigate.tools.decorators import log_initialization
 
 # # Logger Setup
@@ -222,7 +222,7 @@ class GalvoBase:
                         amplitude=galvo_amplitude,
                         offset=galvo_offset,
                         phase=self.camera_delay,
-                    )
+                    ).copy()
                     half_samples = (
                         new_wave.argmax() if galvo_amplitude > 0 else new_wave.argmin()
                     )
@@ -232,12 +232,11 @@ class GalvoBase:
                     print("Unknown Galvo waveform specified in configuration file.")
                     self.waveform_dict[channel_key] = None
                     continue
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] > self.galvo_max_voltage
-                ] = self.galvo_max_voltage
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] < self.galvo_min_voltage
-                ] = self.galvo_min_voltage
+                self.waveform_dict[channel_key] = clip_waveform(
+                    self.waveform_dict[channel_key],
+                    self.galvo_min_voltage,
+                    self.galvo_max_voltage,
+                )
 
         return self.waveform_dict
 
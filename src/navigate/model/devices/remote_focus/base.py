@@ -41,6 +41,7 @@ from navigate.model.waveforms import (
     remote_focus_ramp,
     smooth_waveform,
     remote_focus_ramp_triangular,
+    clip_waveform,
 )
 from navigate.tools.decorators import log_initialization
 
@@ -249,11 +250,10 @@ class RemoteFocusBase:
                     )[:samples]
 
                 # Clip any values outside the hardware limits
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] > self.remote_focus_max_voltage
-                ] = self.remote_focus_max_voltage
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] < self.remote_focus_min_voltage
-                ] = self.remote_focus_min_voltage
+                self.waveform_dict[channel_key] = clip_waveform(
+                    self.waveform_dict[channel_key],
+                    self.remote_focus_min_voltage,
+                    self.remote_focus_max_voltage,
+                )
 
         return self.waveform_dict
@@ -42,6 +42,7 @@ import nidaqmx
 
 # Local Imports
 from navigate.model.devices.stages.base import StageBase
+from navigate.model.waveforms import clip_waveform
 from navigate.tools.decorators import log_initialization
 
 # Logger Setup
@@ -202,12 +203,11 @@ class GalvoNIStage(StageBase):
                     print("*** updating waveform in StageGalvo failed!", channel_key)
                     return False
 
-                waveform_dict[channel_key][
-                    waveform_dict[channel_key] > self.galvo_max_voltage
-                ] = self.galvo_max_voltage
-                waveform_dict[channel_key][
-                    waveform_dict[channel_key] < self.galvo_min_voltage
-                ] = self.galvo_min_voltage
+                waveform_dict[channel_key] = clip_waveform(
+                    waveform_dict[channel_key],
+                    self.galvo_min_voltage,
+                    self.galvo_max_voltage,
+                )
 
         self.waveform_dict = waveform_dict
         self.daq.analog_outputs[self.axes_channels[0]] = {
@@ -0,0 +1,174 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# Standard Library Imports
+import logging
+import threading
+
+# Third Party Imports
+
+# Local Imports
+
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
+
+class StagePositionMonitor:
+    """Cache of the positions of the stages sharing a connection.
+
+    Reading the position of a stage is a round trip to the controller, which is
+    slow for serial devices. The monitor keeps the last positions reported by
+    its stages, and refreshes them when a move finishes, when it is asked to, or
+    every `poll_interval` seconds from a background thread.
+
+    The cached positions are replaced, never modified, so they can be read
+    without a lock. Stage commands on the connection are serialized with `lock`.
+    """
+
+    def __init__(self, name, stages, poll_interval=0, callback=None):
+        """Initialize the stage position monitor.
+
+        Parameters
+        ----------
+        name : str
+            Name of the connection, i.e. the device reference name of the stages.
+        stages : list
+            Stages sharing the connection.
+        poll_interval : float, optional
+            Time in seconds between two position queries of the background
+            thread, by default 0. The thread isn't started if it is not positive.
+        callback : callable, optional
+            Called with the positions when polling finds that they changed,
+            by default None
+        """
+        #: str: Name of the connection.
+        self.name = name
+
+        #: list: Stages sharing the connection.
+        self.stages = list(stages)
+
+        #: float: Time in seconds between two position queries.
+        self.poll_interval = poll_interval
+
+        #: callable: Called with the positions when polling finds that they changed.
+        self.callback = callback
+
+        #: threading.Lock: Lock of the stage connection.
+        self.lock = threading.Lock()
+
+        #: dict: Last reported stage positions.
+        self.positions = {}
+
+        #: bool: The cached positions may be out of date.
+        self.stale = True
+
+        #: threading.Event: Stop the polling thread.
+        self.stop_event = threading.Event()
+
+        #: threading.Thread: Polling thread.
+        self.thread = None
+
+    @property
+    def is_polling(self):
+        """Is the polling thread running.
+
+        Returns
+        -------
+        is_polling : bool
+            True if the positions are refreshed in the background.
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start polling the stage positions in the background."""
+        if self.poll_interval <= 0 or self.is_polling:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.poll, name=f"{self.name}PositionMonitor", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """Stop polling the stage positions."""
+        self.stop_event.set()
+        if self.is_polling and self.thread is not threading.current_thread():
+            self.thread.join(timeout=max(1.0, 2 * self.poll_interval))
+        self.thread = None
+
+    def poll(self):
+        """Refresh the positions every poll interval until stopped."""
+        while not self.stop_event.wait(self.poll_interval):
+            previous_positions = self.positions
+            try:
+                positions = self.refresh()
+            except Exception as e:
+                logger.exception(f"Failed to read the position of {self.name}: {e}")
+                continue
+            if self.callback is not None and positions != previous_positions:
+                self.callback(positions)
+
+    def refresh(self):
+        """Ask the stages for their positions.
+
+        Returns
+        -------
+        positions : dict
+            Positions of all the stages.
+        """
+        with self.lock:
+            positions = {}
+            for stage in self.stages:
+                positions.update(stage.report_position())
+            self.positions = positions
+            self.stale = False
+        return positions
+
+    def invalidate(self):
+        """Mark the cached positions as out of date."""
+        self.stale = True
+
+    def get_position(self):
+        """Get the stage positions.
+
+        The stages are only queried if the cached positions are out of date and
+        aren't refreshed by the polling thread, or were never read.
+
+        Returns
+        -------
+        positions : dict
+            Positions of all the stages.
+        """
+        if self.stale and (not self.is_polling or not self.positions):
+            return self.refresh()
+        return self.positions
@@ -39,11 +39,11 @@ import time
 
 # Third Party Imports
 import numpy as np
-from scipy.optimize import curve_fit
 
 # Local imports
 from navigate.model.features.feature_container import load_features
-import navigate.model.analysis.image_contrast as img_contrast
+from navigate.model.analysis.focus_metrics import FocusMetric
+from navigate.model.analysis.image_contrast import fourier_annulus  # noqa: F401
 from navigate.model.features.image_writer import ImageWriter
 
 
@@ -117,42 +117,6 @@ def r_squared(y, y_fit):
     return 1 - SS_res / SS_tot
 
 
-def fourier_annulus(im, radius_1=0, radius_2=64):
-    """Calculate the mean of the fourier transform of an annulus
-
-    Parameters
-    ----------
-    im : array
-        Image array
-    radius_1 : int, optional
-        Inner radius of the annulus, by default 0
-    radius_2 : int, optional
-        Outer radius of the annulus, by default 64
-
-    Returns
-    -------
-    float
-        Mean of the fourier transform of the annulus
-    array
-        Fourier transform of the annulus
-    """
-
-    x_, y_ = np.meshgrid(range(im.shape[1]), range(im.shape[0]))
-
-    x_ = x_.astype(float) - x_.mean()
-    y_ = y_.astype(float) - y_.mean()
-
-    mask = x_**2 + y_**2 > radius_1**2
-    mask *= x_**2 + y_**2 <= radius_2**2
-
-    IM = np.fft.fftshift(np.fft.fft2(im))
-    IM_abs = np.abs(IM)
-
-    IM_mask = IM_abs * mask
-
-    return np.mean(IM_mask), IM_mask
-
-
 class TonyWilson:
     """Tony Wilson iterative AO routine"""
 
@@ -221,9 +185,17 @@ class TonyWilson:
             "AdaptiveOpticsParameters"
         ]["TonyWilson"]["from"]
 
-        self.metric = self.model.configuration["experiment"][
+        tw_settings = self.model.configuration["experiment"][
             "AdaptiveOpticsParameters"
-        ]["TonyWilson"]["metric"]
+        ]["TonyWilson"]
+        self.metric = tw_settings["metric"]
+
+        #: FocusMetric: Image metric, scored on a binned region of interest
+        self.focus_metric = FocusMetric(
+            self.metric,
+            roi=float(tw_settings.get("metric_roi", 1.0)),
+            binning=int(tw_settings.get("metric_binning", 1)),
+        )
 
         self.fit_func = self.model.configuration["experiment"][
             "AdaptiveOpticsParameters"
@@ -500,6 +472,9 @@ class TonyWilson:
         mode : str, optional
             Fitting mode, by default "poly"
         """
+        # scipy is only needed once a fit is requested.
+        from scipy.optimize import curve_fit
+
         self.y = self.plot_data
 
         if mode == "poly":
@@ -590,12 +565,7 @@ class TonyWilson:
             img = self.model.data_buffer[self.f_frame_id]
 
             """ IMAGE METRICS """
-            if self.metric == "Pixel Max":
-                new_data = img.max()
-            elif self.metric == "Pixel Average":
-                new_data = img.mean()
-            elif self.metric == "DCT Shannon Entropy":
-                new_data = img_contrast.fast_normalized_dct_shannon_entropy(img, 3)[0]
+            new_data = self.focus_metric(img)
 
             if len(self.plot_data) == self.n_steps:
                 self.process_data(coef, mode=self.fit_func)
@@ -36,12 +36,10 @@ import threading
 
 # Third Party Imports
 import numpy as np
-from scipy.optimize import curve_fit
-from scipy.stats import linregress
 
 # Local imports
 from navigate.model.features.feature_container import load_features
-from navigate.model.analysis.image_contrast import fast_normalized_dct_shannon_entropy
+from navigate.model.analysis.focus_metrics import FocusMetric, FocusMetricScorer
 
 
 def power_tent(x, x_offset, y_offset, amplitude, sigma, alpha):
@@ -73,6 +71,210 @@ def power_tent(x, x_offset, y_offset, amplitude, sigma, alpha):
     return function
 
 
+class FocusSearch:
+    """Adaptive search for the position with the highest focus score.
+
+    The search takes a coarse pass over a grid of positions, and stops the pass
+    early once the scores have fallen well past a peak. It then refines the best
+    coarse position by parabolic interpolation, falling back to golden-section
+    steps. It stops once two successive fits of the maximum agree to within the
+    tolerance, or the interval that brackets the maximum is no wider than twice
+    the tolerance.
+    """
+
+    #: float: Fraction of an interval used by a golden-section step.
+    golden_ratio = (3 - 5**0.5) / 2
+
+    def __init__(self, center, search_range, step_size, tolerance):
+        """Initialize the FocusSearch class.
+
+        Parameters
+        ----------
+        center : float
+            Center of the coarse pass.
+        search_range : float
+            Range of the coarse pass.
+        step_size : float
+            Step size of the coarse pass.
+        tolerance : float
+            Target half-width of the interval that brackets the maximum.
+        """
+        steps = int(search_range // step_size) + 1
+        #: list: Positions of the coarse pass.
+        self.coarse_positions = [
+            center + (i - steps // 2) * step_size for i in range(steps)
+        ]
+        #: float: Step size of the coarse pass.
+        self.step_size = step_size
+        #: float: Target half-width of the interval that brackets the maximum.
+        self.tolerance = tolerance
+        #: list: Measured positions and scores, in the order they were measured.
+        self.measurements = []
+        #: list: Lower bound, best position and upper bound of the maximum.
+        self.bracket = None
+        #: float: Position of the maximum of the last parabolic fit.
+        self.last_vertex = None
+        #: int: Upper bound of the number of positions the search measures.
+        self.max_measurements = len(self.coarse_positions)
+        if tolerance < step_size:
+            # golden-section steps shrink the bracket by the golden ratio, allow
+            # two more for parabolic steps that shrink it less
+            self.max_measurements += 2 + int(
+                np.ceil(np.log(tolerance / step_size) / np.log(1 - self.golden_ratio))
+            )
+
+    def add_measurement(self, position, score):
+        """Add the score measured at a position.
+
+        Parameters
+        ----------
+        position : float
+            Position the score was measured at.
+        score : float
+            Focus score.
+        """
+        self.measurements.append((float(position), float(score)))
+        if self.bracket is None:
+            return
+        lower, best, upper = self.bracket
+        if score > self.score(best):
+            if position < best:
+                upper = best
+            else:
+                lower = best
+            best = position
+        elif position < best:
+            lower = position
+        else:
+            upper = position
+        self.bracket = [lower, best, upper]
+
+    def next_position(self):
+        """Get the next position to measure.
+
+        Returns
+        -------
+        position : float or None
+            The next position, or None once the search is finished.
+        """
+        if self.bracket is None:
+            if (
+                len(self.measurements) < len(self.coarse_positions)
+                and not self.passed_peak()
+            ):
+                return self.coarse_positions[len(self.measurements)]
+            if len(self.measurements) == 0:
+                return None
+            best = max(self.measurements, key=lambda m: m[1])[0]
+            self.bracket = [best - self.step_size, best, best + self.step_size]
+
+        lower, best, upper = self.bracket
+        if (
+            upper - lower <= 2 * self.tolerance
+            or len(self.measurements) >= self.max_measurements
+        ):
+            return None
+
+        position = self.parabolic_vertex()
+        if position is not None:
+            if (
+                self.last_vertex is not None
+                and abs(position - self.last_vertex) < self.tolerance
+            ):
+                return None
+            self.last_vertex = position
+        if (
+            position is None
+            or min(abs(position - m[0]) for m in self.measurements) < self.tolerance / 2
+        ):
+            # golden-section step into the larger side of the bracket
+            if upper - best > best - lower:
+                position = best + self.golden_ratio * (upper - best)
+            else:
+                position = best - self.golden_ratio * (best - lower)
+        return position
+
+    def passed_peak(self):
+        """Check if the coarse pass has fallen well past a peak.
+
+        Returns
+        -------
+        bool
+            True if the last two scores fell, and the last one is closer to the
+            lowest score than to the highest.
+        """
+        if len(self.measurements) < 3:
+            return False
+        scores = [m[1] for m in self.measurements]
+        high, low = max(scores), min(scores)
+        return scores[-3] > scores[-2] > scores[-1] and (
+            high - scores[-1] > (high - low) / 2
+        )
+
+    def score(self, position):
+        """Get the score measured at a position.
+
+        Parameters
+        ----------
+        position : float
+            Position.
+
+        Returns
+        -------
+        score : float or None
+            The score, or None if the position was not measured.
+        """
+        for p, score in self.measurements:
+            if p == position:
+                return score
+        return None
+
+    def parabolic_vertex(self):
+        """Get the vertex of the parabola through the bracket.
+
+        Returns
+        -------
+        position : float or None
+            Position of the vertex, or None if a bound of the bracket was not
+            measured, or the vertex is not a maximum inside the bracket.
+        """
+        lower, best, upper = self.bracket
+        scores = [self.score(lower), self.score(best), self.score(upper)]
+        if None in scores:
+            return None
+        f_lower, f_best, f_upper = scores
+        numerator = (best - lower) ** 2 * (f_best - f_upper) - (best - upper) ** 2 * (
+            f_best - f_lower
+        )
+        denominator = (best - lower) * (f_best - f_upper) - (best - upper) * (
+            f_best - f_lower
+        )
+        if denominator <= 0:
+            # the points are collinear, or the parabola opens upwards
+            return None
+        position = best - numerator / (2 * denominator)
+        if not lower < position < upper:
+            return None
+        return position
+
+    def best_position(self):
+        """Get the best estimate of the position of the maximum.
+
+        Returns
+        -------
+        position : float or None
+            The vertex of the parabola through the bracket if there is one,
+            otherwise the position with the highest score.
+        """
+        if len(self.measurements) == 0:
+            return None
+        if self.bracket is not None:
+            position = self.parabolic_vertex()
+            if position is not None:
+                return position
+        return max(self.measurements, key=lambda m: m[1])[0]
+
+
 class Autofocus:
     """Autofocus Data Process
 
@@ -127,6 +329,10 @@ class Autofocus:
         self.coarse_steps = None
         #: int: Signal id
         self.signal_id = None
+        #: FocusSearch: Adaptive search, None if the fixed sweep is used
+        self.search = None
+        #: FocusMetricScorer: Scores the frames off the data thread
+        self.scorer = None
 
         #: Queue: Autofocus frame queue
         self.autofocus_frame_queue = Queue()
@@ -146,6 +352,7 @@ class Autofocus:
                 "init": self.pre_func_data,
                 "main": self.in_func_data,
                 "end": self.end_func_data,
+                "cleanup": self.cleanup_data,
             },
             "node": {"node_type": "multi-step", "device_related": True},
         }
@@ -212,6 +419,9 @@ class Autofocus:
         settings = self.model.configuration["experiment"]["AutoFocusParameters"][
             self.model.active_microscope_name
         ][self.device][self.device_ref]
+        search = self.get_focus_search(settings, 0)
+        if search is not None:
+            return search.max_measurements
         frames = 0
         if settings["coarse_selected"]:
             coarse_range = float(settings["coarse_range"])
@@ -223,6 +433,44 @@ class Autofocus:
             frames += int(fine_range // fine_step_size) + 1
         return frames
 
+    @staticmethod
+    def get_focus_search(settings, center):
+        """Create the adaptive search if it is selected.
+
+        The coarse pass uses the coarse range and step size, and the search
+        refines the peak until it is bracketed to within the fine step size. If
+        only one of them is selected, its range and step size are used for the
+        coarse pass, and the search only stops the pass early.
+
+        Parameters
+        ----------
+        settings : dict
+            Autofocus settings of the device.
+        center : float
+            Center of the coarse pass.
+
+        Returns
+        -------
+        search : FocusSearch or None
+            The adaptive search, or None if it is not selected.
+        """
+        if not settings.get("adaptive_search", False):
+            return None
+        if settings["coarse_selected"]:
+            search_range = float(settings["coarse_range"])
+            step_size = float(settings["coarse_step_size"])
+        elif settings["fine_selected"]:
+            search_range = float(settings["fine_range"])
+            step_size = float(settings["fine_step_size"])
+        else:
+            return None
+        tolerance = (
+            float(settings["fine_step_size"])
+            if settings["fine_selected"]
+            else step_size
+        )
+        return FocusSearch(center, search_range, step_size, tolerance)
+
     @staticmethod
     def get_steps(ranges, step_size):
         """Calculate number of steps for autofocusing routine.
@@ -258,6 +506,10 @@ class Autofocus:
             self.focus_pos = 0
         self.total_frame_num = self.get_autofocus_frame_num()  # Total frame num
         self.coarse_steps, self.init_pos = 0, 0
+        self.signal_id = 0
+        self.search = self.get_focus_search(settings, self.focus_pos)
+        if self.search is not None:
+            return
 
         if settings["fine_selected"]:
             self.fine_step_size = float(settings["fine_step_size"])
@@ -272,11 +524,13 @@ class Autofocus:
                 float(settings["coarse_range"]), self.coarse_step_size
             )
             self.init_pos = self.focus_pos - coarse_pos_offset
-        self.signal_id = 0
 
     def in_func_signal(self):
         """Run the autofocus routine."""
 
+        if self.search is not None:
+            return self.adaptive_signal()
+
         if self.signal_id < self.coarse_steps:
             self.init_pos += self.coarse_step_size
             if self.device == "stage":
@@ -340,6 +594,51 @@ class Autofocus:
         self.signal_id += 1
         return self.init_pos if self.signal_id > self.total_frame_num else None
 
+    def adaptive_signal(self):
+        """Move to the next position of the adaptive search.
+
+        Waits for the score of the previous position, so the search can choose
+        the next one. Once the search is finished, moves to the best position.
+
+        Returns
+        -------
+        float or None
+            The focus position once the search is finished, otherwise None.
+        """
+        if self.signal_id > 0:
+            score = self.autofocus_pos_queue.get(timeout=10)
+            self.search.add_measurement(self.init_pos, score)
+
+        position = self.search.next_position()
+        if position is not None:
+            self.init_pos = position
+        else:
+            # the data thread expects one more frame, taken at the focus position
+            self.init_pos = self.focus_pos = self.search.best_position()
+            self.total_frame_num = self.signal_id
+            self.model.logger.info(
+                f"Adaptive autofocus finished after {self.signal_id} frames, "
+                f"focus: {self.focus_pos}"
+            )
+
+        if self.device == "stage":
+            self.model.move_stage(
+                {f"{self.device_ref}_abs": self.init_pos}, wait_until_done=True
+            )
+            self.model.logger.debug(
+                f"*** Autofocus move stage: ({self.device_ref}, {self.init_pos})"
+            )
+        elif self.device == "remote_focus":
+            self.model.active_microscope.move_remote_focus(self.init_pos)
+            self.model.logger.debug(f"*** Autofocus move remote focus: {self.init_pos}")
+
+        if position is None:
+            self.signal_id = self.total_frame_num + 1
+            return self.init_pos
+
+        self.autofocus_frame_queue.put((self.model.frame_id, 1, self.init_pos))
+        self.signal_id += 1
+
     def end_func_signal(self):
         """End the autofocus routine."""
 
@@ -359,6 +658,19 @@ class Autofocus:
         self.plot_data = []
         self.total_frame_num = self.get_autofocus_frame_num()
 
+        settings = self.model.configuration["experiment"]["AutoFocusParameters"][
+            self.model.active_microscope_name
+        ][self.device][self.device_ref]
+        if self.scorer is not None:
+            self.scorer.stop()
+        self.scorer = FocusMetricScorer(
+            FocusMetric(
+                settings.get("metric", "DCT Shannon Entropy"),
+                roi=float(settings.get("metric_roi", 1.0)),
+                binning=int(settings.get("metric_binning", 1)),
+            )
+        )
+
     def in_func_data(self, frame_ids=[]):
         """Run the autofocus routine.
 
@@ -390,40 +702,22 @@ class Autofocus:
 
             self.get_frames_num += 1
 
-            entropy = fast_normalized_dct_shannon_entropy(
-                input_array=self.model.data_buffer[self.f_frame_id],
-                psf_support_diameter_xy=3,
+            # the frame is copied out of the buffer here, and scored on the
+            # scorer's thread
+            self.scorer.submit(
+                self.model.data_buffer[self.f_frame_id],
+                self.add_score,
+                self.f_frame_id,
+                self.frame_num,
+                self.f_pos,
             )
 
-            self.model.logger.debug(
-                f"Appending plot data for frame {self.f_frame_id} focus: {self.f_pos}, "
-                f"entropy: {entropy[0]}"
-            )
-            self.plot_data.append([self.f_pos, entropy[0]])
-            # Need to initialize entropy above for the first iteration of the autofocus
-            # routine. Need to initialize entropy_vector above for the first iteration
-            # of the autofocus routine. Then need to append each measurement to the
-            # entropy_vector.  First column will be the focus position, second column
-            # would be the DCT entropy value.
-
-            # Find Maximum Focus Position
-            if entropy > self.max_entropy:
-                self.max_entropy = entropy
-                self.focus_pos = self.f_pos
-                self.target_frame_id = self.f_frame_id
-
             if self.frame_num == 1:
                 self.frame_num = 10  # any value but not 1
-                self.model.logger.info(
-                    f"***********max shannon entropy: {self.max_entropy}, "
-                    f"{self.focus_pos}"
-                )
-                # find out the focus
-                self.autofocus_pos_queue.put(self.focus_pos)
                 # return [self.target_frame_id]
                 if frame_ids.index(self.f_frame_id) < len(frame_ids) - 1:
                     self.get_frames_num += 1
-            
+
             self.f_frame_id = -1
 
         if self.get_frames_num > self.total_frame_num:
@@ -440,6 +734,9 @@ class Autofocus:
         if self.get_frames_num <= self.total_frame_num:
             return False
 
+        # all the frames are submitted, wait for their scores
+        self.scorer.stop()
+
         # Send the data for plotting via the event queue
         self.model.event_queue.put(("autofocus", [self.plot_data, False, True]))
 
@@ -464,9 +761,9 @@ class Autofocus:
 
         # Update the configuration with the new focus position
         if self.device == "stage":
-            self.model.configuration["experiment"]["StageParameters"][
-                self.device_ref
-            ] = self.focus_pos
+            self.model.configuration_snapshot.set(
+                ("experiment", "StageParameters", self.device_ref), self.focus_pos
+            )
 
             # Tell the controller to update the view
             stage_position = dict(
@@ -497,6 +794,51 @@ class Autofocus:
         # )
         return self.get_frames_num > self.total_frame_num
 
+    def add_score(self, entropy, frame_id, frame_num, position):
+        """Add the score of a frame.
+
+        Called by the scorer in the order the frames were submitted.
+
+        Parameters
+        ----------
+        entropy : float
+            Focus score of the frame.
+        frame_id : int
+            Frame id in the data buffer.
+        frame_num : int
+            Number of frames left in the pass, 1 for the last one.
+        position : float
+            Focus position the frame was taken at.
+        """
+        self.model.logger.debug(
+            f"Appending plot data for frame {frame_id} focus: {position}, "
+            f"entropy: {entropy}"
+        )
+        # First column is the focus position, second column the focus score.
+        self.plot_data.append([position, entropy])
+
+        # Find Maximum Focus Position
+        if entropy > self.max_entropy:
+            self.max_entropy = entropy
+            self.focus_pos = position
+            self.target_frame_id = frame_id
+
+        if frame_num == 1:
+            self.model.logger.info(
+                f"***********max shannon entropy: {self.max_entropy}, "
+                f"{self.focus_pos}"
+            )
+            # find out the focus, the adaptive search needs every score
+            if self.search is not None:
+                self.autofocus_pos_queue.put(entropy)
+            else:
+                self.autofocus_pos_queue.put(self.focus_pos)
+
+    def cleanup_data(self):
+        """Stop the scorer if the routine is stopped early."""
+        if self.scorer is not None:
+            self.scorer.stop()
+
     def robust_autofocus(self):
         """Robust autofocus routine.
 
@@ -513,6 +855,10 @@ class Autofocus:
             R-Squared value
         """
 
+        # scipy is only needed once a fit is requested.
+        from scipy.optimize import curve_fit
+        from scipy.stats import linregress
+
         # Convert plot data to numpy array
         x_data = np.asarray(self.plot_data)[:, 0]
         y_data = np.asarray(self.plot_data)[:, 1]
@@ -42,11 +42,46 @@ import logging
 # Local application imports
 from .image_writer import ImageWriter
 from navigate.tools.common_functions import VariableWithLock
+from navigate.tools.multipos_table_tools import get_stage_velocities, plan_route
 
 # Logger Setup
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+
+def plan_multiposition_route(model, positions):
+    """Reorder the multi-position table by the selected visiting order.
+
+    The table row of each visit is recorded as
+    experiment.MicroscopeState.multiposition_order, so a saved position index can
+    be traced back to the table.
+
+    Parameters
+    ----------
+    model : MicroscopeModel
+        The microscope model object.
+    positions : list
+        Multi-position table, each row contains an X, Y, Z, R, F position.
+
+    Returns
+    -------
+    positions : list
+        The positions in visiting order.
+    """
+    # a local copy, so reading a position doesn't go through the config proxy
+    positions = [list(position) for position in positions]
+    microscope_state = model.configuration["experiment"]["MicroscopeState"]
+    route = microscope_state.get("multiposition_route", "Table Order")
+    order = plan_route(
+        positions,
+        route,
+        get_stage_velocities(model.configuration, microscope_state["microscope_name"]),
+    )
+    microscope_state["multiposition_order"] = order
+    logger.info(f"Visiting the multi-position table in {route}: {order}")
+    return [positions[i] for i in order]
+
+
 class ChangeResolution:
     """
     ChangeResolution class for modifying the resolution mode of a microscope.
@@ -119,12 +154,12 @@ class ChangeResolution:
         # end active microscope
         self.model.active_microscope.end_acquisition()
         # prepare new microscope
-        self.model.configuration["experiment"]["MicroscopeState"][
-            "microscope_name"
-        ] = self.resolution_mode
-        self.model.configuration["experiment"]["MicroscopeState"][
-            "zoom"
-        ] = self.zoom_value
+        self.model.configuration_snapshot.set(
+            ("experiment", "MicroscopeState", "microscope_name"), self.resolution_mode
+        )
+        self.model.configuration_snapshot.set(
+            ("experiment", "MicroscopeState", "zoom"), self.zoom_value
+        )
         self.model.change_resolution(self.resolution_mode)
         logger.debug(f"current resolution is {self.resolution_mode}")
         logger.debug(
@@ -202,9 +237,7 @@ class Snap:
         """
         if self.saving_flag:
             self.model.mark_saving_flags(frame_ids)
-        logger.info(
-            f"the camera is:{self.model.active_microscope_name}, {frame_ids}"
-        )
+        logger.info(f"the camera is:{self.model.active_microscope_name}, {frame_ids}")
         return True
 
 
@@ -370,9 +403,7 @@ class WaitToContinue:
         """
         with self.first_enter_node as first_enter_node:
             if first_enter_node.value == "":
-                logger.debug(
-                    "*** wait to continue enters data " "node first!"
-                )
+                logger.debug("*** wait to continue enters data " "node first!")
                 first_enter_node.value = "data"
                 if not self.pause_data_lock.locked():
                     self.pause_data_lock.acquire()
@@ -664,6 +695,9 @@ class MoveToNextPositionInMultiPositionTable:
         if self.initialized:
             return
         self.initialized = True
+        self.multiposition_table = plan_multiposition_route(
+            self.model, self.multiposition_table
+        )
         if type(self.offset) is str:
             try:
                 self.offset = ast.literal_eval(self.offset)
@@ -983,7 +1017,9 @@ class ZStackAcquisition:
         #: ImageWriter: An image writer object for saving z-stack images.
         self.image_writer = None
         if saving_flag:
-            self.image_writer = ImageWriter(model, sub_dir=saving_dir)
+            self.image_writer = ImageWriter(
+                model, sub_dir=saving_dir, write_behind=True
+            )
 
         self.prepare_next_channel = PrepareNextChannel(model)
 
@@ -1044,7 +1080,9 @@ class ZStackAcquisition:
 
         # position: x, y, z, theta, f
         if bool(microscope_state["is_multiposition"]):
-            self.positions = self.model.configuration["experiment"]["MultiPositions"]
+            self.positions = plan_multiposition_route(
+                self.model, self.model.configuration["experiment"]["MultiPositions"]
+            )
         else:
             self.positions = [
                 [
@@ -1669,7 +1707,10 @@ class SetCameraParameters:
         ):
             update_flag = True
             update_sensor_mode = True
-            camera_parameters["sensor_mode"] = self.sensor_mode
+            self.model.configuration_snapshot.set(
+                ("experiment", "CameraParameters", self.microscope_name, "sensor_mode"),
+                self.sensor_mode,
+            )
             updated_value[0] = self.sensor_mode
         if camera_parameters["sensor_mode"] == "Light-Sheet":
             if self.readout_direction in camera_config[
@@ -1679,14 +1720,30 @@ class SetCameraParameters:
                 or camera_parameters["readout_direction"] != self.readout_direction
             ):
                 update_flag = True
-                camera_parameters["readout_direction"] = self.readout_direction
+                self.model.configuration_snapshot.set(
+                    (
+                        "experiment",
+                        "CameraParameters",
+                        self.microscope_name,
+                        "readout_direction",
+                    ),
+                    self.readout_direction,
+                )
                 updated_value[1] = self.readout_direction
             if self.rolling_shutter_width and (
                 update_sensor_mode
                 or self.rolling_shutter_width != camera_parameters["number_of_pixels"]
             ):
                 update_flag = True
-                camera_parameters["number_of_pixels"] = self.rolling_shutter_width
+                self.model.configuration_snapshot.set(
+                    (
+                        "experiment",
+                        "CameraParameters",
+                        self.microscope_name,
+                        "number_of_pixels",
+                    ),
+                    self.rolling_shutter_width,
+                )
                 updated_value[2] = self.rolling_shutter_width
 
         if not update_flag:
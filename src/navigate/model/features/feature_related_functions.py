@@ -34,6 +34,7 @@
 import os
 import inspect
 import importlib
+import re
 
 # Third-party imports
 
@@ -66,6 +67,41 @@ from navigate.model.features.remove_empty_tiles import (
 from navigate.tools.file_functions import load_yaml_file
 from navigate.tools.common_functions import load_module_from_file
 
+#: dict: Plugin modules defining features, by feature name. A plugin module is
+#: only imported when one of its features is first used.
+plugin_features = {}
+
+
+def __getattr__(name):
+    """Import a plugin feature on first use.
+
+    Parameters
+    ----------
+    name : str
+        Feature name.
+
+    Returns
+    -------
+    feature : class
+        The feature class.
+    """
+    if name in plugin_features:
+        feature = getattr(plugin_features.pop(name), name)
+        globals()[name] = feature
+        return feature
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the attributes of the module, including the plugin features.
+
+    Returns
+    -------
+    names : list
+        Attribute names.
+    """
+    return sorted(set(globals()) | set(plugin_features))
+
 
 class SharedList(list):
     """Custom list class with a name attribute for sharing data.
@@ -173,6 +209,10 @@ def convert_str_to_feature_list(content: str):
     if content in ["continue", '"continue"', "'continue'"]:
         return "continue"
     try:
+        # plugin features are looked up in globals, so import the ones used here
+        for name in list(plugin_features):
+            if re.search(rf"\b{name}\b", content):
+                __getattr__(name)
         exec_result = {}
         exec(f"result={content}", globals(), exec_result)
         if type(exec_result["result"]) is not list:
@@ -36,10 +36,11 @@ import os
 import logging
 import shutil
 import time
+import threading
+from queue import Queue, Full
 
 # Third Party Imports
 import numpy as np
-from tifffile import imsave
 
 # Local imports
 from navigate.model import data_sources
@@ -61,6 +62,8 @@ class ImageWriter:
         image_name=None,
         saving_flags=None,
         saving_config={},
+        write_behind=False,
+        queue_size=None,
     ):
         """Class for saving acquired data to disk.
 
@@ -76,6 +79,17 @@ class ImageWriter:
             indicating where to save data
         image_name : str
             Name of the image to be saved. If None, a name will be generated
+        saving_flags : list
+            Per-frame flags indicating which frames in the data buffer to save.
+        saving_config : dict
+            Additional metadata passed to the data source.
+        write_behind : bool
+            If True, frames are written to disk by a dedicated writer thread fed
+            through a bounded queue, and save_image only enqueues frame ids.
+        queue_size : int
+            Maximum number of frame ids waiting to be written in write-behind
+            mode. Defaults to half of the data buffer so that queued frames are
+            not overwritten by the camera before they are written.
         """
         #: str: Name of the microscope.
         self.microscope_name = microscope_name
@@ -113,11 +127,27 @@ class ImageWriter:
         #: bool: Is 32 vs 64-bit file format.
         self.big_tiff = False
 
+        #: bool: Write frames from a dedicated writer thread.
+        self.write_behind = write_behind
+
+        #: Queue: Bounded queue of frame ids waiting to be written.
+        self.frame_queue = None
+
+        #: threading.Thread: Writer thread for write-behind mode.
+        self.writer_thread = None
+
+        #: int: Number of times the queue was full when a frame arrived.
+        self.overrun_count = 0
+
+        #: bool: Has writing failed?
+        self.write_failed = False
+
+        #: bool: Has the data source been closed?
+        self.is_closed = False
+
         # create the save directory if it doesn't already exist
-        self.save_directory = os.path.join(
-            self.model.configuration["experiment"]["Saving"]["save_directory"],
-            self.sub_dir,
-        )
+        saving = self.model.configuration_snapshot.get("experiment", "Saving")
+        self.save_directory = os.path.join(saving["save_directory"], self.sub_dir)
         logger.info(f"Save Directory: {self.save_directory}")
         try:
             if not os.path.exists(self.save_directory):
@@ -163,7 +193,7 @@ class ImageWriter:
 
         # Set up the file name and path in the save directory
         #: str : File type for saving data.
-        self.file_type = self.model.configuration["experiment"]["Saving"]["file_type"]
+        self.file_type = saving["file_type"]
         logger.info(f"Saving Data as File Type: {self.file_type}")
 
         current_channel = self.model.active_microscope.current_channel
@@ -190,17 +220,30 @@ class ImageWriter:
 
         # camera flip flags
         microscope_name = self.model.active_microscope_name
-        camera_config = self.model.configuration["configuration"]["microscopes"][
-            microscope_name
-        ]["camera"]
+        camera_config = self.model.configuration_snapshot.get(
+            "configuration", "microscopes", microscope_name, "camera"
+        )
         self.flip_flags = {
             "x": camera_config.get("flip_x", False),
             "y": camera_config.get("flip_y", False),
         }
 
+        if self.write_behind:
+            if queue_size is None:
+                queue_size = max(1, self.number_of_frames // 2)
+            self.frame_queue = Queue(maxsize=queue_size)
+            self.writer_thread = threading.Thread(
+                target=self.run_writer, name="ImageWriter"
+            )
+            self.writer_thread.start()
+
     def save_image(self, frame_ids):
         """Save the data to disk.
 
+        In write-behind mode, the frame ids are only placed in the frame queue and
+        the writer thread saves them. If the queue is full, this call blocks until
+        the writer catches up and the overrun is counted.
+
         Parameters
         ----------
         frame_ids : int
@@ -220,6 +263,54 @@ class ImageWriter:
                     continue
                 self.saving_flags[idx] = False
 
+            if self.write_failed:
+                return
+
+            if not self.write_behind:
+                if not self.write_frame(idx):
+                    self.close()
+                    return
+                continue
+
+            try:
+                self.frame_queue.put_nowait(idx)
+            except Full:
+                self.overrun_count += 1
+                logger.warning(
+                    f"ImageWriter queue is full, waiting for the writer. "
+                    f"Overruns: {self.overrun_count}"
+                )
+                self.frame_queue.put(idx)
+
+    def run_writer(self):
+        """Write frames from the frame queue until the stop signal arrives."""
+        while True:
+            idx = self.frame_queue.get()
+            if idx is None:
+                break
+            # Keep draining the queue after a failure, so that save_image and
+            # flush never block on a full queue.
+            if self.write_failed:
+                continue
+            try:
+                self.write_frame(idx)
+            except Exception as e:
+                self.handle_write_error(e)
+
+    def write_frame(self, idx):
+        """Write one frame of the data buffer to disk and update the MIP.
+
+        Parameters
+        ----------
+        idx : int
+            Index into self.data_buffer.
+
+        Returns
+        -------
+        bool
+            True if the frame was written, False if an error occurred.
+        """
+        try:
             # Identify channel, z, time, and position indices
             c_idx, z_idx, t_idx, p_idx = self.data_source._cztp_indices(
                 self.data_source._current_frame, self.data_source.metadata.per_stack
@@ -244,53 +335,65 @@ class ImageWriter:
                 image = self.data_buffer[idx][::-1, :]
             else:
                 image = self.data_buffer[idx]
+
             # Save data to disk
-            try:
-                start_time = time.time()
-                self.data_source.write(
-                    image,
-                    x=self.model.data_buffer_positions[idx][0],
-                    y=self.model.data_buffer_positions[idx][1],
-                    z=self.model.data_buffer_positions[idx][2],
-                    theta=self.model.data_buffer_positions[idx][3],
-                    f=self.model.data_buffer_positions[idx][4],
-                )
-                logger.info(f"C: {c_idx}, Z:{z_idx}, T:{t_idx}, P:{p_idx}, Write Time:"
-                            f" {time.time() - start_time}")
-
-                # Update MIP
-                self.mip[c_idx, :, :] = np.maximum(self.mip[c_idx, :, :], image)
-
-                # Save the MIP
-                if (c_idx == self.data_source.shape_c - 1) and (
-                    z_idx == self.data_source.shape_z - 1
-                ):
-                    for c_save_idx in range(self.data_source.shape_c):
-                        mip_name = (
-                            "P"
-                            + str(p_idx).zfill(4)
-                            + "_"
-                            + "CH0"
-                            + str(c_save_idx)
-                            + "_"
-                            + str(t_idx).zfill(6)
-                            + ".tif"
-                        )
-                        imsave(
-                            os.path.join(self.mip_directory, mip_name),
-                            self.mip[c_save_idx, :, :],
-                        )
-            except Exception as e:
-                from traceback import format_exc
+            start_time = time.time()
+            self.data_source.write(
+                image,
+                x=self.model.data_buffer_positions[idx][0],
+                y=self.model.data_buffer_positions[idx][1],
+                z=self.model.data_buffer_positions[idx][2],
+                theta=self.model.data_buffer_positions[idx][3],
+                f=self.model.data_buffer_positions[idx][4],
+            )
+            logger.info(
+                f"C: {c_idx}, Z:{z_idx}, T:{t_idx}, P:{p_idx}, Write Time:"
+                f" {time.time() - start_time}"
+            )
 
-                # Close the image, stop the acquisition, log error, and notify user.
-                self.close()
-                self.model.stop_acquisition = True
-                self.model.event_queue.put(
-                    ("warning", f"Error - ImageWriter: {format_exc()}")
-                )
-                logger.debug(f"Error - ImageWriter: {e}")
-                return
+            # Update MIP
+            self.mip[c_idx, :, :] = np.maximum(self.mip[c_idx, :, :], image)
+
+            # Save the MIP
+            if (c_idx == self.data_source.shape_c - 1) and (
+                z_idx == self.data_source.shape_z - 1
+            ):
+                from tifffile import imsave
+
+                for c_save_idx in range(self.data_source.shape_c):
+                    mip_name = (
+                        "P"
+                        + str(p_idx).zfill(4)
+                        + "_"
+                        + "CH0"
+                        + str(c_save_idx)
+                        + "_"
+                        + str(t_idx).zfill(6)
+                        + ".tif"
+                    )
+                    imsave(
+                        os.path.join(self.mip_directory, mip_name),
+                        self.mip[c_save_idx, :, :],
+                    )
+        except Exception as e:
+            self.handle_write_error(e)
+            return False
+        return True
+
+    def handle_write_error(self, e):
+        """Stop the acquisition, log the error, and notify the user.
+
+        Parameters
+        ----------
+        e : Exception
+            The error raised while writing a frame.
+        """
+        from traceback import format_exc
+
+        self.write_failed = True
+        self.model.stop_acquisition = True
+        self.model.event_queue.put(("warning", f"Error - ImageWriter: {format_exc()}"))
+        logger.debug(f"Error - ImageWriter: {e}")
 
     def generate_image_name(self, current_channel, ext=".tif"):
         """Generates a string for the filename, e.g., CH00_000000.tif.
@@ -320,9 +423,31 @@ class ImageWriter:
         self.current_time_point += 1
         return image_name
 
+    def flush(self):
+        """Wait until all queued frames have been written and stop the writer."""
+        if self.writer_thread is None:
+            return
+        if threading.current_thread() is not self.writer_thread:
+            self.frame_queue.put(None)
+            self.writer_thread.join()
+        self.writer_thread = None
+        if self.overrun_count:
+            logger.info(f"ImageWriter queue overruns: {self.overrun_count}")
+
+    def cleanup(self):
+        """Drain the frame queue and close the data source."""
+        self.close()
+
     def close(self):
         """Close the data source we are writing to.
+
+        Frames still waiting in the queue are written before the data source is
+        closed.
         """
+        self.flush()
+        if self.is_closed:
+            return
+        self.is_closed = True
         self.data_source.close()
 
     def calculate_and_check_disk_space(self):
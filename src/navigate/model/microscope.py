@@ -34,13 +34,19 @@ import logging
 import importlib  # noqa: F401
 from multiprocessing.managers import ListProxy
 import reprlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
 from typing import Any, Dict
 
 # Third-party imports
 
 # Local application imports
 from navigate.model.device_startup_functions import start_stage
+from navigate.model.devices.stages.position_monitor import StagePositionMonitor
 from navigate.tools.common_functions import build_ref_name
+from navigate.config.config import ConfigurationSnapshot
 
 # Set up logging
 p = __name__.split(".")[1]
@@ -57,6 +63,7 @@ class Microscope:
         devices_dict: dict,
         is_synthetic=False,
         is_virtual=False,
+        configuration_snapshot=None,
     ):
         """Initialize the microscope.
 
@@ -72,6 +79,8 @@ class Microscope:
             Is synthetic, by default False
         is_virtual : bool, optional
             Is virtual, by default False
+        configuration_snapshot : ConfigurationSnapshot, optional
+            Snapshot of the configuration shared with the model, by default None
         """
 
         # Initialize microscope object
@@ -84,6 +93,11 @@ class Microscope:
         #: dict: Configuration dictionary.
         self.configuration = configuration
 
+        #: ConfigurationSnapshot: Local copy of the configuration for hot paths.
+        self.configuration_snapshot = configuration_snapshot or ConfigurationSnapshot(
+            configuration
+        )
+
         #: SharedNDArray: Buffer for image data.
         self.data_buffer = None
 
@@ -93,6 +107,19 @@ class Microscope:
         #: list: List of stages.
         self.stages_list = []
 
+        #: dict: Device reference name of each stage. Stages with the same name
+        #: share a connection and are moved one after the other.
+        self.stage_connections = {}
+
+        #: dict: Time in seconds each stage may take to finish a move.
+        self.stage_move_timeouts = {}
+
+        #: ThreadPoolExecutor: Moves stages on different connections at once.
+        self.stage_executor = None
+
+        #: dict: Position monitor of the stages of each device reference name.
+        self.stage_monitors = {}
+
         #: bool: Ask stage for position.
         self.ask_stage_for_position = True
 
@@ -352,6 +379,33 @@ class Microscope:
                 self.info[f"stage_{axis}"] = device_ref_name
 
             self.stages_list.append((stage, list(device_config["axes"])))
+            self.stage_connections[stage] = device_ref_name
+            try:
+                self.stage_move_timeouts[stage] = float(
+                    device_config.get("move_timeout", 30)
+                )
+            except (TypeError, ValueError):
+                self.stage_move_timeouts[stage] = 30.0
+
+            try:
+                poll_interval = float(device_config.get("position_poll_interval", 0))
+            except (TypeError, ValueError):
+                poll_interval = 0
+            if device_ref_name not in self.stage_monitors:
+                self.stage_monitors[device_ref_name] = StagePositionMonitor(
+                    device_ref_name,
+                    [],
+                    poll_interval,
+                    callback=self.publish_stage_position,
+                )
+            monitor = self.stage_monitors[device_ref_name]
+            monitor.stages.append(stage)
+            if poll_interval > 0:
+                monitor.poll_interval = (
+                    min(monitor.poll_interval, poll_interval)
+                    if monitor.poll_interval > 0
+                    else poll_interval
+                )
 
         # connect daq and camera in synthetic mode
         if is_synthetic and self.daq is not None:
@@ -407,6 +461,8 @@ class Microscope:
                 for axis in axes
             }
             stage.move_absolute(pos, wait_until_done=True)
+        for monitor in self.stage_monitors.values():
+            monitor.invalidate()
         self.ask_stage_for_position = True
 
     def prepare_acquisition(self):
@@ -634,14 +690,19 @@ class Microscope:
                         )
                         exposure_time = round(updated_exposure_time, 4)
                         # update the experiment file
-                        channel["camera_exposure_time"] = round(
-                            updated_exposure_time * 1000, 1
+                        camera_exposure_time = round(updated_exposure_time * 1000, 1)
+                        self.configuration_snapshot.set(
+                            (
+                                "experiment",
+                                "MicroscopeState",
+                                "channels",
+                                channel_key,
+                                "camera_exposure_time",
+                            ),
+                            camera_exposure_time,
                         )
                         self.output_event_queue.put(
-                            (
-                                "exposure_time",
-                                (channel_key, channel["camera_exposure_time"]),
-                            )
+                            ("exposure_time", (channel_key, camera_exposure_time))
                         )
 
                 sweep_time = (
@@ -709,32 +770,26 @@ class Microscope:
             return
 
         channel_key = prefix + str(self.current_channel)
-        channel = self.configuration["experiment"]["MicroscopeState"]["channels"][
-            channel_key
-        ]
+        channel = self.configuration_snapshot.get(
+            "experiment", "MicroscopeState", "channels"
+        )[channel_key]
+        camera_parameters = self.configuration_snapshot.get(
+            "experiment", "CameraParameters", self.microscope_name
+        )
         # Filter Wheel Settings.
         for k in self.filter_wheel:
             self.filter_wheel[k].set_filter(channel[k])
 
         # Camera Settings
         self.current_exposure_time = float(channel["camera_exposure_time"]) / 1000
-        if (
-            self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-                "sensor_mode"
-            ]
-            == "Light-Sheet"
-        ):
+        if camera_parameters["sensor_mode"] == "Light-Sheet":
             (
                 self.current_exposure_time,
                 camera_line_interval,
                 _,
             ) = self.camera.calculate_light_sheet_exposure_time(
                 self.current_exposure_time,
-                int(
-                    self.configuration["experiment"]["CameraParameters"][
-                        self.microscope_name
-                    ]["number_of_pixels"]
-                ),
+                int(camera_parameters["number_of_pixels"]),
             )
             self.camera.set_line_interval(camera_line_interval)
         self.camera.set_exposure_time(self.current_exposure_time)
@@ -752,12 +807,10 @@ class Microscope:
         )
         # self.lasers[str(self.laser_wavelength[self.current_laser_index])].turn_on()
 
-        # stop daq before writing new waveform
-        # When called the first time, throws an error.
+        # write the new waveforms, the daq stops its tasks and reuses them if it can
         # choose to not update the waveform is very useful when running ZStack
         # if there is a NI Galvo stage in the system.
         if update_daq_task_flag:
-            self.daq.stop_acquisition()
             self.daq.prepare_acquisition(channel_key)
 
         # Add Defocus term
@@ -798,11 +851,17 @@ class Microscope:
             axis = axis_key[: axis_key.index("_")]
             if update_focus and axis == "f":
                 self.central_focus = None
-            return self.stages[axis].move_axis_absolute(
-                axis, pos_dict[axis_key], wait_until_done
+            stage = self.stages[axis]
+            return self.move_connection(
+                self.stage_connections.get(stage),
+                partial(
+                    stage.move_axis_absolute, axis, pos_dict[axis_key], wait_until_done
+                ),
+                wait_until_done,
             )
 
-        success = True
+        # group the moves by connection
+        moves = {}
         for stage, axes in self.stages_list:
             pos = {
                 axis: pos_dict[axis]
@@ -810,13 +869,162 @@ class Microscope:
                 if axis[: axis.index("_")] in axes
             }
             if pos:
-                success = stage.move_absolute(pos, wait_until_done) and success
+                moves.setdefault(self.stage_connections.get(stage), []).append(
+                    (stage, pos)
+                )
+
+        if len(moves) > 1:
+            success = self.move_stages_concurrently(moves, wait_until_done)
+        else:
+            success = True
+            for device_ref_name, stage_moves in moves.items():
+                success = (
+                    self.move_connection(
+                        device_ref_name,
+                        partial(self.move_stages, stage_moves, wait_until_done),
+                        wait_until_done,
+                    )
+                    and success
+                )
 
         if update_focus and "f_abs" in pos_dict:
             self.central_focus = None
 
         return success
 
+    def move_connection(self, device_ref_name, move, wait_until_done=False):
+        """Move the stages of a connection and update their position monitor.
+
+        Polling the positions is blocked during the move. The positions are read
+        once the move is done, or marked out of date if the move isn't waited for.
+
+        Parameters
+        ----------
+        device_ref_name : str
+            Device reference name of the stages.
+        move : callable
+            Function moving the stages, returning True if successful.
+        wait_until_done : bool, optional
+            The move waits until the stages are done moving, by default False
+
+        Returns
+        -------
+        success : bool
+            True if the stages are successfully moved, False otherwise.
+        """
+        monitor = self.stage_monitors.get(device_ref_name, None)
+        if monitor is None:
+            return move()
+
+        with monitor.lock:
+            success = move()
+
+        if wait_until_done:
+            try:
+                monitor.refresh()
+            except Exception as e:
+                logger.exception(
+                    f"Failed to read the position of {device_ref_name}: {e}"
+                )
+                monitor.invalidate()
+        else:
+            monitor.invalidate()
+        return success
+
+    @staticmethod
+    def move_stages(stage_moves, wait_until_done=False):
+        """Move stages one after the other.
+
+        Parameters
+        ----------
+        stage_moves : list
+            List of (stage, position dictionary) pairs.
+        wait_until_done : bool, optional
+            Wait until each stage is done moving, by default False
+
+        Returns
+        -------
+        success : bool
+            True if all the stages are successfully moved, False otherwise.
+        """
+        success = True
+        for stage, pos in stage_moves:
+            success = stage.move_absolute(pos, wait_until_done) and success
+        return success
+
+    def move_stages_concurrently(self, moves, wait_until_done=False):
+        """Move the stages of different connections at the same time.
+
+        The stages of each connection are moved one after the other, so a move
+        takes as long as the slowest connection instead of the sum of all of them.
+
+        Parameters
+        ----------
+        moves : dict
+            List of (stage, position dictionary) pairs by device reference name.
+        wait_until_done : bool, optional
+            Wait until the stages are done moving, by default False
+
+        Returns
+        -------
+        success : bool
+            True if all the stages are successfully moved, False if a move failed
+            or didn't finish within its timeout.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the stages raised an error. All the other moves are
+            finished first.
+        """
+        if self.stage_executor is None:
+            self.stage_executor = ThreadPoolExecutor(
+                max_workers=len(self.stages_list),
+                thread_name_prefix=f"{self.microscope_name}Stage",
+            )
+
+        start_time = time.perf_counter()
+        futures = {
+            device_ref_name: self.stage_executor.submit(
+                self.move_connection,
+                device_ref_name,
+                partial(self.move_stages, stage_moves, wait_until_done),
+                wait_until_done,
+            )
+            for device_ref_name, stage_moves in moves.items()
+        }
+
+        success = True
+        errors = []
+        for device_ref_name, future in futures.items():
+            timeout = sum(
+                self.stage_move_timeouts.get(stage, 30.0)
+                for stage, _ in moves[device_ref_name]
+            )
+            try:
+                success = (
+                    future.result(
+                        timeout=max(0, start_time + timeout - time.perf_counter())
+                    )
+                    and success
+                )
+            except FutureTimeoutError:
+                logger.error(
+                    f"Stage {device_ref_name} didn't finish moving in {timeout} s."
+                )
+                success = False
+            except Exception as e:
+                logger.exception(f"Stage {device_ref_name} failed to move: {e}")
+                errors.append((device_ref_name, e))
+
+        if errors:
+            raise RuntimeError(
+                "Stages failed to move: "
+                + ", ".join(f"{name}: {error}" for name, error in errors)
+            ) from errors[0][1]
+
+        return success
+
     def stop_stage(self) -> None:
         """Stop stage."""
 
@@ -825,23 +1033,61 @@ class Microscope:
         for stage, axes in self.stages_list:
             stage.stop()
 
-        self.central_focus = self.get_stage_position().get("f_pos", self.central_focus)
+        self.central_focus = self.get_stage_position(refresh=True).get(
+            "f_pos", self.central_focus
+        )
 
-    def get_stage_position(self) -> dict:
+    def get_stage_position(self, refresh=False) -> dict:
         """Get stage position.
 
+        Positions are read from the position monitors, which only ask the stages
+        for their position if it may have changed and isn't polled.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Ask all the stages for their position, by default False
+
         Returns
         -------
         stage_position : dict
             Dictionary of stage positions.
         """
-        if self.ask_stage_for_position:
-            for stage, axes in self.stages_list:
-                temp_pos = stage.report_position()
-                self.ret_pos_dict.update(temp_pos)
+        if refresh:
+            for monitor in self.stage_monitors.values():
+                monitor.invalidate()
+        if (
+            refresh
+            or self.ask_stage_for_position
+            or any(monitor.is_polling for monitor in self.stage_monitors.values())
+        ):
+            for monitor in self.stage_monitors.values():
+                self.ret_pos_dict.update(monitor.get_position())
             self.ask_stage_for_position = False
         return self.ret_pos_dict
 
+    def publish_stage_position(self, positions) -> None:
+        """Send the polled stage positions to the GUI.
+
+        Parameters
+        ----------
+        positions : dict
+            Dictionary of stage positions.
+        """
+        if self.output_event_queue is not None:
+            self.output_event_queue.put(("update_stage", positions))
+
+    def start_stage_monitors(self) -> None:
+        """Start polling the stage positions, if a poll interval is configured."""
+        for monitor in self.stage_monitors.values():
+            monitor.start()
+
+    def stop_stage_monitors(self) -> None:
+        """Stop polling the stage positions."""
+        for monitor in self.stage_monitors.values():
+            monitor.stop()
+            monitor.invalidate()
+
     def move_remote_focus(self, offset=None) -> None:
         """Move remote focus.
 
@@ -992,6 +1238,11 @@ class Microscope:
         except AttributeError:
             pass
 
+        self.stop_stage_monitors()
+
+        if self.stage_executor is not None:
+            self.stage_executor.shutdown(wait=False)
+
         try:
             for stage, _ in self.stages_list:
                 stage.close()
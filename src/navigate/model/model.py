@@ -76,7 +76,7 @@ from navigate.tools.common_functions import load_module_from_file, VariableWithL
 from navigate.tools.file_functions import load_yaml_file, save_yaml_file
 from navigate.model.device_startup_functions import load_devices
 from navigate.model.microscope import Microscope
-from navigate.config.config import get_navigate_path
+from navigate.config.config import get_navigate_path, ConfigurationSnapshot
 from navigate.model.plugins_model import PluginsModel
 
 
@@ -110,9 +110,17 @@ class Model:
         #: dict: Configuration dictionary.
         self.configuration = configuration
 
+        #: ConfigurationSnapshot: Local copy of the configuration for hot paths.
+        self.configuration_snapshot = ConfigurationSnapshot(configuration)
+
+        #: dict: Time in seconds each step of the model startup took.
+        self.startup_timings = {}
+
         # Plugins
+        start_time = time.perf_counter()
         plugins = PluginsModel()
         plugin_devices, plugin_acquisition_modes = plugins.load_plugins()
+        self.startup_timings["plugins"] = time.perf_counter() - start_time
 
         #: dict: Dictionary of plugin acquisition modes
         self.plugin_acquisition_modes = plugin_acquisition_modes
@@ -122,6 +130,8 @@ class Model:
             configuration, args.synthetic_hardware, plugin_devices
         )
         devices_dict["__plugins__"] = plugin_devices
+        for name, duration in devices_dict.pop("__startup_timings__", {}).items():
+            self.startup_timings[f"device {name}"] = duration
 
         #: dict: Dictionary of virtual microscopes.
         self.virtual_microscopes = {}
@@ -129,10 +139,18 @@ class Model:
         #: dict: Dictionary of physical microscopes.
         self.microscopes = {}
         for microscope_name in configuration["configuration"]["microscopes"].keys():
+            start_time = time.perf_counter()
             self.microscopes[microscope_name] = Microscope(
-                microscope_name, configuration, devices_dict, args.synthetic_hardware
+                microscope_name,
+                configuration,
+                devices_dict,
+                args.synthetic_hardware,
+                configuration_snapshot=self.configuration_snapshot,
             )
             self.microscopes[microscope_name].output_event_queue = event_queue
+            self.startup_timings[f"microscope {microscope_name}"] = (
+                time.perf_counter() - start_time
+            )
         # register device commands if there is any.
 
         #: str: Name of the active microscope.
@@ -189,6 +207,15 @@ class Model:
         #: array: stage positions.
         self.data_buffer_positions = None
 
+        #: array: sequence number of the frame triggered into each buffer slot.
+        self.data_buffer_frame_numbers = None
+
+        #: int: Number of frames triggered since the acquisition started.
+        self.frame_sequence_number = 0
+
+        #: dict: Frame accounting of the last acquisition.
+        self.frame_report = {}
+
         #: array: saving flags for a frame
         self.data_buffer_saving_flags = None
 
@@ -420,6 +447,10 @@ class Model:
         self.data_buffer_positions = SharedNDArray(
             shape=(self.number_of_frames, 5), dtype=float
         )  # z-index, x, y, z, theta, f
+        self.data_buffer_frame_numbers = SharedNDArray(
+            shape=(self.number_of_frames,), dtype="int64"
+        )
+        self.data_buffer_frame_numbers[:] = -1
         for microscope_name in self.microscopes:
             self.microscopes[microscope_name].update_data_buffer(
                 self.data_buffer,
@@ -503,6 +534,11 @@ class Model:
             "MicroscopeState"
         ]["microscope_name"]
         self.active_microscope = self.microscopes[self.active_microscope_name]
+        # only the active microscope polls its stages, which may share connections
+        for microscope in self.microscopes.values():
+            if microscope is not self.active_microscope:
+                microscope.stop_stage_monitors()
+        self.active_microscope.start_stage_monitors()
         return self.active_microscope
 
     def get_offset_variance_maps(self):
@@ -529,6 +565,10 @@ class Model:
             Dictionary of keyword arguments to pass to the command.
         """
         logging.info(f"Received command: {command}, {args}, {kwargs}")
+        # The controller writes the shared configuration directly before these
+        # commands, so none of the snapshot can be trusted afterwards.
+        if command in ["acquire", "update_setting", "autofocus", "load_feature"]:
+            self.configuration_snapshot.invalidate()
         if not self.data_buffer:
             logging.debug("Shared Memory Not Set Up.")
             return
@@ -536,6 +576,7 @@ class Model:
         if command == "acquire":
             """Begin an acquisition."""
             self.is_acquiring = True
+            self.configuration_snapshot.reset_statistics()
             self.imaging_mode = self.configuration["experiment"]["MicroscopeState"][
                 "image_mode"
             ]
@@ -577,6 +618,7 @@ class Model:
                     self,
                     saving_flags=self.data_buffer_saving_flags,
                     saving_config=saving_config,
+                    write_behind=True,
                 )
                 self.data_thread = threading.Thread(
                     target=self.run_data_process,
@@ -597,6 +639,7 @@ class Model:
                         sub_dir=m,
                         saving_flags=self.data_buffer_saving_flags,
                         saving_config=saving_config,
+                        write_behind=True,
                     )
                     if self.is_save
                     else None
@@ -645,6 +688,8 @@ class Model:
             if reboot:
                 # prepare active microscope
                 waveform_dict = self.active_microscope.prepare_acquisition()
+                # the camera restarts from the first slot of the data buffer
+                self.frame_id = 0
                 self.resume_data_thread()
             else:
                 waveform_dict = self.active_microscope.calculate_all_waveform()
@@ -895,6 +940,16 @@ class Model:
         wait_num = self.camera_wait_iterations
         acquired_frame_num = 0
 
+        # frame accounting, see check_frame_sequence()
+        self.frame_report = {
+            "acquired_frames": 0,
+            "dropped_frames": 0,
+            "overrun_events": 0,
+            "max_backlog": 0,
+            "buffer_size": self.number_of_frames,
+            "next_sequence_number": 0,
+        }
+
         # whether acquire specific number of frames.
         count_frame = num_of_frames > 0
 
@@ -925,6 +980,7 @@ class Model:
                 continue
 
             acquired_frame_num += len(frame_ids)
+            self.check_frame_sequence(frame_ids)
 
             wait_num = self.camera_wait_iterations
 
@@ -952,12 +1008,59 @@ class Model:
         self.logger.info("Data thread stopped.")
         self.logger.info(f"Received frames in total: {acquired_frame_num}")
 
+        self.frame_report["acquired_frames"] = acquired_frame_num
+        if self.is_save and self.image_writer is not None:
+            self.frame_report["writer_queue_overruns"] = getattr(
+                self.image_writer, "overrun_count", 0
+            )
+        self.frame_report[
+            "configuration_proxy_calls"
+        ] = self.configuration_snapshot.proxy_calls
+        self.frame_report[
+            "configuration_proxy_calls_saved"
+        ] = self.configuration_snapshot.saved_calls
+        self.frame_report.pop("next_sequence_number", None)
+        self.logger.info(f"Frame report: {self.frame_report}")
+        self.event_queue.put(("frame_report", dict(self.frame_report)))
+
         # release the lock when data thread ends
         if self.pause_data_ready_lock.locked():
             self.pause_data_ready_lock.release()
 
         self.end_acquisition()  # Need this to turn off the lasers/close the shutters
 
+    def check_frame_sequence(self, frame_ids):
+        """Detect frames that were overwritten in the data buffer before delivery.
+
+        The signal thread stamps every buffer slot with the sequence number of the
+        frame it triggers. Frames arrive in order, so a jump in the sequence numbers
+        means the ring buffer wrapped around and the skipped frames were lost.
+
+        Parameters
+        ----------
+        frame_ids : list
+            Indices into the data buffer delivered by the camera.
+        """
+        report = self.frame_report
+        for idx in frame_ids:
+            sequence_number = int(self.data_buffer_frame_numbers[idx])
+            expected = report["next_sequence_number"]
+            if sequence_number > expected:
+                dropped = sequence_number - expected
+                report["dropped_frames"] += dropped
+                report["overrun_events"] += 1
+                self.logger.warning(
+                    f"Data buffer overrun: {dropped} frame(s) lost before frame "
+                    f"{sequence_number} (buffer slot {idx})."
+                )
+            if sequence_number >= expected:
+                report["next_sequence_number"] = sequence_number + 1
+
+        report["max_backlog"] = max(
+            report["max_backlog"],
+            self.frame_sequence_number - report["next_sequence_number"],
+        )
+
     def pause_data_thread(self):
         """Pause the data thread.
 
@@ -1057,6 +1160,8 @@ class Model:
         self.event_queue.put(("waveform", waveform_dict))
 
         self.frame_id = 0
+        self.frame_sequence_number = 0
+        self.data_buffer_frame_numbers[:] = -1
 
     def snap_image(self):
         """Acquire an image after updating the waveforms.
@@ -1077,6 +1182,8 @@ class Model:
         self.data_buffer_positions[self.frame_id][2] = stage_pos.get("z_pos", 0)
         self.data_buffer_positions[self.frame_id][3] = stage_pos.get("theta_pos", 0)
         self.data_buffer_positions[self.frame_id][4] = stage_pos.get("f_pos", 0)
+        self.data_buffer_frame_numbers[self.frame_id] = self.frame_sequence_number
+        self.frame_sequence_number += 1
 
         # Run the acquisition
         try:
@@ -1345,7 +1452,12 @@ class Model:
         )
 
         microscope = Microscope(
-            microscope_name, self.configuration, {}, False, is_virtual=True
+            microscope_name,
+            self.configuration,
+            {},
+            False,
+            is_virtual=True,
+            configuration_snapshot=self.configuration_snapshot,
         )
         microscope.daq = SyntheticDAQ(self.configuration)
         microscope.laser_wavelength = self.microscopes[microscope_name].laser_wavelength
@@ -33,7 +33,7 @@
 # Standard library imports
 import os
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 # Third-party imports
 
@@ -41,7 +41,11 @@ from typing import Union
 from navigate.tools.file_functions import save_yaml_file
 from navigate.tools.decorators import FeatureList, AcquisitionMode
 from navigate.config.config import get_navigate_path
-from navigate.plugins.plugin_manager import PluginFileManager, PluginPackageManager
+from navigate.plugins.plugin_manager import (
+    PluginFileManager,
+    PluginPackageManager,
+    PluginManifest,
+)
 
 
 class PluginsModel:
@@ -67,13 +71,19 @@ class PluginsModel:
         plugins_config_path = os.path.join(
             get_navigate_path(), "config", "plugins_config.yml"
         )
+        plugin_manifest = PluginManifest(
+            os.path.join(get_navigate_path(), "config", "plugins_manifest.yml")
+        )
         plugin_file_manager = PluginFileManager(plugins_path, plugins_config_path)
-        self.load_plugins_through_manager(plugin_file_manager)
-        self.load_plugins_through_manager(PluginPackageManager)
+        self.load_plugins_through_manager(plugin_file_manager, plugin_manifest)
+        self.load_plugins_through_manager(PluginPackageManager, plugin_manifest)
+        plugin_manifest.save()
         return self.devices_dict, self.plugin_acquisition_modes
 
     def load_plugins_through_manager(
-        self, plugin_manager: Union[PluginFileManager, PluginPackageManager]
+        self,
+        plugin_manager: Union[PluginFileManager, PluginPackageManager],
+        plugin_manifest: Optional[PluginManifest] = None,
     ) -> None:
         """Load plugins through plugin manager
 
@@ -82,6 +92,9 @@ class PluginsModel:
         plugin_manager : PluginFileManager or PluginPackageManager
             - PluginFileManager
             - PluginPackageManager
+        plugin_manifest : PluginManifest, optional
+            Cache of the plugins. Plugin modules listed in it are imported on
+            first use.
 
         """
         plugins = plugin_manager.get_plugins()
@@ -92,11 +105,17 @@ class PluginsModel:
             if plugin_config is None:
                 continue
 
+            manifest = None
+            if plugin_manifest is not None:
+                manifest = plugin_manifest.get_plugin(plugin_manager, plugin_ref)
+
             # feature
-            plugin_manager.load_features(plugin_ref)
+            plugin_manager.load_features(plugin_ref, manifest=manifest)
 
             # feature lists
-            plugin_manager.load_feature_lists(plugin_ref, self.register_feature_list)
+            plugin_manager.load_feature_lists(
+                plugin_ref, self.register_feature_list, manifest=manifest
+            )
 
             # acquisition mode
             acquisition_modes = plugin_config.get("acquisition_modes", [])
@@ -104,10 +123,13 @@ class PluginsModel:
                 plugin_ref,
                 acquisition_modes,
                 self.register_acquisition_mode,
+                manifest=manifest,
             )
 
             # load devices
-            plugin_manager.load_devices(plugin_ref, self.register_device)
+            plugin_manager.load_devices(
+                plugin_ref, self.register_device, manifest=manifest
+            )
 
     def register_device(self, device, module):
         """Register device
@@ -32,10 +32,12 @@
 
 # Standard Library Imports
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
 
 # Third Party Imports
 import numpy as np
-from scipy import signal
 
 # Local Imports
 
@@ -43,7 +45,45 @@ from scipy import signal
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: int: Maximum number of waveforms memoized per waveform function.
+WAVEFORM_CACHE_SIZE = 128
 
+
+def cached_waveform(func):
+    """Memoize a waveform function by its parameters.
+
+    Waveforms are recalculated every time the devices are adjusted, usually with
+    the same parameters. The waveform is calculated once per parameter set and
+    returned as a read-only float array, so a cached waveform can be shared
+    safely between channels and devices.
+
+    Parameters
+    ----------
+    func : callable
+        Waveform function. All arguments must be hashable.
+
+    Returns
+    -------
+    wrapper : callable
+        The memoized waveform function, with `cache_info` and `cache_clear`.
+    """
+
+    @lru_cache(maxsize=WAVEFORM_CACHE_SIZE)
+    def cached_func(*args, **kwargs):
+        waveform = np.asarray(func(*args, **kwargs), dtype=float)
+        waveform.setflags(write=False)
+        return waveform
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached_func(*args, **kwargs)
+
+    wrapper.cache_info = cached_func.cache_info
+    wrapper.cache_clear = cached_func.cache_clear
+    return wrapper
+
+
+@cached_waveform
 def camera_exposure(
     sample_rate=100000, sweep_time=0.4, exposure=0.4, camera_delay=0.001
 ):
@@ -91,6 +131,7 @@ def camera_exposure(
     return np.array(array)
 
 
+@cached_waveform
 def single_pulse(
     sample_rate=100000, sweep_time=0.4, delay=10, pulse_width=1, amplitude=1, offset=0
 ):
@@ -137,6 +178,7 @@ def single_pulse(
     return np.array(array)
 
 
+@cached_waveform
 def remote_focus_ramp(
     sample_rate=100000,
     exposure_time=0.2,
@@ -213,6 +255,7 @@ def remote_focus_ramp(
     return waveform
 
 
+@cached_waveform
 def remote_focus_ramp_triangular(
     sample_rate=100000,
     exposure_time=0.2,
@@ -303,6 +346,7 @@ def remote_focus_ramp_triangular(
     return waveform
 
 
+@cached_waveform
 def sawtooth(
     sample_rate=100000,
     sweep_time=0.4,
@@ -342,6 +386,9 @@ def sawtooth(
     >>> typical_galvo = sawtooth(sample_rate, sweep_time, 10, 1, 0, 50, np.pi/2)
     """
 
+    # scipy is imported on first use to keep it off the startup path.
+    from scipy import signal
+
     samples = int(np.multiply(sample_rate, sweep_time))
     duty_cycle = duty_cycle / 100
     t = np.linspace(0, sweep_time, samples)
@@ -351,6 +398,7 @@ def sawtooth(
     return waveform
 
 
+@cached_waveform
 def dc_value(sample_rate=100000, sweep_time=0.4, amplitude=1):
     """
     Returns a numpy array with a DC value
@@ -380,6 +428,7 @@ def dc_value(sample_rate=100000, sweep_time=0.4, amplitude=1):
     return waveform
 
 
+@cached_waveform
 def square(
     sample_rate=100000,
     sweep_time=0.4,
@@ -417,6 +466,8 @@ def square(
     --------
     >>> typical_laser = square(sample_rate, sweep_time, 10, 1, 0, 50, np.pi)
     """
+    from scipy import signal
+
     samples = int(sample_rate * sweep_time)
     duty_cycle = duty_cycle / 100
     t = np.linspace(0, sweep_time, samples)
@@ -425,6 +476,7 @@ def square(
     return waveform
 
 
+@cached_waveform
 def sine_wave(
     sample_rate=100000, sweep_time=0.4, frequency=10, amplitude=1, offset=0, phase=0
 ):
@@ -462,8 +514,20 @@ def sine_wave(
     return waveform
 
 
+#: OrderedDict: Smoothed waveforms of read-only waveforms, in LRU order.
+_smoothed_waveforms = OrderedDict()
+
+#: threading.Lock: Lock of the smoothed waveform cache.
+_smoothed_waveforms_lock = threading.Lock()
+
+
 def smooth_waveform(waveform, percent_smoothing=10):
-    """Smooths a numpy array via convolution
+    """Smooths a numpy array with a moving average
+
+    The moving average is calculated with cumulative sums, so the cost doesn't
+    depend on the window length. Read-only waveforms, such as the ones returned
+    by the waveform functions in this module, can't change, so their smoothed
+    waveforms are memoized.
 
     Parameters
     ----------
@@ -482,9 +546,55 @@ def smooth_waveform(waveform, percent_smoothing=10):
     if window_length == 0:
         # cannot smooth
         return waveform
-    waveform_padded = np.pad(waveform, window_length, mode="edge")
+
+    read_only = isinstance(waveform, np.ndarray) and not waveform.flags.writeable
+    key = (id(waveform), window_length)
+    if read_only:
+        with _smoothed_waveforms_lock:
+            cached = _smoothed_waveforms.get(key, None)
+            if cached is not None and cached[0] is waveform:
+                _smoothed_waveforms.move_to_end(key)
+                return cached[1]
+
+    waveform_padded = np.pad(np.asarray(waveform, dtype=float), window_length, "edge")
+    cumulative_sum = np.cumsum(np.insert(waveform_padded, 0, 0))
     smoothed_waveform = (
-        np.convolve(waveform_padded, np.ones(window_length), "valid") / window_length
-    )
+        cumulative_sum[window_length:] - cumulative_sum[:-window_length]
+    ) / window_length
+
+    if read_only:
+        smoothed_waveform.setflags(write=False)
+        with _smoothed_waveforms_lock:
+            # keep the waveform, so its id can't be reused by another array
+            _smoothed_waveforms[key] = (waveform, smoothed_waveform)
+            if len(_smoothed_waveforms) > WAVEFORM_CACHE_SIZE:
+                _smoothed_waveforms.popitem(last=False)
 
     return smoothed_waveform
+
+
+def clip_waveform(waveform, min_voltage, max_voltage):
+    """Clip a waveform to the voltage limits of a device.
+
+    The waveform is returned unchanged if it is already within the limits, so
+    memoized waveforms are shared instead of copied.
+
+    Parameters
+    ----------
+    waveform : np.array
+        The waveform to be clipped
+    min_voltage : float
+        Minimum voltage
+    max_voltage : float
+        Maximum voltage
+
+    Returns
+    -------
+    clipped_waveform : np.array
+        The clipped waveform
+    """
+    if np.size(waveform) == 0 or (
+        np.min(waveform) >= min_voltage and np.max(waveform) <= max_voltage
+    ):
+        return waveform
+    return np.clip(waveform, min_voltage, max_voltage)
@@ -31,18 +31,23 @@
 #
 
 # Standard library imports
+import copy
+import hashlib
 import importlib
-from importlib.metadata import entry_points
+from importlib.metadata import entry_points, version, PackageNotFoundError
 import importlib.resources
 import pkgutil
 import os
 import inspect
 import logging
+import threading
+from functools import partial
 from typing import Optional, Any
 
 # Local application imports
-from navigate.tools.file_functions import load_yaml_file
+from navigate.tools.file_functions import load_yaml_file, save_yaml_file
 from navigate.tools.common_functions import load_module_from_file
+from navigate.tools.decorators import FeatureList, AcquisitionMode
 from navigate.model.features import feature_related_functions
 
 # Logger setup
@@ -50,6 +55,10 @@ p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
 
+#: int: Version of the plugin manifest format.
+MANIFEST_VERSION = 1
+
+
 def register_features(module) -> None:
     """Register features
 
@@ -63,6 +72,314 @@ def register_features(module) -> None:
             setattr(feature_related_functions, c, getattr(module, c))
 
 
+def register_lazy_features(module, class_names) -> None:
+    """Register features that are imported on first use
+
+    Parameters
+    ----------
+    module : LazyModule
+        The module defining the features
+    class_names : list
+        Names of the feature classes
+    """
+    for c in class_names:
+        if c not in vars(feature_related_functions):
+            feature_related_functions.plugin_features[c] = module
+
+
+def get_module_classes(module) -> list:
+    """Get the names of the classes defined in a module
+
+    Parameters
+    ----------
+    module : module
+        A python module
+
+    Returns
+    -------
+    class_names : list
+        Names of the classes defined in the module, not the imported ones.
+    """
+    return [
+        c
+        for c in dir(module)
+        if inspect.isclass(getattr(module, c))
+        and getattr(module, c).__module__ == module.__name__
+    ]
+
+
+def get_module_manifest(module) -> dict:
+    """List the feature lists and acquisition modes of a module
+
+    Parameters
+    ----------
+    module : module
+        A python module
+
+    Returns
+    -------
+    manifest : dict
+        Name of the function of each feature list, and the acquisition modes.
+    """
+    manifest = {"feature_lists": {}, "acquisition_modes": []}
+    for name in dir(module):
+        attribute = getattr(module, name)
+        if isinstance(attribute, FeatureList):
+            manifest["feature_lists"][name] = attribute._feature_list.__name__
+        elif isinstance(attribute, AcquisitionMode):
+            manifest["acquisition_modes"].append(name)
+    return manifest
+
+
+def get_device_manifest(module) -> dict:
+    """List what registering a plugin device needs from its module
+
+    Parameters
+    ----------
+    module : module
+        device_startup_functions module
+
+    Returns
+    -------
+    manifest : dict
+        Device constants, and the names of the device functions.
+    """
+    return {
+        "attributes": {
+            name: getattr(module, name)
+            for name in ["DEVICE_TYPE_NAME", "DEVICE_REF_LIST"]
+            if hasattr(module, name)
+        },
+        "functions": [
+            name for name in ["load_device", "start_device"] if hasattr(module, name)
+        ],
+    }
+
+
+def get_files_signature(path) -> str:
+    """Get a signature of the python and yaml files in a folder
+
+    The signature changes when a file is added, removed or modified.
+
+    Parameters
+    ----------
+    path : str
+        Folder path
+
+    Returns
+    -------
+    signature : str
+        Hash of the names, modification times and sizes of the files.
+    """
+    file_stats = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for file_name in sorted(files):
+            if not file_name.endswith((".py", ".yml", ".yaml")):
+                continue
+            file_path = os.path.join(root, file_name)
+            stat = os.stat(file_path)
+            file_stats.append(
+                f"{os.path.relpath(file_path, path)}:{stat.st_mtime_ns}:{stat.st_size}"
+            )
+    return hashlib.sha1("\n".join(file_stats).encode()).hexdigest()
+
+
+class LazyModule:
+    """A module that is imported the first time one of its attributes is used.
+
+    Attributes known in advance, e.g. from the plugin manifest, are set on the
+    object and don't import the module.
+    """
+
+    def __init__(self, load_module, attributes=None) -> None:
+        """Initialize LazyModule
+
+        Parameters
+        ----------
+        load_module : func
+            Function importing and returning the module
+        attributes : dict
+            Attributes known without importing the module
+        """
+        #: func: Function importing and returning the module.
+        self._load_module = load_module
+
+        #: module: The imported module.
+        self._module = None
+
+        #: threading.Lock: Lock of the import.
+        self._lock = threading.Lock()
+
+        if attributes:
+            self.__dict__.update(attributes)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def load(self):
+        """Import the module
+
+        Returns
+        -------
+        module : module
+            The imported module
+
+        Raises
+        ------
+        RuntimeError
+            If the module can't be imported.
+        """
+        with self._lock:
+            if self._module is None:
+                try:
+                    self._module = self._load_module()
+                except (ImportError, AttributeError) as e:
+                    raise RuntimeError(f"Plugin module can't be loaded: {e}") from e
+                if self._module is None:
+                    raise RuntimeError("Plugin module can't be loaded.")
+        return self._module
+
+    def lazy_function(self, name):
+        """Get a function that imports the module when it is called
+
+        Parameters
+        ----------
+        name : str
+            Name of the function in the module
+
+        Returns
+        -------
+        func : func
+            Function calling the module function
+        """
+
+        def func(*args, **kwargs):
+            return getattr(self.load(), name)(*args, **kwargs)
+
+        func.__name__ = name
+        return func
+
+    @classmethod
+    def from_manifest(cls, load_module, manifest):
+        """Build a lazy module from the manifest of a module
+
+        Parameters
+        ----------
+        load_module : func
+            Function importing and returning the module
+        manifest : dict
+            Module manifest
+
+        Returns
+        -------
+        module : LazyModule
+            The lazy module
+        """
+        module = cls(load_module, manifest.get("attributes", {}))
+        for name in manifest.get("functions", []):
+            setattr(module, name, module.lazy_function(name))
+        for name, function_name in manifest.get("feature_lists", {}).items():
+            func = module.lazy_function(name)
+            func.__name__ = function_name
+            setattr(module, name, FeatureList(func))
+        for name in manifest.get("acquisition_modes", []):
+            setattr(module, name, AcquisitionMode(module.lazy_function(name)))
+        return module
+
+
+class PluginManifest:
+    """Cache of what each plugin registers
+
+    Plugins are listed with a signature of their files, or their package version.
+    While the signature doesn't change, features, devices, feature lists and
+    acquisition modes are registered from the manifest, and their modules are
+    only imported when they are first used.
+    """
+
+    def __init__(self, manifest_path: str) -> None:
+        """Initialize PluginManifest
+
+        Parameters
+        ----------
+        manifest_path : str
+            manifest file path
+        """
+        #: str: manifest file path
+        self.manifest_path = manifest_path
+
+        #: dict: manifest of each plugin
+        self.plugins = self.read()
+
+        #: dict: manifest when it was read
+        self.saved_plugins = copy.deepcopy(self.plugins)
+
+    def read(self) -> dict:
+        """Read the manifest file
+
+        Returns
+        -------
+        plugins : dict
+            manifest of each plugin, empty if the file is missing or outdated
+        """
+        try:
+            manifest = load_yaml_file(self.manifest_path)
+        except Exception as e:
+            logger.debug(f"Plugin manifest can't be read: {e}")
+            manifest = None
+        if not manifest or manifest.get("version", None) != MANIFEST_VERSION:
+            return {}
+        return manifest.get("plugins", {}) or {}
+
+    def get_plugin(self, plugin_manager, plugin_ref) -> dict:
+        """Get the manifest of a plugin
+
+        Parameters
+        ----------
+        plugin_manager : PluginFileManager or PluginPackageManager
+            plugin manager
+        plugin_ref : str
+            plugin path or package name
+
+        Returns
+        -------
+        manifest : dict
+            manifest of the plugin, empty if the plugin changed
+        """
+        key = str(plugin_ref)
+        signature = plugin_manager.get_signature(plugin_ref)
+        manifest = self.plugins.get(key, None)
+        if manifest is None or manifest.get("signature", None) != signature:
+            manifest = {"signature": signature}
+            self.plugins[key] = manifest
+        return manifest
+
+    def save(self) -> None:
+        """Save the manifest, if it changed
+
+        Plugins listed by another process with the same signature are kept.
+        """
+        if self.plugins == self.saved_plugins:
+            return
+        plugins = self.read()
+        for key, manifest in self.plugins.items():
+            if plugins.get(key, {}).get("signature", None) == manifest["signature"]:
+                plugins[key].update(manifest)
+            else:
+                plugins[key] = manifest
+        if not save_yaml_file(
+            os.path.dirname(self.manifest_path),
+            {"version": MANIFEST_VERSION, "plugins": plugins},
+            os.path.basename(self.manifest_path),
+        ):
+            logger.debug(f"Plugin manifest can't be saved: {self.manifest_path}")
+            return
+        self.plugins = plugins
+        self.saved_plugins = copy.deepcopy(plugins)
+
+
 class PluginPackageManager:
     """Plugin package manager"""
 
@@ -89,6 +406,27 @@ class PluginPackageManager:
             plugins[plugin_package_name] = plugin_package_name
         return plugins
 
+    @staticmethod
+    def get_signature(package_name: str) -> str:
+        """Get the signature of a plugin package
+
+        Parameters
+        ----------
+        package_name : str
+            package name
+
+        Returns
+        -------
+        signature : str
+            package version and signature of the package files
+        """
+        try:
+            package_version = version(package_name)
+        except PackageNotFoundError:
+            package_version = ""
+        package_path = str(importlib.resources.files(package_name))
+        return f"{package_version}:{get_files_signature(package_path)}"
+
     @staticmethod
     def load_config(package_name: str) -> dict:
         """Load plugin_config.yml
@@ -170,7 +508,7 @@ class PluginPackageManager:
             return None
 
     @staticmethod
-    def load_feature_lists(package_name, register_func) -> None:
+    def load_feature_lists(package_name, register_func, manifest=None) -> None:
         """Load feature lists
 
         Parameters
@@ -179,26 +517,53 @@ class PluginPackageManager:
             package name
         register_func : func
             the function to handle feature lists
+        manifest : dict
+            plugin manifest, read if it lists the feature lists, otherwise filled
         """
+        feature_list_path = importlib.resources.files(package_name).joinpath(
+            "feature_list.py"
+        )
+        load_module = partial(importlib.import_module, f"{package_name}.feature_list")
+        if manifest is not None and "feature_lists" in manifest:
+            if manifest["feature_lists"] is not None:
+                register_func(
+                    feature_list_path,
+                    LazyModule.from_manifest(
+                        load_module, {"feature_lists": manifest["feature_lists"]}
+                    ),
+                )
+            return
         try:
-            module = importlib.import_module(f"{package_name}.feature_list")
-            register_func(
-                importlib.resources.files(package_name).joinpath("feature_list.py"),
-                module,
-            )
+            module = load_module()
+            register_func(feature_list_path, module)
         except (ImportError, AttributeError):
             logger.debug("Plugin feature list not found.")
-            pass
+            module = None
+        if manifest is not None:
+            manifest["feature_lists"] = (
+                get_module_manifest(module)["feature_lists"] if module else None
+            )
 
     @staticmethod
-    def load_features(package_name):
+    def load_features(package_name, manifest=None):
         """Load features
 
         Parameters
         ----------
         package_name : str
             package name
+        manifest : dict
+            plugin manifest, read if it lists the features, otherwise filled
         """
+        if manifest is not None and "features" in manifest:
+            for module_name, class_names in manifest["features"].items():
+                full_module_name = f"{package_name}.model.features.{module_name}"
+                register_lazy_features(
+                    LazyModule(partial(importlib.import_module, full_module_name)),
+                    class_names,
+                )
+            return
+        features = {}
         for _, module_name, is_pkg in pkgutil.iter_modules(
             [importlib.resources.files(package_name).joinpath("model/features")]
         ):
@@ -210,9 +575,14 @@ class PluginPackageManager:
                     logger.debug("Plugin feature not found.")
                     continue
                 register_features(module)
+                features[module_name] = get_module_classes(module)
+        if manifest is not None:
+            manifest["features"] = features
 
     @staticmethod
-    def load_acquisition_modes(package_name, acquisition_modes, register_func):
+    def load_acquisition_modes(
+        package_name, acquisition_modes, register_func, manifest=None
+    ):
         """Load acquisition modes
 
         Parameters
@@ -223,19 +593,36 @@ class PluginPackageManager:
             list of acquisition mode configurations
         register_func : func
             the function to register acquisition modes
+        manifest : dict
+            plugin manifest, read if it lists the acquisition modes, otherwise filled
         """
+        modes_manifest = {}
+        if manifest is not None:
+            modes_manifest = manifest.setdefault("acquisition_modes", {})
         for acquisition_mode_config in acquisition_modes:
-            acquisition_file = acquisition_mode_config["file_name"][:-3]
-            try:
-                module = importlib.import_module(f"{package_name}.{acquisition_file}")
-            except (ImportError, AttributeError):
-                logger.debug("Plugin acquisition mode not found.")
-                continue
+            file_name = acquisition_mode_config["file_name"]
+            load_module = partial(
+                importlib.import_module, f"{package_name}.{file_name[:-3]}"
+            )
+            if file_name in modes_manifest:
+                module = LazyModule.from_manifest(
+                    load_module, {"acquisition_modes": modes_manifest[file_name]}
+                )
+            else:
+                try:
+                    module = load_module()
+                except (ImportError, AttributeError):
+                    logger.debug("Plugin acquisition mode not found.")
+                    continue
+                if manifest is not None:
+                    modes_manifest[file_name] = get_module_manifest(module)[
+                        "acquisition_modes"
+                    ]
             if module:
                 register_func(acquisition_mode_config["name"], module)
 
     @staticmethod
-    def load_devices(package_name, register_func):
+    def load_devices(package_name, register_func, manifest=None):
         """Load devices
 
         Parameters
@@ -244,7 +631,24 @@ class PluginPackageManager:
             package name
         register_func : func
             the function to register devices
+        manifest : dict
+            plugin manifest, read if it lists the devices, otherwise filled
         """
+        if manifest is not None and "devices" in manifest:
+            for module_name, device_manifest in manifest["devices"].items():
+                full_module_name = (
+                    f"{package_name}.model."
+                    f"devices.{module_name}.device_startup_functions"
+                )
+                register_func(
+                    module_name,
+                    LazyModule.from_manifest(
+                        partial(importlib.import_module, full_module_name),
+                        device_manifest,
+                    ),
+                )
+            return
+        devices = {}
         for _, module_name, is_pkg in pkgutil.iter_modules(
             [importlib.resources.files(package_name).joinpath("model/devices")]
         ):
@@ -259,6 +663,9 @@ class PluginPackageManager:
                     logger.debug("Plugin device not found.")
                     continue
                 register_func(module_name, module)
+                devices[module_name] = get_device_manifest(module)
+        if manifest is not None:
+            manifest["devices"] = devices
 
 
 class PluginFileManager:
@@ -311,6 +718,22 @@ class PluginFileManager:
 
         return plugins
 
+    @staticmethod
+    def get_signature(plugin_path):
+        """Get the signature of a plugin folder
+
+        Parameters
+        ----------
+        plugin_path : str
+            plugin path
+
+        Returns
+        -------
+        signature : str
+            signature of the plugin files
+        """
+        return get_files_signature(plugin_path)
+
     @staticmethod
     def load_config(plugin_path):
         """Load plugin_config.yml
@@ -383,7 +806,7 @@ class PluginFileManager:
         return None
 
     @staticmethod
-    def load_feature_lists(plugin_path, register_func):
+    def load_feature_lists(plugin_path, register_func, manifest=None):
         """Load feature lists
 
         Parameters
@@ -392,33 +815,69 @@ class PluginFileManager:
             plugin path
         register_func : func
             the function to handle feature lists
+        manifest : dict
+            plugin manifest, read if it lists the feature lists, otherwise filled
         """
         plugin_feature_list = os.path.join(plugin_path, "feature_list.py")
+        load_module = partial(
+            load_module_from_file, "feature_list_temp", plugin_feature_list
+        )
+        if manifest is not None and "feature_lists" in manifest:
+            if manifest["feature_lists"] is not None:
+                register_func(
+                    plugin_feature_list,
+                    LazyModule.from_manifest(
+                        load_module, {"feature_lists": manifest["feature_lists"]}
+                    ),
+                )
+            return
+        module = None
         if os.path.exists(plugin_feature_list):
-            module = load_module_from_file("feature_list_temp", plugin_feature_list)
+            module = load_module()
             register_func(plugin_feature_list, module)
+        if manifest is not None:
+            manifest["feature_lists"] = (
+                get_module_manifest(module)["feature_lists"] if module else None
+            )
 
     @staticmethod
-    def load_features(plugin_path):
+    def load_features(plugin_path, manifest=None):
         """Load features
 
         Parameters
         ----------
         plugin_path : str
             plugin path
+        manifest : dict
+            plugin manifest, read if it lists the features, otherwise filled
         """
         features_dir = os.path.join(plugin_path, "model", "features")
+        if manifest is not None and "features" in manifest:
+            for feature, class_names in manifest["features"].items():
+                feature_file = os.path.join(features_dir, feature)
+                register_lazy_features(
+                    LazyModule(partial(load_module_from_file, feature, feature_file)),
+                    class_names,
+                )
+            return
         features = []
         if os.path.exists(features_dir):
             features = os.listdir(features_dir)
+        features_manifest = {}
         for feature in features:
             feature_file = os.path.join(features_dir, feature)
             if os.path.isfile(feature_file):
                 module = load_module_from_file(feature, feature_file)
                 register_features(module)
+                if module:
+                    features_manifest[feature] = get_module_classes(module)
+        if manifest is not None:
+            manifest["features"] = features_manifest
 
     @staticmethod
-    def load_acquisition_modes(plugin_path, acquisition_modes, register_func):
+    def load_acquisition_modes(
+        plugin_path, acquisition_modes, register_func, manifest=None
+    ):
         """Load acquisition modes
 
         Parameters
@@ -429,17 +888,36 @@ class PluginFileManager:
             list of acquisition mode configurations
         register_func : func
             the function to register acquisition modes
+        manifest : dict
+            plugin manifest, read if it lists the acquisition modes, otherwise filled
         """
+        modes_manifest = {}
+        if manifest is not None:
+            modes_manifest = manifest.setdefault("acquisition_modes", {})
         for acquisition_mode_config in acquisition_modes:
             acquisition_file = acquisition_mode_config["file_name"]
             full_path_name = os.path.join(plugin_path, acquisition_file)
-            if os.path.exists(full_path_name):
-                module = load_module_from_file(acquisition_file[:-3], full_path_name)
-                if module:
-                    register_func(acquisition_mode_config["name"], module)
+            load_module = partial(
+                load_module_from_file, acquisition_file[:-3], full_path_name
+            )
+            if acquisition_file in modes_manifest:
+                module = LazyModule.from_manifest(
+                    load_module,
+                    {"acquisition_modes": modes_manifest[acquisition_file]},
+                )
+            elif os.path.exists(full_path_name):
+                module = load_module()
+                if module and manifest is not None:
+                    modes_manifest[acquisition_file] = get_module_manifest(module)[
+                        "acquisition_modes"
+                    ]
+            else:
+                continue
+            if module:
+                register_func(acquisition_mode_config["name"], module)
 
     @staticmethod
-    def load_devices(plugin_path, register_func):
+    def load_devices(plugin_path, register_func, manifest=None):
         """Load devices
 
         Parameters
@@ -448,8 +926,24 @@ class PluginFileManager:
             plugin path
         register_func : func
             the function to register devices
+        manifest : dict
+            plugin manifest, read if it lists the devices, otherwise filled
         """
         device_dir = os.path.join(plugin_path, "model", "devices")
+        if manifest is not None and "devices" in manifest:
+            for device, device_manifest in manifest["devices"].items():
+                device_file = os.path.join(
+                    device_dir, device, "device_startup_functions.py"
+                )
+                register_func(
+                    device,
+                    LazyModule.from_manifest(
+                        partial(load_module_from_file, "device_module", device_file),
+                        device_manifest,
+                    ),
+                )
+            return
+        devices_manifest = {}
         if os.path.exists(device_dir) and os.path.isdir(device_dir):
             devices = os.listdir(device_dir)
             for device in devices:
@@ -465,3 +959,7 @@ class PluginFileManager:
                     logger.debug(f"Plugin device {device} not found.")
                     continue
                 register_func(device, module)
+                if module:
+                    devices_manifest[device] = get_device_manifest(module)
+        if manifest is not None:
+            manifest["devices"] = devices_manifest
@@ -115,3 +115,46 @@ def create_arrow_image(
     draw.regular_polygon(bounding_circle, n_sides=3, rotation=rotation, fill="black")
 
     return image
+
+
+def binned_histogram(image, bins=20, max_samples=2**18):
+    """Histogram of an image with equally sized bins between its min and max.
+
+    Large images are subsampled with a fixed stride, and the counts are scaled
+    back to the full number of pixels. Integer images are binned with integer
+    arithmetic and np.bincount.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        Image data
+    bins : int
+        Number of bins
+    max_samples : int
+        Maximum number of pixels used to compute the histogram
+
+    Returns
+    -------
+    counts : np.ndarray
+        Number of pixels in each bin
+    edges : np.ndarray
+        Bin edges, of length bins + 1
+    """
+    data = np.ravel(image)
+    stride = max(1, -(-data.size // max_samples))
+    data = data[::stride]
+    minimum, maximum = data.min(), data.max()
+
+    if np.issubdtype(data.dtype, np.integer):
+        minimum, maximum = int(minimum), int(maximum)
+        width = maximum - minimum + 1
+        indices = (data.astype(np.int64) - minimum) * bins // width
+        edges = minimum + np.arange(bins + 1) * width / bins
+    else:
+        width = float(maximum - minimum) or 1.0
+        indices = ((data - minimum) * (bins / width)).astype(np.int64)
+        np.minimum(indices, bins - 1, out=indices)
+        edges = minimum + np.arange(bins + 1) * width / bins
+
+    counts = np.bincount(indices, minlength=bins) * stride
+    return counts, edges
@@ -187,6 +187,15 @@ def create_parser():
         help="Enables debugging tool menu to be accessible.",
     )
 
+    input_args.add_argument(
+        "--profile-startup",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Startup Profiling - "
+        "Reports the time spent importing each module and starting each device.",
+    )
+
     # Non-Default Configuration and Experiment Input Arguments
     input_args.add_argument(
         "--config-file",
@@ -216,6 +216,222 @@ def calc_num_tiles(dist, overlap, roi_length):
     return int(num_tiles)
 
 
+#: list: Names of the multi-position visiting orders.
+ROUTES = ["Table Order", "Serpentine", "Shortest Path"]
+
+#: list: Stage axes, in the column order of the multi-position table.
+AXES = ["x", "y", "z", "theta", "f"]
+
+
+def get_stage_velocities(configuration, microscope_name):
+    """Get the relative velocities of the stage axes of a microscope.
+
+    The velocities are read from the optional ``x_velocity``, ``y_velocity``, ...
+    entries of the stage configuration, and default to 1.
+
+    Parameters
+    ----------
+    configuration : dict
+        Navigate configuration.
+    microscope_name : str
+        Name of the microscope.
+
+    Returns
+    -------
+    velocities : list
+        Velocity of each axis, in the column order of the multi-position table.
+    """
+    stage = configuration["configuration"]["microscopes"][microscope_name]["stage"]
+    velocities = []
+    for axis in AXES:
+        try:
+            velocity = float(stage.get(f"{axis}_velocity", 1.0))
+        except (TypeError, ValueError):
+            velocity = 1.0
+        velocities.append(velocity if velocity > 0 else 1.0)
+    return velocities
+
+
+def travel_times(positions, position, velocities=None):
+    """Time to travel from one position to each of a list of positions.
+
+    The stage axes move at the same time, so the travel time is that of the
+    slowest axis.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        (n_positions x (x, y, z, theta, f)) array of positions.
+    position : np.ndarray
+        The (x, y, z, theta, f) starting position.
+    velocities : list
+        Velocity of each axis. Defaults to 1 for each axis.
+
+    Returns
+    -------
+    np.ndarray
+        Travel time to each position.
+    """
+    times = np.abs(positions - position)
+    if velocities is not None:
+        times = times / np.asarray(velocities, dtype=float)
+    return times.max(axis=-1)
+
+
+def route_travel_time(positions, order, velocities=None):
+    """Total travel time of a visiting order.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        (n_positions x (x, y, z, theta, f)) array of positions.
+    order : list
+        Indices of the positions, in visiting order.
+    velocities : list
+        Velocity of each axis. Defaults to 1 for each axis.
+
+    Returns
+    -------
+    float
+        Sum of the travel times between consecutive positions.
+    """
+    positions = np.asarray(positions, dtype=float)[list(order)]
+    if len(positions) < 2:
+        return 0.0
+    return float(travel_times(positions[1:], positions[:-1], velocities).sum())
+
+
+def serpentine_route(positions, decimals=3):
+    """Visit gridded positions row by row, reversing direction every other row.
+
+    Positions are grouped by theta, then y, then x, then z and f. Within each
+    group the next axis is traversed in alternating directions, so tiles from
+    compute_tiles_from_bounding_box() are visited without long return moves.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        (n_positions x (x, y, z, theta, f)) array of positions.
+    decimals : int
+        Positions that agree to this many decimals belong to the same row.
+
+    Returns
+    -------
+    order : list
+        Indices of the positions, in visiting order.
+    """
+    positions = np.round(np.asarray(positions, dtype=float), decimals)
+
+    def snake(indices, axes, reverse):
+        if not axes or len(indices) < 2:
+            return list(indices)
+        values = positions[indices, axes[0]]
+        order = []
+        inner_reverse = False
+        for value in sorted(set(values), reverse=reverse):
+            group = indices[values == value]
+            order += snake(group, axes[1:], inner_reverse)
+            inner_reverse = not inner_reverse
+        return order
+
+    return [int(i) for i in snake(np.arange(len(positions)), [3, 1, 0, 2, 4], False)]
+
+
+def shortest_route(positions, velocities=None, max_two_opt_size=1000):
+    """Find a short visiting order with nearest-neighbor search and 2-opt.
+
+    The route starts at the first position. The nearest-neighbor route is
+    improved by reversing segments (2-opt) until no reversal shortens it. 2-opt
+    is skipped for tables with more than max_two_opt_size positions.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        (n_positions x (x, y, z, theta, f)) array of positions.
+    velocities : list
+        Velocity of each axis. Defaults to 1 for each axis.
+    max_two_opt_size : int
+        Largest table that is improved with 2-opt.
+
+    Returns
+    -------
+    order : list
+        Indices of the positions, in visiting order.
+    """
+    positions = np.asarray(positions, dtype=float)
+    n = len(positions)
+    if n < 3:
+        return list(range(n))
+
+    # nearest neighbor
+    order = [0]
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    for _ in range(n - 1):
+        times = travel_times(positions, positions[order[-1]], velocities)
+        times[~unvisited] = np.inf
+        nearest = int(np.argmin(times))
+        order.append(nearest)
+        unvisited[nearest] = False
+
+    if n > max_two_opt_size:
+        return order
+
+    # 2-opt, the route is open so the last position has no outgoing move
+    times = np.stack(
+        [travel_times(positions, position, velocities) for position in positions]
+    )
+    order = np.array(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(n - 2):
+            a, b = order[i], order[i + 1]
+            c = order[i + 2 :]
+            d = np.append(order[i + 3 :], -1)
+            gain = times[a, b] + np.where(d >= 0, times[c, d], 0)
+            gain -= times[a, c] + np.where(d >= 0, times[b, d], 0)
+            j = int(np.argmax(gain))
+            if gain[j] > 1e-9:
+                order[i + 1 : i + j + 3] = order[i + 1 : i + j + 3][::-1]
+                improved = True
+    return [int(i) for i in order]
+
+
+def plan_route(positions, route="Table Order", velocities=None):
+    """Plan the order in which the multi-position table is visited.
+
+    Parameters
+    ----------
+    positions : list
+        Multi-position table, each row contains an X, Y, Z, R, F position.
+    route : str
+        One of ROUTES.
+    velocities : list
+        Velocity of each axis. Defaults to 1 for each axis.
+
+    Returns
+    -------
+    order : list
+        Table row of each visit, so the i-th position visited (and saved) is
+        row order[i] of the table.
+    """
+    positions = np.array([list(position)[:5] for position in positions], dtype=float)
+    if route == "Serpentine":
+        order = serpentine_route(positions)
+    elif route == "Shortest Path":
+        order = shortest_route(positions, velocities)
+    else:
+        return list(range(len(positions)))
+
+    # never take a longer route than the table order
+    if route_travel_time(positions, order, velocities) >= route_travel_time(
+        positions, range(len(positions)), velocities
+    ):
+        return list(range(len(positions)))
+    return order
+
+
 def update_table(table, pos, append=False):
     """Updates and redraws table based on given list.
 
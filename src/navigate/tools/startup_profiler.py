@@ -0,0 +1,227 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# Standard Library Imports
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Third Party Imports
+
+# Local Imports
+
+# Logger Setup
+p = __name__.split(".")[1]
+logger = logging.getLogger(p)
+
+
+class _TimedLoader:
+    """Loader proxy that reports how long the wrapped loader takes to run a module.
+
+    Every other attribute is forwarded to the wrapped loader, so resource readers
+    and similar loader features keep working on the imported modules.
+    """
+
+    def __init__(self, loader, profiler):
+        """Initialize the loader proxy.
+
+        Parameters
+        ----------
+        loader : importlib.abc.Loader
+            The loader found by the regular import machinery.
+        profiler : StartupProfiler
+            The profiler that records the import times.
+        """
+        #: importlib.abc.Loader: The wrapped loader.
+        self.loader = loader
+
+        #: StartupProfiler: The profiler that records the import times.
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        """Create the module, timing extension modules that initialize here."""
+        with self.profiler.time_import(spec.name):
+            return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Execute the module body."""
+        with self.profiler.time_import(module.__name__):
+            self.loader.exec_module(module)
+
+
+class StartupProfiler:
+    """Record where navigate spends its time before it is ready to use.
+
+    The profiler records the time spent importing each module and the time of
+    named startup stages, such as creating the controller or starting a device.
+    Import times are recorded while the profiler is installed on
+    ``sys.meta_path``; modules imported before :meth:`install` are not seen.
+    """
+
+    def __init__(self):
+        #: dict: Module name to [self time, cumulative time] spent importing it.
+        self.imports = {}
+
+        #: dict: Startup stage name to the time in seconds it took.
+        self.stages = {}
+
+        #: float: Time the profiler was created, in ``time.perf_counter`` units.
+        self.start_time = time.perf_counter()
+
+        #: threading.Lock: Lock guarding the recorded times.
+        self.lock = threading.Lock()
+
+        #: threading.local: Per-thread stack of the imports in progress.
+        self.local = threading.local()
+
+    def install(self):
+        """Start recording module imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop recording module imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the module with the remaining finders and time its loader.
+
+        Parameters
+        ----------
+        fullname : str
+            Fully qualified name of the module.
+        path : list, optional
+            Search path of the parent package.
+        target : module, optional
+            Module being reloaded, if any.
+
+        Returns
+        -------
+        spec : importlib.machinery.ModuleSpec or None
+            The module specification, or None if no finder knows the module.
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    @contextmanager
+    def time_import(self, name):
+        """Time the import of one module, excluding the modules it imports.
+
+        Parameters
+        ----------
+        name : str
+            Fully qualified name of the module.
+        """
+        stack = self.local.__dict__.setdefault("stack", [])
+        # [name, start time, time spent importing other modules]
+        entry = [name, time.perf_counter(), 0.0]
+        stack.append(entry)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter() - entry[1]
+            if stack:
+                stack[-1][2] += elapsed
+            with self.lock:
+                times = self.imports.setdefault(name, [0.0, 0.0])
+                times[0] += elapsed - entry[2]
+                times[1] += elapsed
+
+    @contextmanager
+    def stage(self, name):
+        """Time a named startup stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start_time)
+
+    def record(self, name, duration):
+        """Record the duration of a startup stage measured elsewhere.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        duration : float
+            Duration in seconds.
+        """
+        with self.lock:
+            self.stages[name] = duration
+
+    def report(self, max_imports=25):
+        """Format the recorded times.
+
+        Parameters
+        ----------
+        max_imports : int
+            Number of the slowest imports to list.
+
+        Returns
+        -------
+        report : str
+            The startup profile report.
+        """
+        with self.lock:
+            stages = dict(self.stages)
+            imports = dict(self.imports)
+        lines = [
+            f"Startup took {time.perf_counter() - self.start_time:.3f} s",
+            "Startup stages:",
+        ]
+        for name, duration in stages.items():
+            lines.append(f"    {name}: {duration:.3f} s")
+        lines.append(f"Slowest of {len(imports)} imports (self time, cumulative time):")
+        slowest = sorted(imports.items(), key=lambda v: v[1][0], reverse=True)
+        for name, (self_time, cumulative_time) in slowest[:max_imports]:
+            lines.append(f"    {name}: {self_time:.3f} s, {cumulative_time:.3f} s")
+        return "\n".join(lines)
@@ -744,6 +744,21 @@ class MultiPointFrame(ttk.Labelframe):
             row=0, column=2, sticky=tk.NSEW, padx=(10, 0), pady=(4, 4)
         )
 
+        # Visiting Order
+        #: dict: Dictionary of the inputs in the frame
+        self.inputs = {}
+        self.inputs["route"] = LabelInput(
+            parent=self,
+            label="Visiting Order",
+            input_class=ValidatedCombobox,
+            input_var=tk.StringVar(),
+            input_args={"width": 14},
+        )
+        self.inputs["route"].state(["readonly"])
+        self.inputs["route"].grid(
+            row=1, column=0, columnspan=3, sticky=tk.NSEW, padx=(4, 4), pady=(4, 4)
+        )
+
     def get_variables(self):
         """Returns a dictionary of all the variables that are tied to each widget name.
 
@@ -114,8 +114,8 @@ class AutofocusPopup:
             title.grid(row=starting_row_id, column=i, sticky=tk.NSEW)
 
         # Row 1, 2 - Autofocus Settings
-        setting_names = ["coarse", "fine", "robust_fit"]
-        setting_labels = ["Coarse", "Fine", "Inverse Power Tent Fit"]
+        setting_names = ["coarse", "fine", "robust_fit", "adaptive_search"]
+        setting_labels = ["Coarse", "Fine", "Inverse Power Tent Fit", "Adaptive Search"]
         for i in range(2):
             # Column 0 - Checkboxes
             variable = tk.BooleanVar(False)
@@ -173,6 +173,13 @@ class AutofocusPopup:
         robust_fit.grid(row=starting_row_id + 4, column=0, sticky=tk.NSEW, padx=5)
         self.setting_vars["robust_fit"] = variable
 
+        variable = tk.BooleanVar(False)
+        adaptive_search = ttk.Checkbutton(
+            content_frame, text=setting_labels[3], variable=variable
+        )
+        adaptive_search.grid(row=starting_row_id + 4, column=1, sticky=tk.NSEW, padx=5)
+        self.setting_vars["adaptive_search"] = variable
+
         # Row 5, Plot
         #: matplotlib.figure.Figure: Figure for the plot.
         self.fig = Figure(figsize=(5, 5), dpi=100)
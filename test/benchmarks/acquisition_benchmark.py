@@ -0,0 +1,703 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only (subject to the
+# limitations in the disclaimer below) provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""End-to-end acquisition throughput benchmark on synthetic hardware.
+
+Drives a Model with synthetic hardware through the standard acquisition modes,
+for each data source file type and several frame sizes, and reports sustained
+frame rate, write throughput, data thread and display latency and dropped frames.
+
+Usage::
+
+    python -m test.benchmarks.acquisition_benchmark --output results.json
+    python -m test.benchmarks.acquisition_benchmark --baseline results.json
+
+The process exits with status 1 if any metric regressed against the baseline.
+"""
+
+# Standard Library Imports
+import argparse
+import datetime
+import json
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import Manager
+from pathlib import Path
+from types import SimpleNamespace
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from navigate.config.config import (
+    load_configs,
+    update_config_dict,
+    verify_experiment_config,
+    verify_waveform_constants,
+    verify_configuration,
+)
+from navigate.model.data_sources import FILE_TYPES
+
+# Sets the multiprocessing start method, so must come before any Manager is started
+from navigate.model.model import Model
+
+#: list: Acquisition modes to benchmark.
+MODES = ["single", "z-stack", "multiposition", "customized"]
+
+#: list: Frame sizes (pixels per side) to benchmark.
+SIZES = [512, 1024, 2048]
+
+#: dict: Metrics compared against a baseline, and whether higher is better.
+COMPARED_METRICS = {
+    "fps": True,
+    "write_mb_s": True,
+    "data_thread_latency_ms.p95": False,
+    "display_latency_ms.p95": False,
+    "dropped_frames": False,
+}
+
+#: list: Stage positions of multiposition acquisitions, [x, y, z, theta, f].
+MULTIPOSITIONS = [[10.0, 10.0, 10.0, 10.0, 10.0], [20.0, 20.0, 10.0, 10.0, 10.0]]
+
+
+def summarize(values):
+    """Summarize latency samples.
+
+    Parameters
+    ----------
+    values : list
+        Samples, in seconds.
+
+    Returns
+    -------
+    dict
+        Mean, 50th, 95th and 99th percentile and maximum, in milliseconds.
+        None values if there are no samples.
+    """
+    keys = ["mean", "p50", "p95", "p99", "max"]
+    if len(values) == 0:
+        return dict.fromkeys(keys)
+    values = np.asarray(values) * 1000
+    stats = [values.mean(), *np.percentile(values, [50, 95, 99]), values.max()]
+    return {k: round(float(v), 3) for k, v in zip(keys, stats)}
+
+
+def get_metric(result, name):
+    """Get a metric of a result by dotted name, e.g. "display_latency_ms.p95".
+
+    Parameters
+    ----------
+    result : dict
+        Result of one scenario.
+    name : str
+        Dotted metric name.
+
+    Returns
+    -------
+    float or None
+        The metric, or None if the result doesn't have it.
+    """
+    value = result
+    for key in name.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """Compare benchmark results against a baseline.
+
+    Parameters
+    ----------
+    results : list
+        Results of the current run.
+    baseline : list
+        Results of the baseline run. Scenarios missing from either are skipped.
+    tolerance : float
+        Relative change allowed before a metric counts as a regression.
+
+    Returns
+    -------
+    list
+        One dict per regression, with scenario, metric, baseline, value and
+        relative change.
+    """
+    baseline = {r["scenario"]: r for r in baseline}
+    regressions = []
+    for result in results:
+        reference = baseline.get(result["scenario"])
+        if reference is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            value = get_metric(result, metric)
+            base = get_metric(reference, metric)
+            if value is None or base is None:
+                continue
+            if higher_is_better:
+                regressed = value < base * (1 - tolerance)
+            else:
+                # Counts such as dropped frames may legitimately be zero.
+                regressed = value > base * (1 + tolerance) and value - base >= 1e-3
+            if regressed:
+                regressions.append(
+                    {
+                        "scenario": result["scenario"],
+                        "metric": metric,
+                        "baseline": base,
+                        "value": value,
+                        "change": (value - base) / base if base else None,
+                    }
+                )
+    return regressions
+
+
+class AcquisitionProbe:
+    """Times frames through the synthetic camera, data thread and display pipe.
+
+    Frames are timed when the camera is triggered, when the data thread receives
+    them, when the data thread hands them to the display and when the display end
+    of the pipe receives them.
+    """
+
+    def __init__(self, model):
+        """Initialize AcquisitionProbe class.
+
+        Parameters
+        ----------
+        model : navigate.model.model.Model
+            Model whose active microscope and show_img_pipe are probed.
+        """
+        #: Model: Probed model.
+        self.model = model
+
+        #: object: Probed camera.
+        self.camera = model.active_microscope.camera
+
+        #: np.ndarray: Trigger time of the last frame written to each buffer slot.
+        self.trigger_times = np.full(model.number_of_frames, np.nan)
+
+        #: float: Trigger time of the first frame.
+        self.first_trigger = None
+
+        #: list: Seconds from frame delivery to display hand-off, per batch.
+        self.data_thread_latency = []
+
+        #: list: Seconds from camera trigger to display, per displayed frame.
+        self.display_latency = []
+
+        #: float: Time the last frame was displayed.
+        self.last_display = None
+
+        self._delivered = None
+        self._pipe = None
+
+    def attach(self):
+        """Wrap the camera and the model end of show_img_pipe."""
+        camera = self.camera
+        generate_new_frame = camera.generate_new_frame
+        get_new_frame = camera.get_new_frame
+
+        def timed_generate_new_frame():
+            now = time.perf_counter()
+            if self.first_trigger is None:
+                self.first_trigger = now
+            if camera.is_acquiring:
+                self.trigger_times[camera.current_frame_idx] = now
+            return generate_new_frame()
+
+        def timed_get_new_frame():
+            frame_ids = get_new_frame()
+            self._delivered = time.perf_counter()
+            return frame_ids
+
+        camera.generate_new_frame = timed_generate_new_frame
+        camera.get_new_frame = timed_get_new_frame
+
+        self._pipe = self.model.show_img_pipe
+        self.model.show_img_pipe = SimpleNamespace(
+            send=self._send, close=self._pipe.close
+        )
+
+    def detach(self):
+        """Remove the wrappers."""
+        for name in ["generate_new_frame", "get_new_frame"]:
+            self.camera.__dict__.pop(name, None)
+        if self._pipe is not None and hasattr(self.model, "show_img_pipe"):
+            self.model.show_img_pipe = self._pipe
+        self._pipe = None
+
+    def _send(self, frame_id):
+        """Time the hand-off of a frame to the display, and send it.
+
+        Parameters
+        ----------
+        frame_id : int or str
+            Buffer slot of the frame, or "stop".
+        """
+        if frame_id != "stop" and self._delivered is not None:
+            self.data_thread_latency.append(time.perf_counter() - self._delivered)
+        self._pipe.send(frame_id)
+
+    def displayed(self, frame_id):
+        """Record that a frame was received by the display end of the pipe.
+
+        Parameters
+        ----------
+        frame_id : int
+            Buffer slot of the frame.
+        """
+        self.last_display = time.perf_counter()
+        trigger_time = self.trigger_times[frame_id]
+        if not np.isnan(trigger_time):
+            self.display_latency.append(self.last_display - trigger_time)
+
+
+def create_model(manager, configuration_directory=None):
+    """Create a Model on synthetic hardware from the shipped configuration files.
+
+    Parameters
+    ----------
+    manager : multiprocessing.managers.SyncManager
+        Manager holding the shared configuration.
+    configuration_directory : str or Path
+        Directory with configuration.yaml, experiment.yml, waveform_constants.yml
+        and rest_api_config.yml. Defaults to those shipped with navigate.
+
+    Returns
+    -------
+    navigate.model.model.Model
+        The model.
+    """
+    if configuration_directory is None:
+        import navigate.config
+
+        configuration_directory = Path(navigate.config.__file__).parent
+    configuration_directory = Path(configuration_directory)
+
+    configuration = load_configs(
+        manager,
+        configuration=configuration_directory / "configuration.yaml",
+        experiment=configuration_directory / "experiment.yml",
+        waveform_constants=configuration_directory / "waveform_constants.yml",
+        rest_api_config=configuration_directory / "rest_api_config.yml",
+    )
+    verify_configuration(manager, configuration)
+    verify_experiment_config(manager, configuration)
+    verify_waveform_constants(manager, configuration)
+
+    return Model(
+        args=SimpleNamespace(synthetic_hardware=True),
+        configuration=configuration,
+        event_queue=queue.Queue(),
+    )
+
+
+def configure_scenario(
+    model, manager, mode, file_type, size, save_directory, z_steps, exposure_ms
+):
+    """Set up the experiment of one benchmark scenario.
+
+    Parameters
+    ----------
+    model : navigate.model.model.Model
+        Model to configure.
+    manager : multiprocessing.managers.SyncManager
+        Manager holding the shared configuration.
+    mode : str
+        One of MODES.
+    file_type : str
+        One of FILE_TYPES, or None to acquire without saving.
+    size : int
+        Frame width and height in pixels.
+    save_directory : str
+        Directory to save to.
+    z_steps : int
+        Number of z-steps of z-stack, multiposition and customized acquisitions.
+    exposure_ms : float
+        Camera exposure time of every channel, in milliseconds.
+    """
+    experiment = model.configuration["experiment"]
+    microscope_name = model.active_microscope_name
+
+    camera_parameters = experiment["CameraParameters"][microscope_name]
+    camera_parameters["binning"] = "1x1"
+    for key in ["x_pixels", "img_x_pixels", "y_pixels", "img_y_pixels"]:
+        camera_parameters[key] = size
+    camera_parameters["center_x"] = size // 2
+    camera_parameters["center_y"] = size // 2
+    model.get_data_buffer(size, size)
+
+    state = experiment["MicroscopeState"]
+    for channel in state["channels"].values():
+        channel["camera_exposure_time"] = exposure_ms
+    state["image_mode"] = "z-stack" if mode == "multiposition" else mode
+    state["timepoints"] = 1
+    state["stack_cycling_mode"] = "per_stack"
+    state["start_position"] = 0.0
+    state["step_size"] = 1.0
+    state["end_position"] = float(z_steps - 1)
+    state["number_z_steps"] = z_steps
+    state["is_multiposition"] = mode == "multiposition"
+    update_config_dict(
+        manager,
+        experiment,
+        "MultiPositions",
+        MULTIPOSITIONS if mode == "multiposition" else [],
+    )
+
+    state["is_save"] = file_type is not None
+    if file_type is not None:
+        experiment["Saving"]["file_type"] = file_type
+        experiment["Saving"]["save_directory"] = save_directory
+
+    if mode == "customized":
+        model.run_command("load_feature", "ZStackAcquisition")
+    else:
+        model.run_command("load_feature", 0)
+
+
+def directory_size(directory):
+    """Size of the files in a directory.
+
+    Parameters
+    ----------
+    directory : str
+        Directory.
+
+    Returns
+    -------
+    int
+        Size in bytes.
+    """
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory)
+        for name in names
+    )
+
+
+def run_scenario(model, manager, mode, file_type, size, **kw):
+    """Run one acquisition and measure it.
+
+    Parameters
+    ----------
+    model : navigate.model.model.Model
+        Model on synthetic hardware.
+    manager : multiprocessing.managers.SyncManager
+        Manager holding the shared configuration.
+    mode : str
+        One of MODES.
+    file_type : str
+        One of FILE_TYPES, or None to acquire without saving.
+    size : int
+        Frame width and height in pixels.
+    **kw : dict
+        z_steps, exposure_ms, frame_interval, timeout and keep_data.
+
+    Returns
+    -------
+    dict
+        Measurements of the scenario.
+    """
+    z_steps = kw.get("z_steps", 20)
+    timeout = kw.get("timeout", 120)
+    save_directory = tempfile.mkdtemp(prefix="navigate_benchmark_")
+
+    configure_scenario(
+        model,
+        manager,
+        mode,
+        file_type,
+        size,
+        save_directory,
+        z_steps,
+        kw.get("exposure_ms", 10.0),
+    )
+    model.active_microscope.camera.frame_interval = kw.get("frame_interval")
+
+    show_img_pipe = model.create_pipe("show_img_pipe")
+    probe = AcquisitionProbe(model)
+    probe.attach()
+    timed_out = False
+    try:
+        model.run_command("acquire")
+        while True:
+            if not show_img_pipe.poll(timeout):
+                timed_out = True
+                model.run_command("stop")
+                break
+            frame_id = show_img_pipe.recv()
+            if frame_id == "stop":
+                break
+            probe.displayed(frame_id)
+        model.data_thread.join()
+        end = time.perf_counter()
+    finally:
+        probe.detach()
+        model.release_pipe("show_img_pipe")
+        model.active_microscope.camera.frame_interval = None
+
+    report = dict(model.frame_report)
+    frames = report.get("acquired_frames", 0)
+    start = probe.first_trigger if probe.first_trigger is not None else end
+    raw_mb = frames * size * size * 2 / 1e6
+
+    fps = None
+    if frames > 1 and probe.last_display is not None:
+        fps = frames / max(probe.last_display - start, 1e-9)
+
+    result = {
+        "scenario": f"{mode}/{file_type or 'no-save'}/{size}",
+        "mode": mode,
+        "file_type": file_type,
+        "size": size,
+        "frames": frames,
+        "elapsed_s": round(end - start, 4),
+        "fps": round(fps, 3) if fps is not None else None,
+        "write_mb_s": None,
+        "disk_mb": None,
+        "data_thread_latency_ms": summarize(probe.data_thread_latency),
+        "display_latency_ms": summarize(probe.display_latency),
+        "displayed_frames": len(probe.display_latency),
+        "dropped_frames": report.get("dropped_frames", 0),
+        "overrun_events": report.get("overrun_events", 0),
+        "max_backlog": report.get("max_backlog", 0),
+        "writer_queue_overruns": report.get("writer_queue_overruns", 0),
+        "timed_out": timed_out,
+    }
+    if file_type is not None:
+        # The writer is closed, and its data flushed, before the data thread ends
+        result["write_mb_s"] = round(raw_mb / max(end - start, 1e-9), 3)
+        result["disk_mb"] = round(directory_size(save_directory) / 1e6, 3)
+
+    if kw.get("keep_data", False):
+        result["save_directory"] = save_directory
+    else:
+        shutil.rmtree(save_directory, ignore_errors=True)
+    return result
+
+
+def machine_info():
+    """Describe the machine and code the benchmark ran on.
+
+    Returns
+    -------
+    dict
+        Platform, Python and navigate versions, CPU count, git commit and time.
+    """
+    from navigate import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "navigate": __version__,
+        "cpu_count": os.cpu_count(),
+        "commit": commit or None,
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def run_benchmarks(modes=None, file_types=None, sizes=None, **kw):
+    """Run every combination of acquisition mode, file type and frame size.
+
+    Parameters
+    ----------
+    modes : list
+        Acquisition modes. Defaults to MODES.
+    file_types : list
+        File types. None entries acquire without saving. Defaults to FILE_TYPES.
+    sizes : list
+        Frame sizes in pixels. Defaults to SIZES.
+    **kw : dict
+        Passed to run_scenario.
+
+    Returns
+    -------
+    dict
+        Machine information and one result per scenario.
+    """
+    modes = MODES if modes is None else modes
+    file_types = FILE_TYPES if file_types is None else file_types
+    sizes = SIZES if sizes is None else sizes
+
+    results = []
+    with Manager() as manager:
+        model = create_model(manager, kw.pop("configuration_directory", None))
+        try:
+            for size in sizes:
+                for file_type in file_types:
+                    for mode in modes:
+                        result = run_scenario(
+                            model, manager, mode, file_type, size, **kw
+                        )
+                        print(format_result(result), flush=True)
+                        results.append(result)
+        finally:
+            model.terminate()
+
+    return {"machine": machine_info(), "results": results}
+
+
+def format_result(result):
+    """Format one result as a line of text.
+
+    Parameters
+    ----------
+    result : dict
+        Result of one scenario.
+
+    Returns
+    -------
+    str
+        Scenario, frame rate, write throughput, p95 latencies and dropped frames.
+    """
+
+    def fmt(value, spec):
+        if value is None:
+            return "-".rjust(int(spec.split(".")[0]))
+        return format(value, spec)
+
+    return (
+        f"{result['scenario']:<32} {result['frames']:>5} frames "
+        f"{fmt(result['fps'], '8.2f')} fps "
+        f"{fmt(result['write_mb_s'], '9.2f')} MB/s  "
+        f"data p95 {fmt(result['data_thread_latency_ms']['p95'], '8.2f')} ms  "
+        f"display p95 {fmt(result['display_latency_ms']['p95'], '8.2f')} ms  "
+        f"dropped {result['dropped_frames']}"
+        + ("  TIMED OUT" if result["timed_out"] else "")
+    )
+
+
+def main(argv=None):
+    """Run the benchmark from the command line.
+
+    Parameters
+    ----------
+    argv : list
+        Command line arguments. Defaults to sys.argv[1:].
+
+    Returns
+    -------
+    int
+        1 if a metric regressed against the baseline, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        description="Acquisition throughput benchmark on synthetic hardware."
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument(
+        "--file-types",
+        nargs="+",
+        choices=FILE_TYPES + ["none"],
+        default=FILE_TYPES,
+        help='File types to save as. "none" acquires without saving.',
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--z-steps", type=int, default=20)
+    parser.add_argument(
+        "--exposure", type=float, default=10.0, help="Exposure time in ms."
+    )
+    parser.add_argument(
+        "--frame-interval",
+        type=float,
+        default=None,
+        help="Seconds between camera frames. Defaults to the exposure time, "
+        "0 triggers frames as fast as possible.",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--keep-data", action="store_true", help="Do not delete the saved data."
+    )
+    args = parser.parse_args(argv)
+
+    benchmark = run_benchmarks(
+        modes=args.modes,
+        file_types=[None if f == "none" else f for f in args.file_types],
+        sizes=args.sizes,
+        z_steps=args.z_steps,
+        exposure_ms=args.exposure,
+        frame_interval=args.frame_interval,
+        timeout=args.timeout,
+        keep_data=args.keep_data,
+    )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(
+            benchmark["results"], baseline["results"], args.tolerance
+        )
+        benchmark["baseline"] = {
+            "file": args.baseline,
+            "machine": baseline.get("machine"),
+            "tolerance": args.tolerance,
+            "regressions": regressions,
+        }
+        for r in regressions:
+            print(
+                f"REGRESSION {r['scenario']} {r['metric']}: "
+                f"{r['baseline']} -> {r['value']}"
+            )
+        if not regressions:
+            print("No regressions against the baseline.")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(benchmark, f, indent=2)
+
+    if benchmark.get("baseline", {}).get("regressions"):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
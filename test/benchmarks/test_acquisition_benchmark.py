@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from test.benchmarks.acquisition_benchmark import (
+    compare_to_baseline,
+    main,
+    run_benchmarks,
+    summarize,
+)
+
+
+def result(scenario, fps, p95, dropped=0):
+    return {
+        "scenario": scenario,
+        "fps": fps,
+        "write_mb_s": None,
+        "data_thread_latency_ms": {"p95": p95},
+        "display_latency_ms": {"p95": p95},
+        "dropped_frames": dropped,
+    }
+
+
+def test_summarize():
+    stats = summarize([0.001 * i for i in range(1, 101)])
+    assert stats["mean"] == pytest.approx(50.5)
+    assert stats["p50"] == pytest.approx(50.5)
+    assert stats["p95"] == pytest.approx(95.05)
+    assert stats["max"] == pytest.approx(100)
+    assert summarize([]) == dict.fromkeys(["mean", "p50", "p95", "p99", "max"])
+
+
+def test_compare_to_baseline():
+    baseline = [
+        result("single/TIFF/512", 100, 2.0),
+        result("z-stack/TIFF/512", 100, 2.0),
+        result("z-stack/H5/512", 100, 2.0),
+    ]
+    results = [
+        # Within tolerance, or better
+        result("single/TIFF/512", 90, 1.0),
+        # Slower, with a higher latency and dropped frames
+        result("z-stack/TIFF/512", 50, 3.0, dropped=2),
+        # Not in the baseline
+        result("multiposition/TIFF/512", 1, 100.0),
+    ]
+
+    regressions = compare_to_baseline(results, baseline, tolerance=0.2)
+
+    assert {r["scenario"] for r in regressions} == {"z-stack/TIFF/512"}
+    assert {r["metric"] for r in regressions} == {
+        "fps",
+        "data_thread_latency_ms.p95",
+        "display_latency_ms.p95",
+        "dropped_frames",
+    }
+    fps = next(r for r in regressions if r["metric"] == "fps")
+    assert fps["change"] == pytest.approx(-0.5)
+
+
+def test_main_fails_on_regression(tmp_path, monkeypatch):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"machine": {}, "results": [result("single/TIFF/512", 100, 2.0)]})
+    )
+    monkeypatch.setattr(
+        "test.benchmarks.acquisition_benchmark.run_benchmarks",
+        lambda **kw: {"machine": {}, "results": [result("single/TIFF/512", 10, 2.0)]},
+    )
+
+    output = tmp_path / "results.json"
+    assert main(["--baseline", str(baseline), "--output", str(output)]) == 1
+
+    regressions = json.loads(output.read_text())["baseline"]["regressions"]
+    assert [r["metric"] for r in regressions] == ["fps"]
+
+
+@pytest.mark.benchmark
+def test_acquisition_benchmark():
+    benchmark = run_benchmarks(
+        modes=["single", "z-stack", "customized"],
+        file_types=[None, "TIFF"],
+        sizes=[128],
+        z_steps=3,
+        exposure_ms=5.0,
+        timeout=60,
+    )
+
+    results = {r["scenario"]: r for r in benchmark["results"]}
+    assert len(results) == 6
+    assert benchmark["machine"]["navigate"]
+    for scenario, r in results.items():
+        assert not r["timed_out"], scenario
+        assert r["frames"] > 0
+        assert r["dropped_frames"] == 0
+        assert r["displayed_frames"] > 0
+        assert r["display_latency_ms"]["p95"] > 0
+        assert r["data_thread_latency_ms"]["p95"] > 0
+    assert (
+        results["z-stack/TIFF/128"]["frames"]
+        == 3 * results["single/TIFF/128"]["frames"]
+    )
+    assert results["z-stack/TIFF/128"]["write_mb_s"] > 0
+    assert results["z-stack/TIFF/128"]["disk_mb"] > 0
+    assert results["z-stack/no-save/128"]["write_mb_s"] is None
@@ -82,6 +82,8 @@ def test_config_methods():
         "logging",
         "logger",
         "p",
+        "threading",
+        "ConfigurationSnapshot",
     ]
     for method in methods:
         assert method in desired_methods
@@ -260,6 +262,69 @@ class TestBuildNestedDict(unittest.TestCase):
         os.remove(test_entry)
 
 
+class TestConfigurationSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.manager = Manager()
+        self.configuration = self.manager.dict()
+        config.build_nested_dict(
+            self.manager,
+            self.configuration,
+            "experiment",
+            {
+                "CameraParameters": {"Mesoscale": {"binning": "1x1", "x": [1, 2]}},
+                "Saving": {"file_type": "TIFF"},
+            },
+        )
+        self.snapshot = config.ConfigurationSnapshot(self.configuration)
+
+    def tearDown(self):
+        self.manager.shutdown()
+
+    def test_get(self):
+        camera = self.snapshot.get("experiment", "CameraParameters", "Mesoscale")
+        assert camera == {"binning": "1x1", "x": [1, 2]}
+        assert type(camera) is dict
+        assert type(camera["x"]) is list
+        proxy_calls = self.snapshot.proxy_calls
+        assert proxy_calls > 0
+
+        # lookups below a copied subtree don't touch the proxies
+        assert (
+            self.snapshot.get("experiment", "CameraParameters", "Mesoscale", "binning")
+            == "1x1"
+        )
+        assert self.snapshot.proxy_calls == proxy_calls
+        assert self.snapshot.saved_calls == 4
+
+        self.snapshot.reset_statistics()
+        assert self.snapshot.proxy_calls == 0
+        assert self.snapshot.saved_calls == 0
+
+    def test_invalidate(self):
+        assert self.snapshot.get("experiment", "Saving")["file_type"] == "TIFF"
+        self.snapshot.get("experiment", "CameraParameters")
+
+        # direct writes are not seen until the subtree is invalidated
+        self.configuration["experiment"]["Saving"]["file_type"] = "H5"
+        assert self.snapshot.get("experiment", "Saving")["file_type"] == "TIFF"
+        self.snapshot.invalidate("experiment", "Saving", "file_type")
+        assert self.snapshot.get("experiment", "Saving")["file_type"] == "H5"
+
+        # writes through the snapshot invalidate the subtree
+        self.snapshot.set(("experiment", "Saving", "file_type"), "N5")
+        assert self.configuration["experiment"]["Saving"]["file_type"] == "N5"
+        assert self.snapshot.get("experiment", "Saving")["file_type"] == "N5"
+
+        # other subtrees are kept
+        proxy_calls = self.snapshot.proxy_calls
+        self.snapshot.get("experiment", "CameraParameters", "Mesoscale")
+        assert self.snapshot.proxy_calls == proxy_calls
+
+        self.snapshot.invalidate()
+        self.snapshot.get("experiment", "CameraParameters", "Mesoscale")
+        assert self.snapshot.proxy_calls > proxy_calls
+
+
 class TestVerifyExperimentConfig(unittest.TestCase):
     def setUp(self):
         self.manager = Manager()
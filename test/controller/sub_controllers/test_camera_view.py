@@ -695,9 +695,30 @@ class TestCameraViewController:
         assert np.all(image2[self.camera_view.zoom_rect[1][1] // 2, :] == 1)
 
     def test_apply_LUT(self):
-        # Someone else with better numpy understanding will need to do this TODO
+        image = np.random.randint(0, 2**12, (100, 100)).astype(np.uint16)
+        image[0, 0] = 2**16 - 1
+        self.camera_view.min_counts = 100
+        self.camera_view.max_counts = 4000
 
-        pass
+        rgb_image = self.camera_view.apply_lut(image)
+
+        # The lookup table reproduces the floating point pipeline
+        scaled_image = np.clip((image.astype(np.float64) - 100) / 3900, 0, 1)
+        expected = (self.camera_view.colormap(scaled_image)[:, :, :3] * 255).astype(
+            np.uint8
+        )
+        assert rgb_image.dtype == np.uint8
+        assert np.array_equal(rgb_image[1:], expected[1:])
+        # Saturated pixels are red
+        assert np.array_equal(rgb_image[0, 0], [255, 0, 0])
+
+        # The table is cached until the min/max counts change
+        lut = self.camera_view.lut
+        self.camera_view.apply_lut(image)
+        assert self.camera_view.lut is lut
+        self.camera_view.max_counts = 3000
+        self.camera_view.apply_lut(image)
+        assert self.camera_view.lut is not lut
 
     def test_update_LUT(self):
         # Same as apply LUT TODO
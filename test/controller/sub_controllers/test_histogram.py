@@ -0,0 +1,129 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+# Standard library imports
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Third party imports
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Local imports
+import navigate.controller.sub_controllers.histogram as histogram
+
+
+class TestHistogramController:
+    @pytest.fixture(autouse=True)
+    def setup_class(self, monkeypatch):
+        # Render on an Agg canvas, the Tk widgets are not needed here.
+        monkeypatch.setattr(histogram, "tk", MagicMock())
+        figure = Figure()
+        canvas = FigureCanvasAgg(figure)
+        canvas.get_tk_widget = MagicMock()
+        canvas.blit = MagicMock()
+        self.canvas = canvas
+        self.draw = MagicMock(side_effect=canvas.draw)
+        canvas.draw = self.draw
+
+        view = SimpleNamespace(figure=figure, figure_canvas=canvas)
+        self.histogram_controller = histogram.HistogramController(view, MagicMock())
+        self.image = np.random.randint(100, 4000, (256, 256)).astype(np.uint16)
+
+    def test_populate_histogram(self):
+        self.histogram_controller.populate_histogram(self.image)
+
+        stairs = self.histogram_controller.stairs
+        counts, edges = stairs.get_data().values, stairs.get_data().edges
+        assert len(counts) == self.histogram_controller.bins
+        assert counts.sum() == self.image.size
+        assert edges[0] == self.image.min()
+        assert self.draw.call_count == 1
+        assert self.histogram_controller.background is not None
+
+        # a similar image only updates the artist and blits it
+        self.histogram_controller.populate_histogram(self.image + 10)
+        assert self.histogram_controller.stairs is stairs
+        assert stairs.get_data().edges[0] == self.image.min() + 10
+        assert self.draw.call_count == 1
+        self.canvas.blit.assert_called_with(self.histogram_controller.ax.bbox)
+
+        # an image outside of the x-axis limits redraws the axes
+        self.histogram_controller.populate_histogram(self.image * 4)
+        assert self.draw.call_count == 2
+        x_minimum, x_maximum = self.histogram_controller.ax.get_xlim()
+        assert x_maximum >= self.image.max() * 4
+
+    def test_limits_changed(self):
+        assert self.histogram_controller.limits_changed(1, 10)
+        self.histogram_controller.x_limits = (1, 100)
+        assert not self.histogram_controller.limits_changed(1, 100)
+        assert not self.histogram_controller.limits_changed(20, 90)
+        assert self.histogram_controller.limits_changed(0.5, 90)
+        assert self.histogram_controller.limits_changed(20, 110)
+        # the histogram covers less than half of the axis
+        assert self.histogram_controller.limits_changed(20, 50)
+
+    def test_update_scale(self):
+        self.histogram_controller.populate_histogram(self.image)
+        self.histogram_controller.x_axis_var = MagicMock(
+            get=MagicMock(return_value="log")
+        )
+        self.histogram_controller.y_axis_var = MagicMock(
+            get=MagicMock(return_value="linear")
+        )
+
+        self.histogram_controller.update_scale()
+        assert self.histogram_controller.log_x
+        assert not self.histogram_controller.log_y
+        assert self.histogram_controller.background is None
+
+        # the next image redraws the axes with the new scales
+        self.histogram_controller.populate_histogram(self.image)
+        assert self.draw.call_count == 2
+        assert self.histogram_controller.ax.get_xscale() == "log"
+        assert self.histogram_controller.ax.get_yscale() == "linear"
+
+    def test_on_draw(self):
+        self.histogram_controller.populate_histogram(self.image)
+        self.histogram_controller.background = None
+        self.histogram_controller.ax.draw_artist = MagicMock()
+
+        # a full redraw, e.g. after resizing, caches the background again
+        self.canvas.draw()
+        assert self.histogram_controller.background is not None
+        self.histogram_controller.ax.draw_artist.assert_called_with(
+            self.histogram_controller.stairs
+        )
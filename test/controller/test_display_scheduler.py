@@ -0,0 +1,143 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+# Standard Library Imports
+import threading
+import time
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from navigate.controller.display_scheduler import DisplayScheduler, MAX_PENDING_FRAMES
+
+
+def test_display_every_frame():
+    data_buffer = np.arange(10).reshape(10, 1, 1)
+    displayed, projected, updated, skipped = [], [], [], []
+
+    scheduler = DisplayScheduler()
+    scheduler.register("view", lambda image: displayed.append(int(image[0, 0])))
+    scheduler.register(
+        "mip",
+        lambda image: projected.append(int(image[0, 0])),
+        rate=0.001,
+        update=lambda image: updated.append(int(image[0, 0])),
+        skip=skipped.append,
+    )
+    scheduler.start(data_buffer)
+    for i in range(10):
+        scheduler.submit(i)
+    scheduler.stop()
+
+    # every frame reaches the view, the projection is only refreshed at the
+    # beginning and for the last frame
+    assert displayed == list(range(10))
+    assert projected == [0, 9]
+    assert updated == list(range(1, 9))
+    assert skipped == []
+    assert scheduler.dropped_frames == 0
+
+
+def test_display_coalesce():
+    data_buffer = np.arange(10).reshape(10, 1, 1)
+    displayed, skipped = [], []
+
+    def slow_display(image):
+        displayed.append(int(image[0, 0]))
+        time.sleep(0.05)
+
+    scheduler = DisplayScheduler()
+    scheduler.register("view", slow_display, skip=skipped.append)
+    scheduler.start(data_buffer, coalesce=True)
+    for i in range(10):
+        scheduler.submit(i)
+    scheduler.stop()
+
+    # stale frames are dropped and the view is told how many it missed
+    assert displayed[-1] == 9
+    assert len(displayed) < 10
+    assert sum(skipped) + len(displayed) == 10
+    assert scheduler.dropped_frames == 10 - len(displayed)
+    assert scheduler.dispatch_thread is None
+
+
+def test_display_throttled():
+    data_buffer = np.arange(10).reshape(10, 1, 1)
+    displayed, skipped = [], []
+
+    scheduler = DisplayScheduler()
+    scheduler.register(
+        "view",
+        lambda image: displayed.append(int(image[0, 0])),
+        rate=0.001,
+        skip=skipped.append,
+    )
+    scheduler.start(data_buffer)
+    for i in range(10):
+        scheduler.submit(i)
+    scheduler.stop()
+
+    # without an update function, frames between two refreshes are not rendered
+    assert displayed == [0, 9]
+    assert skipped == [8]
+    assert scheduler.dropped_frames == 0
+
+
+def test_display_bounded_pending():
+    n_frames = 3 * MAX_PENDING_FRAMES
+    data_buffer = np.arange(n_frames).reshape(n_frames, 1, 1)
+    displayed, skipped = [], []
+    release = threading.Event()
+
+    def blocked_display(image):
+        displayed.append(int(image[0, 0]))
+        release.wait()
+
+    scheduler = DisplayScheduler()
+    scheduler.register("view", blocked_display, skip=skipped.append)
+    scheduler.start(data_buffer)
+    scheduler.submit(0)
+    while not displayed:
+        time.sleep(0.001)
+    for i in range(1, n_frames):
+        scheduler.submit(i)
+        assert len(scheduler.pending) <= MAX_PENDING_FRAMES
+    release.set()
+    scheduler.stop()
+
+    # only the newest frames are kept while the display is busy
+    dropped = n_frames - 1 - MAX_PENDING_FRAMES
+    assert scheduler.dropped_frames == dropped
+    assert displayed == [0] + list(range(dropped + 1, n_frames))
+    assert skipped == [dropped]
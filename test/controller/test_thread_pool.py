@@ -0,0 +1,103 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only
+# (subject to the limitations in the disclaimer below)
+# provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+# Standard Library Imports
+import threading
+
+# Third Party Imports
+
+# Local Imports
+from navigate.controller.thread_pool import SynchronizedThreadPool
+
+
+def test_tasks_run_in_order_on_one_worker():
+    pool = SynchronizedThreadPool()
+    order, workers, callbacks = [], set(), []
+
+    def target(i):
+        order.append(i)
+        workers.add(threading.current_thread())
+        if i == 3:
+            raise ValueError("A failing task doesn't stop the worker")
+
+    tasks = [
+        pool.createThread(
+            "model", target, args=(i,), callback=callbacks.append, cbArgs=(i,)
+        )
+        for i in range(10)
+    ]
+    tasks[-1].join(timeout=5)
+
+    assert order == list(range(10))
+    assert callbacks == list(range(10))
+    assert len(workers) == 1
+    assert all(not task.is_alive() for task in tasks)
+    assert pool.getRunningThread("model") is None
+
+    # an idle worker picks up new tasks
+    pool.createThread("model", target, args=(10,)).join(timeout=5)
+    assert order[-1] == 10
+    assert workers == {pool.workers["model"]}
+
+
+def test_coalesce_and_remove_pending_tasks():
+    pool = SynchronizedThreadPool()
+    started, release = threading.Event(), threading.Event()
+    moves = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    pool.createThread("model", block)
+    started.wait(5)
+
+    first = pool.createThread(
+        "model", moves.append, args=(("x", 1),), coalesce=("stage", "x")
+    )
+    pool.createThread("model", moves.append, args=(("y", 1),), coalesce=("stage", "y"))
+    removed = pool.createThread("model", moves.append, args=("removed",))
+    last = pool.createThread(
+        "model", moves.append, args=(("x", 2),), coalesce=("stage", "x")
+    )
+
+    # the replaced task is done without running
+    assert first.cancelled and not first.is_alive()
+    assert pool.removeThread("model", removed) is True
+    assert removed.cancelled
+    # the running task can't be removed
+    assert pool.removeThread("model", pool.getRunningThread("model")) is False
+
+    release.set()
+    last.join(timeout=5)
+    assert moves == [("x", 2), ("y", 1)]
@@ -30,8 +30,10 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import math
+import time
 
 import numpy as np
+import pytest
 
 
 def im_circ(r=1, N=128):
@@ -104,6 +106,197 @@ def test_binary_detect():
         assert binary_detect(im * 1001, b, ds) == b
 
 
+def reference_find_tissue_boundary_2d(image_data, mag_ratio=1.0):
+    """Per-pixel loop implementation that find_tissue_boundary_2d replaced."""
+    from skimage import filters
+    from skimage.transform import downscale_local_mean
+
+    thresh_img = image_data > filters.threshold_otsu(image_data)
+    if mag_ratio > 1:
+        ds_img = downscale_local_mean(thresh_img, (mag_ratio, mag_ratio))
+    else:
+        ds_img = image_data
+        mag_ratio = 1
+    idx_x, idx_y = np.where(ds_img)
+    boundary = [None] * math.ceil(image_data.shape[0] / mag_ratio)
+    for x, y in zip(idx_x, idx_y):
+        if boundary[x] is None:
+            boundary[x] = [y, y]
+        else:
+            boundary[x][1] = y
+    return boundary
+
+
+def reference_binary_detect(img_data, boundary, width=1):
+    """Per-row binary search implementation that binary_detect replaced."""
+    from navigate.model.analysis.boundary_detect import has_tissue
+
+    n = int(img_data.shape[1] / width)
+
+    def tissue(row, col):
+        return has_tissue(img_data, row, col, width)
+
+    def search_left(row, left, right):
+        while left < right:
+            mid = (left + right) // 2
+            if tissue(row, mid):
+                right = mid
+            else:
+                left = mid + 1
+        return right
+
+    def search_right(row, left, right):
+        while left < right:
+            mid = (left + right) // 2
+            if tissue(row, mid):
+                left = mid + 1
+            else:
+                right = mid
+        return right - 1
+
+    def find_tissue_range(row, left, right):
+        temp = [(left, right)]
+        while temp:
+            temp2 = []
+            for ll, r in temp:
+                mid = (ll + r) // 2
+                if tissue(row, mid):
+                    return ll, mid, r
+                if mid > ll + 1:
+                    temp2.append((ll, mid))
+                if r > mid + 1:
+                    temp2.append((mid, r))
+            temp = temp2
+        return -1, -1, -1
+
+    def detect_row_boundary(row, left, right):
+        is_left, is_right = tissue(row, left), tissue(row, right)
+        if is_left and is_right:
+            (left_l, left_r), (right_l, right_r) = (0, left), (right, n)
+        elif is_left:
+            (left_l, left_r), (right_l, right_r) = (0, left), (left, right)
+        elif is_right:
+            (left_l, left_r), (right_l, right_r) = (left, right), (right, n)
+        else:
+            ll, mid, r = find_tissue_range(row, left, right)
+            (left_l, left_r), (right_l, right_r) = (ll, mid), (mid, r)
+        if left_l == -1:
+            return None, None
+        return search_left(row, left_l, left_r), search_right(row, right_l, right_r)
+
+    def expand_row(row_id, limits, direction):
+        for i in range(row_id, limits, direction):
+            left, right = new_boundary[i]
+            left = left - 1 if left > 0 else 0
+            right = right + 1 if (right + 1) < (n - 1) else (n - 1)
+            ll, r = detect_row_boundary(i + direction, left, right)
+            if ll is None:
+                new_boundary[i + direction] = None
+                break
+            new_boundary[i + direction] = [ll, r]
+
+    new_boundary = boundary[:]
+    top, bottom = None, None
+    expand_top, expand_bottom = True, True
+    for i, row in enumerate(new_boundary):
+        if row is None:
+            continue
+        if expand_bottom is False:
+            new_boundary[i] = None
+            continue
+        left, right = detect_row_boundary(i, row[0], row[-1])
+        if left is None:
+            new_boundary[i] = None
+            if top is None:
+                expand_top = False
+            if bottom is not None:
+                expand_bottom = False
+        else:
+            new_boundary[i] = [left, right]
+        if top is None:
+            top = i
+        bottom = i
+    if expand_top:
+        expand_row(top, 0, -1)
+    if expand_bottom:
+        expand_row(bottom, n - 1, 1)
+    return new_boundary
+
+
+def im_ellipse(N, center, radii):
+    X, Y = np.meshgrid(range(N), range(N), indexing="ij")
+    return ((X - center[0]) / radii[0]) ** 2 + ((Y - center[1]) / radii[1]) ** 2 < 1
+
+
+def test_boundary_detect_matches_reference():
+    from navigate.model.analysis.boundary_detect import (
+        find_tissue_boundary_2d,
+        binary_detect,
+    )
+
+    for _ in range(50):
+        N = 2 ** np.random.randint(5, 9)
+        center = np.random.randint(N // 3, 2 * N // 3, size=2)
+        radii = np.random.randint(2, N // 4, size=2)
+        ds = np.random.randint(1, 6)
+        im = im_ellipse(N, center, radii)
+
+        b = find_tissue_boundary_2d(im, ds)
+        assert b == reference_find_tissue_boundary_2d(im, ds)
+
+        # The tissue shrinks and moves slightly in the next plane.
+        shifted = np.roll(im_ellipse(N, center, radii * 0.9), 1, axis=0) * 1001
+        assert binary_detect(shifted, b, ds) == reference_binary_detect(shifted, b, ds)
+
+
+def benchmark_image(N=2048):
+    rng = np.random.default_rng(0)
+    tissue = im_ellipse(N, (1000, 1100), (700, 800))
+    return (rng.normal(100, 10, (N, N)) + 1000 * tissue).astype(np.uint16)
+
+
+def test_boundary_detect_large_image():
+    from navigate.model.analysis.boundary_detect import (
+        find_tissue_boundary_2d,
+        binary_detect,
+    )
+
+    im, ds = benchmark_image(), 32
+    assert find_tissue_boundary_2d(im, 2) == reference_find_tissue_boundary_2d(im, 2)
+
+    pre_boundary = find_tissue_boundary_2d(im, ds)
+    assert binary_detect(im, pre_boundary, ds) == reference_binary_detect(
+        im, pre_boundary, ds
+    )
+
+
+@pytest.mark.benchmark
+def test_boundary_detect_benchmark():
+    from navigate.model.analysis.boundary_detect import (
+        find_tissue_boundary_2d,
+        binary_detect,
+    )
+
+    im, ds = benchmark_image(), 32
+
+    def timed(func, *args, repeat=3):
+        times = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start_time)
+        return min(times)
+
+    assert timed(find_tissue_boundary_2d, im, 2) < timed(
+        reference_find_tissue_boundary_2d, im, 2
+    )
+
+    pre_boundary = find_tissue_boundary_2d(im, ds)
+    assert timed(binary_detect, im, pre_boundary, ds) < timed(
+        reference_binary_detect, im, pre_boundary, ds
+    )
+
+
 def test_map_boundary():
     from navigate.model.analysis.boundary_detect import map_boundary
 
@@ -0,0 +1,125 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only (subject to the
+# limitations in the disclaimer below) provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# Standard library imports
+import unittest
+
+# Third party imports
+import numpy as np
+from scipy import ndimage
+
+# Local imports
+from navigate.model.analysis.focus_metrics import (
+    FOCUS_METRICS,
+    FocusMetric,
+    FocusMetricScorer,
+)
+
+
+def sharp_image(shape=(128, 128)):
+    rng = np.random.default_rng(0)
+    return (rng.random(shape) * 1000).astype(np.uint16)
+
+
+class TestFocusMetric(unittest.TestCase):
+    def test_registered_metrics(self):
+        image = sharp_image()
+        for name in FOCUS_METRICS:
+            score = FocusMetric(name)(image)
+            assert isinstance(score, float)
+            assert np.isfinite(score)
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            FocusMetric("Not a metric")
+        with self.assertRaises(ValueError):
+            FocusMetric("Tenengrad", roi=0)
+        with self.assertRaises(ValueError):
+            FocusMetric("Tenengrad", binning=0)
+
+    def test_prepare(self):
+        image = np.arange(100 * 80, dtype=np.uint16).reshape(100, 80)
+
+        prepared = FocusMetric(roi=0.5).prepare(image)
+        assert prepared.shape == (50, 40)
+        assert prepared.dtype == np.float32
+        assert prepared[0, 0] == image[25, 20]
+
+        prepared = FocusMetric(roi=0.5, binning=4).prepare(image)
+        assert prepared.shape == (12, 10)
+        assert prepared[0, 0] == image[26:30, 20:24].mean()
+
+        # the unbinned image is a copy, so the buffer can be reused
+        prepared = FocusMetric().prepare(image)
+        image[:] = 0
+        assert prepared.max() > 0
+
+    def test_sharp_image_scores_higher(self):
+        image = sharp_image()
+        blurred = ndimage.gaussian_filter(image.astype(np.float32), 3)
+        for name in ["DCT Shannon Entropy", "Tenengrad", "Normalized Variance"]:
+            metric = FocusMetric(name)
+            assert metric(image) > metric(blurred), name
+
+
+class TestFocusMetricScorer(unittest.TestCase):
+    def test_scores_in_order(self):
+        metric = FocusMetric("Pixel Max")
+        scorer = FocusMetricScorer(metric)
+        scores = []
+        for i in range(20):
+            scorer.submit(
+                np.full((16, 16), i, dtype=np.uint16),
+                lambda score, i: scores.append((i, score)),
+                i,
+            )
+        scorer.wait()
+        assert scores == [(i, float(i)) for i in range(20)]
+
+        scorer.stop()
+        assert not scorer.thread.is_alive()
+        # stopping twice is harmless
+        scorer.stop()
+
+    def test_failing_callback(self):
+        scorer = FocusMetricScorer(FocusMetric("Pixel Max"))
+        scores = []
+
+        def callback(score):
+            if not scores:
+                scores.append(None)
+                raise RuntimeError
+            scores.append(score)
+
+        scorer.submit(np.ones((8, 8)), callback)
+        scorer.submit(np.ones((8, 8)) * 2, callback)
+        scorer.stop()
+        assert scores == [None, 2.0]
@@ -5,6 +5,7 @@ from multiprocessing import shared_memory
 
 from navigate.model.concurrency.concurrency_tools import (
     ObjectInSubprocess,
+    call_async,
     ResultThread,
     CustodyThread,
     _WaitingList,
@@ -626,6 +627,90 @@ def _test_array_passing(shape, pass_by, method_name, dtype, n_loops):
     print(f" {t_per_loop:.2f} \u03BCs per {name}")
 
 
+class _CountingPipe:
+    """Wraps a pipe connection and counts the messages sent through it."""
+
+    def __init__(self, pipe):
+        self.pipe = pipe
+        self.sent = []
+
+    def send(self, obj):
+        self.sent.append(obj)
+        self.pipe.send(obj)
+
+    def recv(self):
+        return self.pipe.recv()
+
+    def close(self):
+        self.pipe.close()
+
+
+def test_method_calls_use_one_round_trip():
+    p = ObjectInSubprocess(TestClass, x=4)
+    assert "mirror" in p._.methods
+    assert "x" not in p._.methods
+    assert "__init__" not in p._.methods
+
+    pipe = _CountingPipe(p._.parent_pipe)
+    p._.parent_pipe = pipe
+    assert p.mirror(1, a=2) == ((1,), {"a": 2})
+    assert pipe.sent == [("mirror", (1,), {"a": 2})]
+    assert p.mirror is p.mirror
+
+    # attributes still need to be fetched
+    assert p.x == 4
+    assert pipe.sent[-1] == ("__getattribute__", ("x",), {})
+
+    # errors raised by the method reach the parent
+    try:
+        p.nested_method(crash=True)
+    except Exception as e:
+        assert "supposed to be raised" in str(e)
+    else:
+        raise AssertionError("Did not get the error we expected")
+
+    del p
+
+
+def test_call_async():
+    p = ObjectInSubprocess(TestClass, x=4)
+    futures = [call_async(p, "mirror", i) for i in range(5)]
+    crash = call_async(p, "nested_method", crash=True)
+    last = call_async(p, "mirror", "last")
+    assert len(p._.pending) == 7
+
+    # asking for a later result reads the earlier answers too
+    assert futures[2].result(timeout=5) == ((2,), {})
+    assert all(future.done() for future in futures[:3])
+    assert not last.done()
+
+    # synchronous calls read the pending answers before their own
+    assert p.x == 4
+    assert len(p._.pending) == 0
+    assert [future.result() for future in futures] == [((i,), {}) for i in range(5)]
+    assert "supposed to be raised" in str(crash.exception())
+    assert last.result() == (("last",), {})
+
+    # the pipe is still in sync with the child
+    a = SharedNDArray(shape=(10, 1))
+    a[:] = 1
+    assert call_async(p, "sum", a).result() == 10
+    assert p.mirror(3) == ((3,), {})
+
+    del p
+    del a
+
+
+def test_call_async_with_lock():
+    p = ObjectInSubprocess(TestClass, with_lock=True)
+    future = call_async(p, "mirror", 1)
+    assert future.done()
+    assert future.result() == ((1,), {})
+    assert p.mirror(2) == ((2,), {})
+
+    del p
+
+
 def test_lock_with_waitlist():
     """Test that CustodyThreads stay in order while using resources.
     ObjectsInSubprocess are just mocked as _WaitingList objects.
@@ -249,3 +249,57 @@ def test_bdv_getitem(multiposition, per_stack, z_stack, size):
     close_bdv_ds(ds)
 
     assert True
+
+
+@pytest.mark.parametrize("method", ["mean", "max"])
+def test_bdv_pyramid_downsampling(method):
+    from test.model.dummy import DummyModel
+    from navigate.model.data_sources.bdv_data_source import BigDataViewerDataSource
+
+    model = DummyModel()
+    microscope_name = model.configuration["experiment"]["MicroscopeState"][
+        "microscope_name"
+    ]
+    camera_parameters = model.configuration["experiment"]["CameraParameters"][
+        microscope_name
+    ]
+    camera_parameters["img_x_pixels"] = 64
+    camera_parameters["img_y_pixels"] = 48
+    state = model.configuration["experiment"]["MicroscopeState"]
+    state["image_mode"] = "z-stack"
+    state["number_z_steps"] = 5
+    state["is_multiposition"] = False
+    state["timepoints"] = 1
+    state["stack_cycling_mode"] = "per_stack"
+
+    ds = BigDataViewerDataSource("test_pyramid.h5")
+    with pytest.raises(ValueError):
+        ds.set_resolutions([[2, 2, 1]])
+    ds.set_resolutions([[1, 1, 1], [2, 2, 2], [4, 4, 1]])
+    ds.set_metadata_from_configuration_experiment(model.configuration)
+    ds.set_downsample_method(method)
+
+    n_images = ds.shape_c * ds.shape_z
+    data = (np.random.rand(n_images, ds.shape_y, ds.shape_x) * 2**12).astype("uint16")
+    for i in range(n_images):
+        ds.write(data[i])
+
+    reduce = np.mean if method == "mean" else np.max
+    for c in range(ds.shape_c):
+        stack = data[c * ds.shape_z : (c + 1) * ds.shape_z].astype(float)
+        level_1 = ds.image[f"t00000/s{c:02}/1/cells"]
+        level_2 = ds.image[f"t00000/s{c:02}/2/cells"]
+        for zs in range(ds.shapes[1, 0]):
+            block = stack[2 * zs : 2 * zs + 2]
+            expected = reduce(
+                block.reshape(block.shape[0], ds.shape_y // 2, 2, ds.shape_x // 2, 2),
+                axis=(0, 2, 4),
+            )
+            np.testing.assert_allclose(level_1[zs, ...], np.rint(expected), atol=1)
+        for z in range(ds.shapes[2, 0]):
+            expected = reduce(
+                stack[z].reshape(ds.shape_y // 4, 4, ds.shape_x // 4, 4), axis=(1, 3)
+            )
+            np.testing.assert_allclose(level_2[z, ...], np.rint(expected), atol=1)
+
+    close_bdv_ds(ds)
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+import pytest
+
+from navigate.model.data_sources.pyramidal_data_source import (
+    ChunkCache,
+    split_by_chunk,
+)
+from test.model.data_sources.test_bdv_data_source import bdv_ds, close_bdv_ds
+
+
+@pytest.mark.parametrize(
+    "sl", [slice(None), slice(3, 2000, 7), slice(None, None, -5), slice(1000, 7, -3)]
+)
+@pytest.mark.parametrize("chunk", [1, 32, 100, 2048])
+def test_split_by_chunk(sl, chunk):
+    axis = np.arange(2048)
+    pieces = split_by_chunk(sl, axis.size, chunk)
+
+    result = np.empty(len(axis[sl]), dtype=int)
+    for k, source, destination in pieces:
+        result[destination] = axis[k * chunk : (k + 1) * chunk][source]
+    np.testing.assert_equal(result, axis[sl])
+
+
+def test_chunk_cache_evicts_least_recently_used():
+    cache = ChunkCache(max_bytes=3 * 8)
+    for i in range(3):
+        cache.put(i, np.full(1, i, dtype=np.float64))
+    assert cache.get(0)[0] == 0
+    cache.put(3, np.zeros(1, dtype=np.float64))
+
+    assert cache.get(1) is None
+    assert list(cache.chunks) == [2, 0, 3]
+    assert cache.nbytes == 3 * 8
+    assert not cache.get(3).flags.writeable
+
+    # Chunks larger than the cache are not kept.
+    cache.put(4, np.zeros(4, dtype=np.float64))
+    assert cache.get(4) is None
+
+
+def test_read_region():
+    from navigate.model.data_sources.bdv_data_source import BigDataViewerDataSource
+
+    ds = bdv_ds("test.h5", True, True, True, False, (1024, 2048))
+    file_name = ds.file_name
+    ds.close()
+
+    ds = BigDataViewerDataSource(file_name, "r")
+    expected = np.empty(
+        (ds.positions, ds.shape_t, ds.shape_z, ds.shape_c, ds.shape_y, ds.shape_x),
+        dtype=ds.dtype,
+    )
+    with h5py.File(file_name, "r") as f:
+        for p in range(ds.positions):
+            for t in range(ds.shape_t):
+                for c in range(ds.shape_c):
+                    name = ds.ds_name(t, c, p).replace("???", "0")
+                    expected[p, t, :, c] = f[name][:]
+
+    try:
+        np.testing.assert_equal(ds[:, :, :, :, :, :], expected)
+        assert ds.chunk_cache.nbytes > 0
+
+        # Served from the chunk cache, nothing new is read from disk.
+        with patch.object(ds.chunk_cache, "put") as put:
+            np.testing.assert_equal(
+                ds[::-5, 1000:7:-3, 1:3, :, 0, :],
+                expected[:, :1, :, 1:3, 1000:7:-3, ::-5],
+            )
+        put.assert_not_called()
+
+        out = np.zeros((ds.shape_z, 64, 32), dtype=ds.dtype)
+        result = ds.read_region(
+            (slice(100, 132), slice(200, 264), 2, slice(None), 0, 1), out=out
+        )
+        assert result is out
+        np.testing.assert_equal(out, expected[1, 0, :, 2, 200:264, 100:132])
+
+        with pytest.raises(ValueError):
+            ds.read_region((slice(100, 132), 0), out=out)
+    finally:
+        close_bdv_ds(ds, file_name)
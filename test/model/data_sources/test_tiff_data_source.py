@@ -106,3 +106,50 @@ def test_tiff_write_read(is_ome, multiposition, per_stack, z_stack, stop_early):
         raise e
     finally:
         delete_folder("test_save_dir")
+
+
+def test_tiff_lazy_read(tmp_path):
+    from unittest.mock import patch
+
+    import numpy as np
+    import tifffile
+
+    from navigate.model.data_sources.tiff_data_source import TiffDataSource
+
+    data = (np.random.rand(4, 32, 48) * 2**16).astype(np.uint16)
+    file_name = str(tmp_path / "stack.tif")
+    with tifffile.TiffWriter(file_name) as tif:
+        for plane in data:
+            tif.write(plane, metadata={"axes": "ZYX"}, contiguous=True)
+
+    # Shapes come from the series metadata without decoding any pixels.
+    with patch.object(tifffile.TiffFile, "asarray", side_effect=AssertionError):
+        ds = TiffDataSource(file_name, "r")
+        assert (ds.shape_x, ds.shape_y, ds.shape_z) == (48, 32, 4)
+        assert isinstance(ds.data, np.memmap)
+        np.testing.assert_equal(ds[:, :, 0, :], data)
+        np.testing.assert_equal(ds[2:10, 5:7, 0, 1:3], data[1:3, 5:7, 2:10])
+        np.testing.assert_equal(ds[:, :, 0, 2], data[2:3])
+    with pytest.raises(IndexError):
+        ds.get_slice(slice(None), slice(None), c=1)
+    ds.close()
+
+
+def test_tiff_lazy_read_compressed(tmp_path):
+    import numpy as np
+    import tifffile
+
+    from navigate.model.data_sources.tiff_data_source import TiffDataSource
+
+    data = (np.random.rand(2, 3, 2, 16, 24) * 2**16).astype(np.uint16)
+    file_name = str(tmp_path / "compressed.tif")
+    tifffile.imwrite(file_name, data, metadata={"axes": "TZCYX"}, compression="zlib")
+
+    ds = TiffDataSource(file_name, "r")
+    assert ds.shape == (24, 16, 2, 3, 2)
+    np.testing.assert_equal(ds.data, data)
+    np.testing.assert_equal(ds[:, :, 1, :, 1], data[1, :, 1])
+    sliced = ds[4:8, :, :, 0, :]
+    assert sliced.shape == (1, 2, 1, 2, 16, 4)
+    np.testing.assert_equal(sliced[0, :, 0], data[:, 0, :, :, 4:8])
+    ds.close()
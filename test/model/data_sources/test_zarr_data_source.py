@@ -124,3 +124,62 @@ def test_zarr_write(multiposition, per_stack, z_stack, stop_early, size):
     close_zarr_ds(ds, file_name=file_name)
 
     assert True
+
+
+@pytest.mark.parametrize("per_stack", [True, False])
+@pytest.mark.parametrize("z_chunks", [None, 1, [2, 3, 4, 5]])
+def test_zarr_chunked_compressed_write(per_stack, z_chunks):
+    from test.model.dummy import DummyModel
+    from navigate.model.data_sources.zarr_data_source import OMEZarrDataSource
+
+    fn = "test_chunks.zarr"
+
+    model = DummyModel()
+    microscope_name = model.configuration["experiment"]["MicroscopeState"][
+        "microscope_name"
+    ]
+    camera_parameters = model.configuration["experiment"]["CameraParameters"][
+        microscope_name
+    ]
+    camera_parameters["img_x_pixels"] = 256
+    camera_parameters["img_y_pixels"] = 128
+    state = model.configuration["experiment"]["MicroscopeState"]
+    state["image_mode"] = "z-stack"
+    state["number_z_steps"] = 5
+    state["is_multiposition"] = False
+    state["timepoints"] = 1
+    state["stack_cycling_mode"] = "per_stack" if per_stack else "per_slice"
+    model.configuration["experiment"]["Saving"]["compression"] = "zstd"
+    model.configuration["experiment"]["Saving"]["compression_level"] = 3
+
+    ds = OMEZarrDataSource(fn)
+    ds.set_metadata_from_configuration_experiment(model.configuration)
+    ds.set_z_chunks(z_chunks)
+    assert ds.compressor.cname == "zstd"
+    assert np.all(ds.chunk_depths <= ds.shapes[:, 0])
+
+    n_images = ds.shape_c * ds.shape_z * ds.shape_t * ds.positions
+    data = (np.random.rand(n_images, ds.shape_y, ds.shape_x) * 2**16).astype(
+        "uint16"
+    )
+    indices = []
+    for i in range(n_images):
+        indices.append(ds._cztp_indices(i, ds.metadata.per_stack))
+        ds.write(data[i], x=0, y=0, z=0, theta=0, f=0)
+    ds.close()
+
+    assert ds.image["p0_0"].chunks[2] == ds.chunk_depths[0]
+    for i, (c, z, t, _) in enumerate(indices):
+        np.testing.assert_array_equal(ds.image["p0_0"][t, c, z], data[i])
+
+    # Shapes are parsed back from the arrays when reading
+    shape, shapes = ds.shape, ds.shapes
+    ds = OMEZarrDataSource(fn, "r")
+    assert ds.shape == shape
+    np.testing.assert_array_equal(ds.shapes, shapes)
+    for i, (c, z, t, _) in enumerate(indices):
+        np.testing.assert_array_equal(ds[:, :, c, z, t, 0][0], data[i])
+
+    del model.configuration["experiment"]["Saving"]["compression"]
+    del model.configuration["experiment"]["Saving"]["compression_level"]
+    close_zarr_ds(ds, file_name=fn)
@@ -163,6 +163,7 @@ class TestSyntheticCamera:
         ]
 
         self.synthetic_camera.initialize_image_series(data_buffer, number_of_frames)
+        self.synthetic_camera.frame_interval = 0
 
         assert self.synthetic_camera.is_acquiring is True, "should be acquring"
 
@@ -183,6 +184,7 @@ class TestSyntheticCamera:
         assert (
             self.synthetic_camera.is_acquiring is False
         ), "is_acquiring should be False"
+        self.synthetic_camera.frame_interval = None
 
     def test_synthetic_camera_set_roi(self):
         self.synthetic_camera.set_ROI()
@@ -191,3 +193,64 @@ class TestSyntheticCamera:
         self.synthetic_camera.set_ROI(roi_height=500, roi_width=700)
         assert self.synthetic_camera.x_pixels == 700
         assert self.synthetic_camera.y_pixels == 500
+
+    def test_synthetic_camera_noise_pool(self):
+        from navigate.model.devices.camera.synthetic import NOISE_POOL_SIZE
+
+        self.synthetic_camera.set_ROI(roi_height=64, roi_width=32)
+        data_buffer = [np.zeros((64, 32), dtype=np.uint16) for _ in range(4)]
+        self.synthetic_camera.initialize_image_series(data_buffer, 4)
+        self.synthetic_camera.frame_interval = 0
+        assert self.synthetic_camera.noise_pool.shape == (NOISE_POOL_SIZE, 64, 32)
+
+        for _ in range(4):
+            self.synthetic_camera.generate_new_frame()
+        for frame in data_buffer:
+            assert any(
+                np.array_equal(frame, noise)
+                for noise in self.synthetic_camera.noise_pool
+            )
+        self.synthetic_camera.close_image_series()
+        self.synthetic_camera.frame_interval = None
+
+    def test_synthetic_camera_replay(self, tmp_path):
+        import tifffile
+
+        self.synthetic_camera.set_ROI(roi_height=64, roi_width=32)
+        stack = np.arange(3 * 64 * 32, dtype=np.uint16).reshape(3, 64, 32)
+        tifffile.imwrite(tmp_path / "stack.tif", stack, photometric="minisblack")
+        plane = np.full((128, 16), 7, dtype=np.uint16)
+
+        data_buffer = [np.zeros((64, 32), dtype=np.uint16) for _ in range(10)]
+        self.synthetic_camera.initialize_image_series(data_buffer, 10)
+        self.synthetic_camera.frame_interval = 0
+        self.synthetic_camera.load_images([str(tmp_path / "stack.tif")])
+        assert self.synthetic_camera.random_image is False
+        for _ in range(5):
+            self.synthetic_camera.generate_new_frame()
+        # Frames are replayed in order, then in a loop
+        for i, frame in enumerate(data_buffer[:5]):
+            np.testing.assert_array_equal(frame, stack[i % 3])
+
+        # Frames that don't match the camera are cropped or padded
+        self.synthetic_camera.load_images(ds=[plane])
+        self.synthetic_camera.generate_new_frame()
+        np.testing.assert_array_equal(data_buffer[5][:, :16], 7)
+        np.testing.assert_array_equal(data_buffer[5][:, 16:], 0)
+
+        self.synthetic_camera.load_images(None)
+        assert self.synthetic_camera.random_image is True
+        assert self.synthetic_camera.replay is None
+        self.synthetic_camera.close_image_series()
+        self.synthetic_camera.frame_interval = None
+
+    def test_synthetic_camera_frame_interval(self):
+        import time
+
+        self.synthetic_camera.frame_interval = 0.05
+        self.synthetic_camera._next_frame_time = None
+        start = time.perf_counter()
+        for _ in range(5):
+            self.synthetic_camera.wait_for_next_frame()
+        assert time.perf_counter() - start >= 0.2
+        self.synthetic_camera.frame_interval = None
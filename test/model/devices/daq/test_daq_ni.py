@@ -76,3 +76,79 @@ def test_daq_ni_functions():
             getattr(daq, f)(*a)
         else:
             getattr(daq, f)()
+
+
+def test_daq_ni_reuses_tasks_between_channels():
+    from unittest.mock import patch, MagicMock
+
+    import numpy as np
+
+    from navigate.model.devices.daq.ni import NIDAQ
+    from test.model.dummy import DummyModel
+
+    model = DummyModel()
+    model.configuration["waveform_templates"] = {}
+    microscope_name = model.configuration["experiment"]["MicroscopeState"][
+        "microscope_name"
+    ]
+
+    with patch("navigate.model.devices.daq.ni.nidaqmx.Task") as Task, patch(
+        "navigate.model.devices.daq.ni.get_waveform_template_parameters",
+        return_value=(1, 1),
+    ):
+        Task.side_effect = lambda *args, **kwargs: MagicMock()
+        daq = NIDAQ(model.configuration)
+        daq.enable_microscope(microscope_name)
+        daq.sweep_times = {"channel_1": 0.2, "channel_2": 0.2, "channel_3": 0.3}
+        daq.analog_outputs = {
+            f"Dev1/ao{i}": {
+                "waveform": {
+                    channel_key: np.random.rand(int(daq.sample_rate * sweep_time))
+                    for channel_key, sweep_time in daq.sweep_times.items()
+                }
+            }
+            for i in range(2)
+        }
+
+        # camera, analog output and master trigger tasks
+        daq.prepare_acquisition("channel_1")
+        n_tasks = Task.call_count
+        analog_task = daq.analog_output_tasks["Dev1"]
+        analog_task.write.assert_called_once()
+        waveforms = analog_task.write.call_args[0][0]
+        assert waveforms.shape == (2, int(daq.sample_rate * 0.2))
+        np.testing.assert_array_equal(
+            waveforms[1], daq.analog_outputs["Dev1/ao1"]["waveform"]["channel_1"]
+        )
+
+        # same timing, the tasks are reused and only the waveforms are written
+        daq.prepare_acquisition("channel_2")
+        assert Task.call_count == n_tasks
+        assert daq.analog_output_tasks["Dev1"] is analog_task
+        assert analog_task.write.call_count == 2
+        np.testing.assert_array_equal(
+            analog_task.write.call_args[0][0][0],
+            daq.analog_outputs["Dev1/ao0"]["waveform"]["channel_2"],
+        )
+
+        # switching back writes the same stacked waveforms again
+        daq.prepare_acquisition("channel_1")
+        assert analog_task.write.call_args[0][0] is waveforms
+
+        # a different sweep time needs new camera and analog output tasks
+        daq.prepare_acquisition("channel_3")
+        assert Task.call_count == n_tasks + 2
+        analog_task.close.assert_called_once()
+
+        # new waveforms are stacked again
+        daq.analog_outputs["Dev1/ao0"]["waveform"]["channel_1"] = np.zeros(
+            int(daq.sample_rate * 0.2)
+        )
+        daq.prepare_acquisition("channel_1")
+        written = daq.analog_output_tasks["Dev1"].write.call_args[0][0]
+        assert written is not waveforms
+        assert not written[0].any()
+
+        daq.stop_acquisition()
+        assert daq.analog_output_tasks == {}
+        assert daq.camera_trigger_task is None
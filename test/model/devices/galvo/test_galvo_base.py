@@ -142,3 +142,27 @@ class TestGalvoBase(unittest.TestCase):
         for channel in "channel_1", "channel_2", "channel_3":
             assert np.all(result[channel] <= self.galvo.galvo_max_voltage)
             assert np.all(result[channel] >= self.galvo.galvo_min_voltage)
+
+    def test_halfsaw_waveform(self):
+        self.galvo.galvo_waveform = "sawtooth"
+        sawtooth = {
+            k: np.array(v)
+            for k, v in self.galvo.adjust(self.exposure_times, self.sweep_times).items()
+        }
+
+        self.galvo.galvo_waveform = "halfsaw"
+        result = self.galvo.adjust(self.exposure_times, self.sweep_times)
+        for channel in "channel_1", "channel_2", "channel_3":
+            wave = result[channel]
+            assert wave is not None
+            # The ramp is held at a constant value until its peak
+            half_samples = sawtooth[channel].argmax()
+            assert half_samples > 1
+            assert np.all(wave[:half_samples] == wave[0])
+            assert not np.array_equal(wave, sawtooth[channel])
+
+        # The cached sawtooth is not modified
+        self.galvo.galvo_waveform = "sawtooth"
+        result = self.galvo.adjust(self.exposure_times, self.sweep_times)
+        for channel in "channel_1", "channel_2", "channel_3":
+            np.testing.assert_array_equal(result[channel], sawtooth[channel])
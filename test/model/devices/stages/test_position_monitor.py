@@ -0,0 +1,119 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only (subject to the
+# limitations in the disclaimer below) provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+# Standard Library Imports
+import threading
+from unittest.mock import MagicMock
+
+# Third Party Imports
+
+# Local Imports
+from navigate.model.devices.stages.position_monitor import StagePositionMonitor
+
+
+def make_stage(positions):
+    stage = MagicMock()
+    stage.report_position.side_effect = lambda: dict(positions)
+    return stage
+
+
+def test_position_is_cached():
+    positions = {"x_pos": 1, "y_pos": 2}
+    stage = make_stage(positions)
+    f_stage = make_stage({"f_pos": 3})
+    monitor = StagePositionMonitor("XYF", [stage, f_stage])
+
+    assert monitor.get_position() == {"x_pos": 1, "y_pos": 2, "f_pos": 3}
+    assert monitor.get_position() == {"x_pos": 1, "y_pos": 2, "f_pos": 3}
+    assert stage.report_position.call_count == 1
+
+    positions["x_pos"] = 10
+    assert monitor.get_position()["x_pos"] == 1
+    monitor.invalidate()
+    assert monitor.get_position()["x_pos"] == 10
+    assert stage.report_position.call_count == 2
+
+    # polling isn't started without a poll interval
+    monitor.start()
+    assert monitor.is_polling is False
+
+
+def test_position_is_polled():
+    positions = {"x_pos": 1}
+    stage = make_stage(positions)
+    changed = threading.Event()
+    published = []
+
+    def callback(new_positions):
+        published.append(new_positions)
+        changed.set()
+
+    monitor = StagePositionMonitor("X", [stage], 0.01, callback)
+    monitor.start()
+    try:
+        assert monitor.is_polling is True
+        assert changed.wait(5)
+        assert published[-1] == {"x_pos": 1}
+
+        # polled positions are returned without asking the stage
+        monitor.invalidate()
+        changed.clear()
+        positions["x_pos"] = 2
+        assert changed.wait(5)
+        call_count = stage.report_position.call_count
+        monitor.stop()
+        assert monitor.get_position() == {"x_pos": 2}
+        assert stage.report_position.call_count == call_count
+    finally:
+        monitor.stop()
+    assert monitor.is_polling is False
+
+
+def test_polling_survives_errors():
+    stage = make_stage({"x_pos": 1})
+    polled = threading.Event()
+
+    def report_position():
+        if stage.report_position.call_count < 3:
+            raise RuntimeError("serial timeout")
+        polled.set()
+        return {"x_pos": 1}
+
+    stage.report_position.side_effect = report_position
+    monitor = StagePositionMonitor("X", [stage], 0.01)
+    monitor.start()
+    try:
+        assert polled.wait(5)
+    finally:
+        monitor.stop()
+    assert monitor.positions == {"x_pos": 1}
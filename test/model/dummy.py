@@ -45,6 +45,7 @@ from navigate.config.config import (
     verify_experiment_config,
     verify_waveform_constants,
     verify_configuration,
+    ConfigurationSnapshot,
 )
 from navigate.model.devices.camera.synthetic import (
     SyntheticCamera,
@@ -205,6 +206,9 @@ class DummyModel:
         verify_experiment_config(self.manager, self.configuration)
         verify_waveform_constants(self.manager, self.configuration)
 
+        #: ConfigurationSnapshot: Local copy of the configuration.
+        self.configuration_snapshot = ConfigurationSnapshot(self.configuration)
+
         #: DummyDevice: The device.
         self.device = DummyDevice()
         #: Pipe: The pipe for sending signals.
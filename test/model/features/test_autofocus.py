@@ -31,13 +31,14 @@
 
 # Standard library imports
 import unittest
+from unittest.mock import MagicMock
 
 # Third party imports
 import numpy as np
 
 # Local imports
 from navigate.model.features.autofocus import power_tent
-from navigate.model.features.autofocus import Autofocus
+from navigate.model.features.autofocus import Autofocus, FocusSearch
 from test.model.dummy import DummyModel
 
 
@@ -129,6 +130,90 @@ class TestAutofocusClass(unittest.TestCase):
         self.assertEqual(steps, 6)  # Expected number of steps
         self.assertEqual(pos_offset, 8.0)  # Expected position offset
 
+    def test_adaptive_search(self):
+        settings = {
+            "coarse_selected": True,
+            "coarse_range": 500.0,
+            "coarse_step_size": 50.0,
+            "fine_selected": True,
+            "fine_range": 50.0,
+            "fine_step_size": 5.0,
+            "adaptive_search": True,
+        }
+        model = self.autofocus.model
+        model.configuration = {
+            "experiment": {
+                "AutoFocusParameters": {"Mesoscale": {"stage": {"f": settings}}},
+                "StageParameters": {"f": 1000.0},
+            }
+        }
+        model.move_stage = MagicMock()
+        model.logger = MagicMock()
+        max_frames = self.autofocus.get_autofocus_frame_num()
+        assert max_frames < 11 + 11
+
+        # stand in for the data thread, which scores every frame
+        self.autofocus.pre_func_signal()
+        frames = 0
+        while not self.autofocus.end_func_signal():
+            focus = self.autofocus.in_func_signal()
+            if not self.autofocus.autofocus_frame_queue.empty():
+                _, frame_num, position = self.autofocus.autofocus_frame_queue.get()
+                assert frame_num == 1
+                self.autofocus.autofocus_pos_queue.put(
+                    np.exp(-((position - 1087.0) ** 2) / (2 * 120.0**2))
+                )
+                frames += 1
+
+        assert frames <= max_frames
+        assert self.autofocus.total_frame_num == frames
+        assert abs(focus - 1087.0) <= 5.0
+        assert self.autofocus.focus_pos == focus
+        model.move_stage.assert_called_with({"f_abs": focus}, wait_until_done=True)
+
+
+class TestFocusSearch(unittest.TestCase):
+    @staticmethod
+    def run_search(search, score):
+        position = search.next_position()
+        while position is not None:
+            search.add_measurement(position, score(position))
+            position = search.next_position()
+        return search.best_position()
+
+    def test_refines_the_peak(self):
+        def score(x):
+            return power_tent(x, 13.7, 0.0, 1.0, 0.02, 0.5)
+
+        search = FocusSearch(0.0, 100.0, 10.0, 1.0)
+        assert len(search.coarse_positions) == 11
+        best = self.run_search(search, score)
+
+        assert abs(best - 13.7) <= 1.0
+        # the fixed sweep takes 11 coarse and 21 fine frames
+        assert len(search.measurements) <= search.max_measurements
+        assert len(search.measurements) < 32 / 2
+
+    def test_stops_the_coarse_pass_past_the_peak(self):
+        def score(x):
+            return np.exp(-((x + 40.0) ** 2) / 200.0)
+
+        search = FocusSearch(0.0, 100.0, 10.0, 10.0)
+        best = self.run_search(search, score)
+
+        assert best == -40.0
+        assert [m[0] for m in search.measurements] == [-50, -40, -30, -20]
+
+    def test_parabola(self):
+        search = FocusSearch(0.0, 20.0, 10.0, 1.0)
+        for x in search.coarse_positions:
+            search.add_measurement(x, -((x - 2.0) ** 2))
+        # the vertex of an exact parabola is found in one step
+        assert search.next_position() == 2.0
+        search.add_measurement(2.0, 0.0)
+        assert search.bracket == [0.0, 2.0, 10.0]
+        assert search.best_position() == 2.0
+
 
 if __name__ == "__main__":
     unittest.main()
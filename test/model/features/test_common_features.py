@@ -95,6 +95,8 @@ class TestZStack:
         is_multiposition = self.config["is_multiposition"]
         if is_multiposition:
             positions = self.model.configuration["experiment"]["MultiPositions"]
+            # positions are visited in the planned order
+            positions = [positions[i] for i in self.config["multiposition_order"]]
         else:
             pos_dict = self.model.configuration["experiment"]["StageParameters"]
             positions = [
@@ -486,3 +488,25 @@ class TestZStack:
         self.z_stack_verification()
 
         self.config["is_multiposition"] = False
+
+    @pytest.mark.parametrize("route", ["Serpentine", "Shortest Path"])
+    def test_multi_position_route(self, route):
+        self.config["is_multiposition"] = True
+        self.config["multiposition_route"] = route
+        self.model.configuration["configuration"]["microscopes"][
+            self.config["microscope_name"]
+        ]["stage"]["has_ni_galvo_stage"] = False
+
+        self.config["stack_cycling_mode"] = "per_stack"
+        self.config["selected_channels"] = 1
+        self.config["channels"]["channel_1"]["is_selected"] = True
+        self.config["channels"]["channel_2"]["is_selected"] = False
+        self.config["channels"]["channel_3"]["is_selected"] = False
+        self.model.start(self.feature_list)
+
+        positions = self.model.configuration["experiment"]["MultiPositions"]
+        assert sorted(self.config["multiposition_order"]) == list(range(len(positions)))
+        self.z_stack_verification()
+
+        self.config["is_multiposition"] = False
+        self.config["multiposition_route"] = "Table Order"
@@ -1,4 +1,8 @@
 import os
+import threading
+import time
+from unittest.mock import MagicMock
+
 import pytest
 
 from navigate.tools.file_functions import delete_folder
@@ -46,3 +50,106 @@ def test_image_write(image_writer):
     assert ls
 
     delete_folder("test_save_dir")
+
+
+def test_image_write_behind(dummy_model):
+    from numpy.random import rand
+    from navigate.model.features.image_writer import ImageWriter
+
+    dummy_model.configuration["experiment"]["Saving"][
+        "save_directory"
+    ] = "test_save_dir"
+    for i in range(dummy_model.data_buffer.shape[0]):
+        dummy_model.data_buffer[i, ...] = rand(
+            dummy_model.img_width, dummy_model.img_height
+        )
+
+    writer = ImageWriter(dummy_model, write_behind=True, queue_size=1)
+    assert writer.writer_thread.is_alive()
+
+    writer.save_image(list(range(dummy_model.number_of_frames)))
+    writer.close()
+
+    assert writer.writer_thread is None
+    assert writer.frame_queue.empty()
+    assert writer.data_source._current_frame == dummy_model.number_of_frames
+    assert not writer.write_failed
+
+    # closing again should be harmless
+    writer.close()
+
+    ls = os.listdir("test_save_dir")
+    ls.remove("MIP")
+    assert ls
+
+    delete_folder("test_save_dir")
+
+
+def test_image_write_behind_overrun(dummy_model):
+    from navigate.model.features.image_writer import ImageWriter
+
+    dummy_model.configuration["experiment"]["Saving"][
+        "save_directory"
+    ] = "test_save_dir"
+    writer = ImageWriter(dummy_model, write_behind=True, queue_size=1)
+
+    # hold the writer until the data thread has run into the full queue
+    release = threading.Event()
+    written = []
+
+    def slow_write_frame(idx):
+        release.wait()
+        written.append(idx)
+        return True
+
+    writer.write_frame = slow_write_frame
+    data_thread = threading.Thread(target=writer.save_image, args=([0, 1, 2],))
+    data_thread.start()
+
+    deadline = time.time() + 5
+    while writer.overrun_count == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert writer.overrun_count > 0
+    # the data thread is blocked by the full queue
+    assert data_thread.is_alive()
+
+    release.set()
+    data_thread.join(timeout=5)
+    assert not data_thread.is_alive()
+    writer.close()
+
+    assert written == [0, 1, 2]
+    delete_folder("test_save_dir")
+
+
+@pytest.mark.parametrize("failure", ["data_source", "write_frame"])
+def test_image_write_behind_failure(dummy_model, monkeypatch, failure):
+    from navigate.model.features.image_writer import ImageWriter
+
+    monkeypatch.setattr(dummy_model, "event_queue", MagicMock(), raising=False)
+    monkeypatch.setattr(dummy_model, "stop_acquisition", False, raising=False)
+    dummy_model.configuration["experiment"]["Saving"][
+        "save_directory"
+    ] = "test_save_dir"
+    writer = ImageWriter(dummy_model, write_behind=True, queue_size=1)
+    if failure == "data_source":
+        writer.data_source.write = MagicMock(side_effect=OSError("disk full"))
+    else:
+        # errors outside of the write call must not kill the writer thread
+        writer.write_frame = MagicMock(side_effect=RuntimeError("bad frame"))
+
+    writer.save_image(list(range(dummy_model.number_of_frames)))
+
+    # close must not deadlock on the stop signal
+    close_thread = threading.Thread(target=writer.close)
+    close_thread.start()
+    close_thread.join(timeout=5)
+    assert not close_thread.is_alive()
+
+    assert writer.write_failed
+    assert dummy_model.stop_acquisition
+    event, _ = dummy_model.event_queue.put.call_args[0][0]
+    assert event == "warning"
+    assert writer.frame_queue.empty()
+
+    delete_folder("test_save_dir")
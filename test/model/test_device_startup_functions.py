@@ -30,6 +30,8 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 # Standard library imports
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
 
@@ -38,6 +40,11 @@ from unittest.mock import MagicMock
 # Local application imports
 from navigate.model.device_startup_functions import auto_redial
 from navigate.model.device_startup_functions import load_camera_connection
+from navigate.model.device_startup_functions import (
+    format_startup_report,
+    get_startup_dependencies,
+    start_devices_concurrently,
+)
 from navigate.model.devices.camera.synthetic import SyntheticCameraController
 
 
@@ -124,3 +131,75 @@ class TestLoadCameraConnection(unittest.TestCase):
     #     camera = load_camera_connection(configuration=self.configuration,
     #                                     camera_id=1)
     #     self.assertTrue(isinstance(camera, HamamatsuController))
+
+
+class TestStartDevicesConcurrently(unittest.TestCase):
+    """Test the concurrent device startup."""
+
+    def test_dependencies(self):
+        """Tasks sharing a resource depend on the previous one."""
+        dependencies = get_startup_dependencies(
+            {"daq": "daq", "camera": None, "stage": "daq", "filter": "COM1", "f": "daq"}
+        )
+        self.assertEqual(
+            dependencies,
+            {"daq": [], "camera": [], "stage": ["daq"], "filter": [], "f": ["stage"]},
+        )
+
+    def test_independent_tasks_run_concurrently(self):
+        """Independent tasks start at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        tasks = {name: (lambda name=name: (barrier.wait(), name)[1]) for name in "abc"}
+        results, timings = start_devices_concurrently(tasks)
+        self.assertEqual(results, {"a": "a", "b": "b", "c": "c"})
+        self.assertEqual(set(timings), {"a", "b", "c"})
+
+    def test_tasks_wait_for_dependencies(self):
+        """A task only starts once its dependencies have finished."""
+        finished = []
+
+        def task(name):
+            time.sleep(0.01)
+            finished.append(name)
+            return list(finished)
+
+        tasks = {name: (lambda name=name: task(name)) for name in ["daq", "stage"]}
+        results, _ = start_devices_concurrently(tasks, {"stage": ["daq"]})
+        self.assertEqual(results["stage"], ["daq", "stage"])
+
+    def test_failure(self):
+        """Errors are raised after the running tasks, and no new task starts."""
+        started = []
+
+        def fail():
+            raise RuntimeError("no device")
+
+        def slow():
+            time.sleep(0.05)
+            started.append("slow")
+
+        tasks = {
+            "fail": fail,
+            "slow": slow,
+            "dependent": lambda: started.append("dependent"),
+        }
+        with self.assertRaises(RuntimeError):
+            start_devices_concurrently(tasks, {"dependent": ["fail"]})
+        self.assertEqual(started, ["slow"])
+
+    def test_circular_dependencies(self):
+        """Circular dependencies are reported instead of hanging."""
+        tasks = {"a": lambda: 1, "b": lambda: 2}
+        with self.assertRaises(ValueError):
+            start_devices_concurrently(tasks, {"a": ["b"], "b": ["a"]})
+        with self.assertRaises(ValueError):
+            start_devices_concurrently(tasks, {"a": ["c"]})
+
+    def test_report(self):
+        """The report lists the slowest device first."""
+        report = format_startup_report({"camera": 0.5, "stage": 2.0}, 2.1)
+        lines = report.splitlines()
+        self.assertIn("2.100 s", lines[0])
+        self.assertIn("2.500 s", lines[0])
+        self.assertTrue(lines[1].strip().startswith("stage"))
+        self.assertTrue(lines[2].strip().startswith("camera"))
@@ -102,6 +102,126 @@ def test_get_stage_position(dummy_microscope):
     assert dummy_microscope.ask_stage_for_position is False
 
 
+def test_stage_position_monitors(dummy_microscope):
+    from unittest.mock import patch
+
+    pos_dict = {"x_abs": 10, "y_abs": 20, "f_abs": 30}
+    dummy_microscope.move_stage(pos_dict, wait_until_done=True)
+    assert dummy_microscope.get_stage_position()["x_pos"] == 10
+
+    # waited moves refresh the position monitors, so the stages aren't asked
+    # for their position again
+    dummy_microscope.move_stage({"x_abs": 15}, wait_until_done=True)
+    stage = dummy_microscope.stages["x"]
+    with patch.object(stage, "report_position") as report_position:
+        assert dummy_microscope.get_stage_position()["x_pos"] == 15
+        report_position.assert_not_called()
+
+    # the stages are asked for their position after a move that isn't waited for
+    dummy_microscope.move_stage({"x_abs": 20}, wait_until_done=False)
+    with patch.object(
+        stage, "report_position", wraps=stage.report_position
+    ) as report_position:
+        assert dummy_microscope.get_stage_position()["x_pos"] == 20
+        report_position.assert_called_once()
+        dummy_microscope.get_stage_position(refresh=True)
+        assert report_position.call_count == 2
+
+    # polled positions are read from the cache
+    monitor = dummy_microscope.stage_monitors[dummy_microscope.info["stage_x"]]
+    monitor.poll_interval = 0.01
+    try:
+        dummy_microscope.start_stage_monitors()
+        assert monitor.is_polling is True
+        dummy_microscope.move_stage({"x_abs": 25}, wait_until_done=True)
+        assert dummy_microscope.get_stage_position()["x_pos"] == 25
+    finally:
+        dummy_microscope.stop_stage_monitors()
+        monitor.poll_interval = 0
+    assert monitor.is_polling is False
+
+
+def test_move_stage_concurrently(dummy_microscope):
+    import threading
+    import time
+    from unittest.mock import MagicMock
+
+    saved = (
+        dummy_microscope.stages_list,
+        dummy_microscope.stage_connections,
+        dummy_microscope.stage_move_timeouts,
+    )
+
+    def make_stage(connection, move, timeout=5):
+        stage = MagicMock()
+        stage.move_absolute.side_effect = move
+        dummy_microscope.stage_connections[stage] = connection
+        dummy_microscope.stage_move_timeouts[stage] = timeout
+        return stage
+
+    try:
+        dummy_microscope.stage_connections = {}
+        dummy_microscope.stage_move_timeouts = {}
+        pos_dict = {"x_abs": 1, "y_abs": 2, "z_abs": 3, "f_abs": 4}
+
+        # stages on different connections move at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def move(pos, wait_until_done):
+            barrier.wait()
+            return True
+
+        xy_stage = make_stage("XY", move)
+        f_stage = make_stage("F", move)
+        dummy_microscope.stages_list = [(xy_stage, ["x", "y"]), (f_stage, ["z", "f"])]
+        assert dummy_microscope.move_stage(pos_dict, wait_until_done=True) is True
+        xy_stage.move_absolute.assert_called_once_with({"x_abs": 1, "y_abs": 2}, True)
+        f_stage.move_absolute.assert_called_once_with({"z_abs": 3, "f_abs": 4}, True)
+
+        # stages on the same connection move one after the other
+        moving = []
+
+        def move(pos, wait_until_done):
+            moving.append(pos)
+            assert len(moving) == 1
+            time.sleep(0.01)
+            moving.pop()
+            return True
+
+        dummy_microscope.stages_list = [
+            (make_stage("XYZ", move), ["x", "y"]),
+            (make_stage("XYZ", move), ["z"]),
+            (make_stage("F", lambda pos, wait_until_done: True), ["f"]),
+        ]
+        assert dummy_microscope.move_stage(pos_dict, wait_until_done=True) is True
+
+        # a stage that doesn't finish in time fails the move
+        dummy_microscope.stages_list = [
+            (make_stage("XY", lambda *args: time.sleep(0.5) or True, 0.05), ["x"]),
+            (make_stage("F", lambda pos, wait_until_done: True), ["f"]),
+        ]
+        assert dummy_microscope.move_stage(pos_dict, wait_until_done=True) is False
+
+        # errors are raised after the other stages finished moving
+        def fail(pos, wait_until_done):
+            raise ValueError("stage error")
+
+        f_stage = make_stage("F", lambda pos, wait_until_done: True)
+        dummy_microscope.stages_list = [
+            (make_stage("XY", fail), ["x"]),
+            (f_stage, ["f"]),
+        ]
+        with pytest.raises(RuntimeError, match="stage error"):
+            dummy_microscope.move_stage(pos_dict, wait_until_done=True)
+        f_stage.move_absolute.assert_called_once()
+    finally:
+        (
+            dummy_microscope.stages_list,
+            dummy_microscope.stage_connections,
+            dummy_microscope.stage_move_timeouts,
+        ) = saved
+
+
 def test_prepare_next_channel(dummy_microscope):
     dummy_microscope.prepare_acquisition()
 
@@ -122,6 +122,62 @@ def test_single_acquisition(model):
     model.data_thread.join()
     model.release_pipe("show_img_pipe")
 
+    assert model.frame_report["acquired_frames"] == n_frames
+    assert model.frame_report["dropped_frames"] == 0
+    assert model.frame_report["buffer_size"] == model.number_of_frames
+
+
+def test_frame_sequence_overrun(model):
+    model.frame_report = {
+        "acquired_frames": 0,
+        "dropped_frames": 0,
+        "overrun_events": 0,
+        "max_backlog": 0,
+        "buffer_size": model.number_of_frames,
+        "next_sequence_number": 0,
+    }
+    n = model.number_of_frames
+    model.data_buffer_frame_numbers[:] = -1
+
+    # the first three frames are delivered in order
+    model.data_buffer_frame_numbers[:3] = [0, 1, 2]
+    model.frame_sequence_number = 3
+    model.check_frame_sequence([0, 1, 2])
+    assert model.frame_report["dropped_frames"] == 0
+
+    # the ring wraps around before the next delivery, frames 3 to n+2 are
+    # overwritten by frames n+3 to 2n+2
+    for seq in range(3, 2 * n + 3):
+        model.data_buffer_frame_numbers[seq % n] = seq
+    model.frame_sequence_number = 2 * n + 3
+    model.check_frame_sequence([3 % n, 4 % n])
+    assert model.frame_report["dropped_frames"] == n
+    assert model.frame_report["overrun_events"] == 1
+    assert model.frame_report["next_sequence_number"] == n + 5
+    assert model.frame_report["max_backlog"] == n - 2
+    model.data_buffer_frame_numbers[:] = -1
+
+
+def test_get_data_buffer_binning(model, monkeypatch):
+    camera_parameters = model.configuration["experiment"]["CameraParameters"][
+        model.active_microscope_name
+    ]
+    binning = camera_parameters["binning"]
+    update_data_buffer = MagicMock()
+    monkeypatch.setattr(model, "update_data_buffer", update_data_buffer)
+
+    # a binning change is seen even if the old value was read through the
+    # configuration snapshot
+    camera_parameters["binning"] = "1x1"
+    model.configuration_snapshot.get(
+        "experiment", "CameraParameters", model.active_microscope_name
+    )
+    camera_parameters["binning"] = "2x2"
+    model.get_data_buffer(model.img_width, model.img_height)
+    update_data_buffer.assert_called_once_with(model.img_width, model.img_height)
+    camera_parameters["binning"] = binning
+    model.configuration_snapshot.invalidate()
+
 
 def test_live_acquisition(model):
     state = model.configuration["experiment"]["MicroscopeState"]
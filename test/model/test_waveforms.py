@@ -232,3 +232,56 @@ class TestWaveforms(unittest.TestCase):
             sample_rate=sr, sweep_time=st, exposure=ex, camera_delay=cd
         )
         assert np.sum(v > 0) == int(sr * (ex - cd))
+
+    def test_smoothing_matches_convolution(self):
+        ps = 7
+        waveform = np.random.default_rng(0).random(1000)
+        window_length = int(np.ceil(len(waveform) * ps / 100))
+        expected = (
+            np.convolve(
+                np.pad(waveform, window_length, mode="edge"),
+                np.ones(window_length),
+                "valid",
+            )
+            / window_length
+        )
+        np.testing.assert_allclose(waveforms.smooth_waveform(waveform, ps), expected)
+
+    def test_waveforms_are_memoized(self):
+        waveforms.sawtooth.cache_clear()
+        waveform = waveforms.sawtooth(sample_rate=1000, sweep_time=0.2, amplitude=2)
+        assert waveform.dtype == float
+        assert not waveform.flags.writeable
+        with pytest.raises(ValueError):
+            waveform[0] = 0
+
+        same_waveform = waveforms.sawtooth(
+            sample_rate=1000, sweep_time=0.2, amplitude=2
+        )
+        assert same_waveform is waveform
+        assert waveforms.sawtooth.cache_info().hits == 1
+
+        other_waveform = waveforms.sawtooth(
+            sample_rate=1000, sweep_time=0.2, amplitude=3
+        )
+        assert other_waveform is not waveform
+        assert waveforms.sawtooth.cache_info().misses == 2
+
+    def test_smoothing_read_only_waveform_is_memoized(self):
+        waveform = waveforms.remote_focus_ramp(sample_rate=1000)
+        smoothed_waveform = waveforms.smooth_waveform(waveform, 10)
+        assert not smoothed_waveform.flags.writeable
+        assert waveforms.smooth_waveform(waveform, 10) is smoothed_waveform
+
+        writeable_waveform = waveform.copy()
+        assert (
+            waveforms.smooth_waveform(writeable_waveform, 10) is not smoothed_waveform
+        )
+
+    def test_clip_waveform(self):
+        waveform = waveforms.sine_wave(sample_rate=1000, amplitude=2)
+        assert waveforms.clip_waveform(waveform, -3, 3) is waveform
+        clipped_waveform = waveforms.clip_waveform(waveform, -1, 1)
+        assert np.max(clipped_waveform) == 1
+        assert np.min(clipped_waveform) == -1
+        assert np.max(waveform) > 1
@@ -0,0 +1,199 @@
+# Copyright (c) 2021-2024  The University of Texas Southwestern Medical Center.
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted for academic and research use only (subject to the
+# limitations in the disclaimer below) provided that the following conditions are met:
+
+#      * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#      * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+
+#      * Neither the name of the copyright holders nor the names of its
+#      contributors may be used to endorse or promote products derived from this
+#      software without specific prior written permission.
+
+# NO EXPRESS OR IMPLIED LICENSES TO ANY PARTY'S PATENT RIGHTS ARE GRANTED BY
+# THIS LICENSE. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+# PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+# Standard library imports
+import os
+import textwrap
+
+# Third party imports
+import pytest
+
+# Local application imports
+from navigate.model.features import feature_related_functions
+from navigate.model.plugins_model import PluginsModel
+from navigate.plugins.plugin_manager import (
+    LazyModule,
+    PluginFileManager,
+    PluginManifest,
+)
+
+PLUGIN_FILES = {
+    "plugin_config.yml": """
+        name: Lazy Plugin
+        acquisition_modes:
+          - name: Lazy Mode
+            file_name: lazy_mode.py
+    """,
+    "model/features/lazy_feature.py": """
+        IMPORTS.append("feature")
+
+
+        class LazyPluginFeature:
+            pass
+    """,
+    "feature_list.py": """
+        from navigate.tools.decorators import FeatureList
+
+        IMPORTS.append("feature_list")
+
+
+        @FeatureList
+        def lazy_plugin_feature_list():
+            return [{"name": "LazyPluginFeature"}]
+    """,
+    "lazy_mode.py": """
+        from navigate.tools.decorators import AcquisitionMode
+
+        IMPORTS.append("mode")
+
+
+        @AcquisitionMode
+        class LazyMode:
+            def __init__(self, name):
+                self.name = name
+                self.feature_list = []
+    """,
+    "model/devices/lazy_device/device_startup_functions.py": """
+        IMPORTS.append("device")
+
+        DEVICE_TYPE_NAME = "lazy_device"
+        DEVICE_REF_LIST = ["type"]
+
+
+        def load_device(configuration, is_synthetic=False):
+            return "connection"
+
+
+        def start_device(microscope_name, device_connection, *args):
+            return device_connection
+    """,
+}
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    imports = []
+    # plugin modules record their import in IMPORTS
+    monkeypatch.setattr("builtins.IMPORTS", imports, raising=False)
+    plugin_path = tmp_path / "plugins" / "lazy_plugin"
+    for file_name, content in PLUGIN_FILES.items():
+        file_path = plugin_path / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(textwrap.dedent(content))
+    yield plugin_path, imports
+    feature_related_functions.plugin_features.pop("LazyPluginFeature", None)
+    if hasattr(feature_related_functions, "LazyPluginFeature"):
+        delattr(feature_related_functions, "LazyPluginFeature")
+
+
+def load_plugins(tmp_path):
+    model = PluginsModel()
+    model.feature_lists_path = str(tmp_path)
+    plugin_manifest = PluginManifest(str(tmp_path / "plugins_manifest.yml"))
+    plugin_manager = PluginFileManager(
+        str(tmp_path / "plugins"), str(tmp_path / "plugins_config.yml")
+    )
+    model.load_plugins_through_manager(plugin_manager, plugin_manifest)
+    plugin_manifest.save()
+    return model
+
+
+def test_plugins_are_loaded_from_manifest(tmp_path, plugin):
+    plugin_path, imports = plugin
+
+    # the first time, all the plugin modules are imported and listed
+    model = load_plugins(tmp_path)
+    assert sorted(imports) == ["device", "feature", "feature_list", "mode"]
+    assert os.path.exists(tmp_path / "plugins_manifest.yml")
+    manifest = PluginManifest(str(tmp_path / "plugins_manifest.yml"))
+    plugin_manifest = manifest.plugins[str(plugin_path)]
+    assert plugin_manifest["features"] == {"lazy_feature.py": ["LazyPluginFeature"]}
+    assert plugin_manifest["devices"]["lazy_device"]["attributes"] == {
+        "DEVICE_TYPE_NAME": "lazy_device",
+        "DEVICE_REF_LIST": ["type"],
+    }
+    delattr(feature_related_functions, "LazyPluginFeature")
+
+    # then, modules are only imported when they are used
+    imports.clear()
+    model = load_plugins(tmp_path)
+    # acquisition modes are instantiated when they are registered
+    assert imports == ["mode"]
+    assert model.plugin_acquisition_modes["Lazy Mode"].name == "Lazy Mode"
+    assert os.path.exists(tmp_path / "Lazy_Plugin_Feature_List.yml")
+    assert model.devices_dict["lazy_device"]["ref_list"] == ["type"]
+
+    assert "LazyPluginFeature" in dir(feature_related_functions)
+    feature_list = feature_related_functions.convert_str_to_feature_list(
+        '[{"name": LazyPluginFeature}]'
+    )
+    assert feature_list[0]["name"].__name__ == "LazyPluginFeature"
+    assert imports == ["mode", "feature"]
+
+    assert model.devices_dict["lazy_device"]["load_device"]({}) == "connection"
+    assert imports == ["mode", "feature", "device"]
+
+
+def test_manifest_is_updated_when_plugin_changes(tmp_path, plugin):
+    plugin_path, imports = plugin
+    load_plugins(tmp_path)
+    feature_file = plugin_path / "model" / "features" / "lazy_feature.py"
+    feature_file.write_text(
+        feature_file.read_text() + "\n\nclass AnotherLazyPluginFeature:\n    pass\n"
+    )
+    imports.clear()
+    load_plugins(tmp_path)
+    assert "feature" in imports
+    manifest = PluginManifest(str(tmp_path / "plugins_manifest.yml"))
+    assert manifest.plugins[str(plugin_path)]["features"]["lazy_feature.py"] == [
+        "AnotherLazyPluginFeature",
+        "LazyPluginFeature",
+    ]
+    delattr(feature_related_functions, "AnotherLazyPluginFeature")
+
+
+def test_lazy_module():
+    imports = []
+
+    def load_module():
+        imports.append(1)
+        return os
+
+    module = LazyModule(load_module, {"known": 1})
+    assert module.known == 1
+    assert imports == []
+    assert module.path is os.path
+    assert module.sep == os.sep
+    assert imports == [1]
+
+    with pytest.raises(RuntimeError):
+        LazyModule(lambda: None).anything
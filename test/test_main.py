@@ -55,6 +55,7 @@ def get_args():
     args.gui_config_file = False
     args.logging_config = False
     args.synthetic_hardware = True
+    args.profile_startup = False
     return args
 
 
@@ -66,7 +67,7 @@ class TestArgParser(unittest.TestCase):
         parser = create_parser()
 
         # Boolean arguments
-        input_arguments = ["-sh", "--synthetic-hardware"]
+        input_arguments = ["-sh", "--synthetic-hardware", "--profile-startup"]
         for arg in input_arguments:
             parser.parse_args([arg])
 
@@ -100,6 +101,24 @@ class TestMainController(unittest.TestCase):
         main()
         mock_controller.assert_called_once()
 
+    @patch("navigate.main.tk.Tk.mainloop")
+    @patch("navigate.main.Controller")
+    @patch("argparse.ArgumentParser.parse_args")
+    def test_main_profile_startup(
+        self, mock_parse_args, mock_controller, mock_mainloop
+    ):
+        args = get_args()
+        args.profile_startup = True
+        mock_parse_args.return_value = args
+        mock_controller.return_value.model.startup_timings = {"device camera 0": 0.5}
+
+        with patch("builtins.print") as mock_print:
+            main()
+        mock_controller.assert_called_once()
+        report = mock_print.call_args[0][0]
+        assert "controller:" in report
+        assert "model device camera 0: 0.500 s" in report
+
 
 # class TestMainConfigurator(unittest.TestCase):
 #     """ Unit Test for main.py """
@@ -40,7 +40,7 @@ from PIL import Image, ImageFont
 # import pytest
 
 # Local Imports
-from navigate.tools.image import text_array, create_arrow_image
+from navigate.tools.image import text_array, create_arrow_image, binned_histogram
 
 
 class TextArrayTestCase(unittest.TestCase):
@@ -104,5 +104,32 @@ class TestCreateArrowImage(unittest.TestCase):
         assert image == image3
 
 
+class TestBinnedHistogram(unittest.TestCase):
+    def test_integer_image(self):
+        image = np.random.randint(100, 4000, (256, 256)).astype(np.uint16)
+        counts, edges = binned_histogram(image, bins=20, max_samples=image.size)
+
+        assert len(counts) == 20
+        assert len(edges) == 21
+        assert edges[0] == image.min()
+        assert counts.sum() == image.size
+        np.testing.assert_array_equal(counts, np.histogram(image, bins=edges)[0])
+
+    def test_float_image(self):
+        # ten evenly spaced intensities, one per bin
+        image = ((np.arange(10000) % 10 + 0.5) / 10).reshape(100, 100)
+        counts, edges = binned_histogram(image, bins=10)
+
+        np.testing.assert_array_equal(counts, np.full(10, 1000))
+        np.testing.assert_allclose(edges[[0, -1]], [0.05, 0.95])
+
+    def test_subsampled_image(self):
+        image = np.random.randint(0, 2**16, (512, 512)).astype(np.uint16)
+        counts, _ = binned_histogram(image, bins=20, max_samples=2**12)
+
+        # counts are scaled back to the size of the image
+        assert counts.sum() == image.size
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -261,3 +261,46 @@ class UpdateTableTestCase(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+def test_plan_route():
+    from navigate.tools.multipos_table_tools import (
+        ROUTES,
+        compute_tiles_from_bounding_box,
+        plan_route,
+        route_travel_time,
+    )
+
+    # a 5 x 4 grid of tiles
+    tiles = compute_tiles_from_bounding_box(
+        0, 5, 100, 0, 0, 4, 100, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0
+    )
+    table_time = route_travel_time(tiles, range(len(tiles)))
+    for route in ROUTES:
+        order = plan_route(tiles, route)
+        assert sorted(order) == list(range(len(tiles)))
+        assert route_travel_time(tiles, order) <= table_time
+
+    order = plan_route(tiles, "Serpentine")
+    assert order[:10] == [0, 1, 2, 3, 4, 9, 8, 7, 6, 5]
+    assert route_travel_time(tiles, order) == 19 * 100
+
+    # random positions, the shortest path visits each once and starts at the first
+    positions = np.random.default_rng(0).random((50, 5)) * 1000
+    order = plan_route(positions, "Shortest Path")
+    assert order[0] == 0
+    assert sorted(order) == list(range(50))
+    assert route_travel_time(positions, order) < 0.5 * route_travel_time(
+        positions, range(50)
+    )
+
+    # a slow axis is traveled less
+    velocities = [1, 1, 1, 1, 0.01]
+    order = plan_route(positions, "Shortest Path", velocities)
+    assert route_travel_time(positions, order, velocities) <= route_travel_time(
+        positions, plan_route(positions, "Shortest Path"), velocities
+    )
+
+    # short tables and the table order are kept
+    assert plan_route(positions[:2], "Shortest Path") == [0, 1]
+    assert plan_route(positions, "Table Order") == list(range(50))
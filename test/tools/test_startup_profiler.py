@@ -0,0 +1,42 @@
+import sys
+import time
+
+from navigate.tools.startup_profiler import StartupProfiler
+
+
+def test_startup_profiler_times_imports(tmp_path, monkeypatch):
+    (tmp_path / "profiled_parent.py").write_text(
+        "import time\nimport profiled_child\ntime.sleep(0.01)\nVALUE = 1\n"
+    )
+    (tmp_path / "profiled_child.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import profiled_parent
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("profiled_parent", None)
+        sys.modules.pop("profiled_child", None)
+
+    assert profiler not in sys.meta_path
+    assert profiled_parent.VALUE == 1
+    child_self, child_cumulative = profiler.imports["profiled_child"]
+    parent_self, parent_cumulative = profiler.imports["profiled_parent"]
+    assert child_self >= 0.05
+    assert parent_cumulative >= child_cumulative + 0.01
+    # The child import is not counted in the self time of its parent.
+    assert parent_self < child_self
+
+
+def test_startup_profiler_report():
+    profiler = StartupProfiler()
+    with profiler.stage("controller"):
+        time.sleep(0.01)
+    profiler.record("model device camera 0", 0.5)
+
+    assert profiler.stages["controller"] >= 0.01
+    report = profiler.report()
+    assert "controller:" in report
+    assert "model device camera 0: 0.500 s" in report